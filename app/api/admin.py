@@ -0,0 +1,159 @@
+import secrets
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse
+
+from app.core.admission import admission
+from app.core.bulkheads import bulkheads
+from app.core.config import settings
+from app.core.hedging import hedger
+from app.core.loop_monitor import loop_monitor
+from app.core.memory import GROUP_BY, cache_registry, memory_profiler
+from app.core.profiling import profile_store
+from app.core.responses import fast_response
+from app.core.stores import stores_stats
+from app.services.taxonomy_service import taxonomy_service
+
+router = APIRouter()
+
+
+async def require_admin(x_admin_token: Optional[str] = Header(None)):
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(
+            status_code=403,
+            detail={
+                "error": "Forbidden",
+                "details": "Admin endpoints are disabled until ADMIN_TOKEN is configured"
+            }
+        )
+    if not secrets.compare_digest(x_admin_token or "", settings.ADMIN_TOKEN):
+        raise HTTPException(
+            status_code=403,
+            detail={
+                "error": "Forbidden",
+                "details": "A valid X-Admin-Token header is required"
+            }
+        )
+
+
+@router.get("/profiles", dependencies=[Depends(require_admin)])
+async def list_profiles():
+    profiles = profile_store.list()
+    return fast_response({
+        "profiling_enabled": settings.PROFILING_ENABLED,
+        "max_profiles": profile_store.max_profiles,
+        "total": len(profiles),
+        "profiles": profiles
+    })
+
+
+@router.get("/profiles/{name}", dependencies=[Depends(require_admin)])
+async def download_profile(name: str):
+    path = profile_store.path(name)
+    if path is None:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "error": "Profile not found",
+                "details": f"No stored profile named {name}"
+            }
+        )
+    
+    media_type = "application/json" if name.endswith(".json") else "application/octet-stream"
+    return FileResponse(path, media_type=media_type, filename=name)
+
+
+@router.get("/loop", dependencies=[Depends(require_admin)])
+async def loop_stats():
+    return fast_response(loop_monitor.stats())
+
+
+@router.get("/hedging", dependencies=[Depends(require_admin)])
+async def hedging_stats():
+    return fast_response(hedger.stats())
+
+
+@router.get("/bulkheads", dependencies=[Depends(require_admin)])
+async def bulkhead_stats():
+    return fast_response({name: bulkhead.stats() for name, bulkhead in bulkheads.items()})
+
+
+@router.get("/admission", dependencies=[Depends(require_admin)])
+async def admission_stats():
+    return fast_response(admission.stats())
+
+
+@router.get("/stores", dependencies=[Depends(require_admin)])
+async def store_stats():
+    return fast_response(stores_stats())
+
+
+@router.get("/taxonomies", dependencies=[Depends(require_admin)])
+async def taxonomy_stats():
+    return fast_response(taxonomy_service.stats())
+
+
+
+def memory_error(status_code: int, error: str, details: str) -> HTTPException:
+    return HTTPException(status_code=status_code, detail={"error": error, "details": details})
+
+
+@router.get("/memory", dependencies=[Depends(require_admin)])
+async def memory_stats():
+    return fast_response({**memory_profiler.stats(), "caches": cache_registry.sizes()})
+
+
+@router.get("/memory/caches", dependencies=[Depends(require_admin)])
+async def memory_caches():
+    return fast_response(cache_registry.sizes())
+
+
+@router.post("/memory/tracing", dependencies=[Depends(require_admin)])
+async def set_memory_tracing(
+    enabled: bool = Query(..., description="Start or stop tracemalloc"),
+    frames: Optional[int] = Query(default=None, ge=1, le=100, description="Frames stored per allocation")
+):
+    if enabled:
+        memory_profiler.start_tracing(frames)
+    else:
+        memory_profiler.stop_tracing()
+    return fast_response(memory_profiler.stats())
+
+
+@router.post("/memory/snapshots", dependencies=[Depends(require_admin)])
+async def take_memory_snapshot(label: str = Query(default="manual")):
+    if not memory_profiler.tracing:
+        raise memory_error(409, "Memory tracing is off", "Enable it with POST /admin/memory/tracing?enabled=true")
+    entry = await run_in_threadpool(memory_profiler.take_snapshot, label)
+    return fast_response(memory_profiler.describe(entry))
+
+
+@router.post("/memory/baseline", dependencies=[Depends(require_admin)])
+async def set_memory_baseline(snapshot_id: Optional[int] = Query(default=None)):
+    if not memory_profiler.tracing:
+        raise memory_error(409, "Memory tracing is off", "Enable it with POST /admin/memory/tracing?enabled=true")
+    try:
+        entry = await run_in_threadpool(memory_profiler.set_baseline, snapshot_id)
+    except KeyError:
+        raise memory_error(404, "Snapshot not found", f"No stored snapshot with id {snapshot_id}")
+    return fast_response(memory_profiler.describe(entry))
+
+
+@router.get("/memory/diff", dependencies=[Depends(require_admin)])
+async def memory_diff(
+    snapshot_id: Optional[int] = Query(default=None, description="Snapshot to compare; a new one is taken if omitted"),
+    baseline_id: Optional[int] = Query(default=None, description="Snapshot to compare against; defaults to the baseline"),
+    group_by: str = Query(default="area", description="area, module or line"),
+    limit: int = Query(default=20, ge=1, le=500)
+):
+    if group_by not in GROUP_BY:
+        raise memory_error(400, f"Unsupported group_by: {group_by}", f"Supported values: {', '.join(GROUP_BY)}")
+    if not memory_profiler.tracing:
+        raise memory_error(409, "Memory tracing is off", "Enable it with POST /admin/memory/tracing?enabled=true")
+    try:
+        result = await run_in_threadpool(memory_profiler.diff, snapshot_id, baseline_id, group_by, limit)
+    except KeyError as e:
+        raise memory_error(404, "Snapshot not found", f"No stored snapshot or baseline for {e.args[0]}")
+    return fast_response(result)
\ No newline at end of file
@@ -0,0 +1,59 @@
+from fastapi import APIRouter, HTTPException, Query
+from typing import List, Optional
+
+from app.core.responses import fast_response
+
+router = APIRouter()
+
+
+@router.get("/analytics/sales")
+async def sales_aggregation(
+    group_by: str = Query(default="period,currency", description="Comma-separated: period, product, status, currency"),
+    period: str = Query(default="day", pattern="^(day|week|month)$", description="Period bucket size"),
+    after: Optional[str] = Query(default=None, description="Only orders created on or after this date (YYYY-MM-DD)"),
+    before: Optional[str] = Query(default=None, description="Only orders created before this date (YYYY-MM-DD)"),
+    status: Optional[List[str]] = Query(default=None, description="Order statuses to include"),
+    refresh: bool = Query(default=False, description="Reload all orders before aggregating")
+):
+    from app.services.analytics_service import sales_analytics_service, DIMENSIONS
+    
+    dimensions = [d.strip() for d in group_by.split(",") if d.strip()]
+    invalid = [d for d in dimensions if d not in DIMENSIONS]
+    if invalid or not dimensions or len(set(dimensions)) != len(dimensions):
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": f"Invalid group_by: {group_by}",
+                "supported_dimensions": list(DIMENSIONS)
+            }
+        )
+    
+    try:
+        result = await sales_analytics_service.aggregate(
+            dimensions,
+            period=period,
+            after=after,
+            before=before,
+            status=status,
+            force_refresh=refresh
+        )
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "Invalid aggregation parameters",
+                "details": str(e)
+            }
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error": "Failed to aggregate sales",
+                "details": str(e)
+            }
+        )
+    
+    return fast_response(result)
\ No newline at end of file
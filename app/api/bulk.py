@@ -0,0 +1,58 @@
+from fastapi import APIRouter, HTTPException, Query, Request
+from typing import Optional
+
+from app.core.bulkheads import priority_scope
+from app.core.config import settings
+from app.core.jobs import job_registry
+from app.core.responses import fast_response
+from app.models.i18n_schemas import LanguageCode
+from app.services.bulk_import_service import bulk_import_service
+
+router = APIRouter()
+
+FORMATS_BY_CONTENT_TYPE = {
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+    "text/csv": "csv"
+}
+
+
+@router.post("/import")
+async def bulk_import(
+    request: Request,
+    entity: str = Query(default="product", pattern="^(product|order)$", description="Entity type of each row"),
+    format: Optional[str] = Query(default=None, pattern="^(ndjson|csv)$", description="Upload format"),
+    language: LanguageCode = Query(default=LanguageCode.EN, description="Target language"),
+    dry_run: bool = Query(default=False, description="Validate and transform without writing upstream"),
+    job_id: Optional[str] = Query(default=None, description="Client-chosen id to poll progress with")
+):
+    if format is None:
+        content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+        format = FORMATS_BY_CONTENT_TYPE.get(content_type)
+        if format is None:
+            raise HTTPException(
+                status_code=400,
+                detail={
+                    "error": "Unknown upload format",
+                    "message": "Pass ?format=ndjson|csv or a text/csv / application/x-ndjson content type"
+                }
+            )
+    
+    try:
+        job = job_registry.create("import", job_id=job_id, max_errors=settings.IMPORT_MAX_ERRORS_REPORTED)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail={"error": str(e)})
+    
+    with priority_scope("background"):
+        report = await bulk_import_service.run(
+            job,
+            request.stream(),
+            entity=entity,
+            file_format=format,
+            language=language.value,
+            dry_run=dry_run
+        )
+    
+    status_code = 200 if job.status == "completed" else 400
+    return fast_response(report, status_code=status_code)
\ No newline at end of file
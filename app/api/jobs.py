@@ -0,0 +1,25 @@
+from fastapi import APIRouter, HTTPException, Query
+from typing import Optional
+
+from app.core.jobs import job_registry
+from app.core.responses import fast_response
+
+router = APIRouter()
+
+
+@router.get("/jobs")
+async def list_jobs(kind: Optional[str] = Query(default=None, description="Filter by job kind")):
+    return fast_response({
+        "items": [job.to_dict(include_errors=False) for job in job_registry.list(kind)]
+    })
+
+
+@router.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    job = job_registry.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=404,
+            detail={"error": f"Job {job_id} not found"}
+        )
+    return fast_response(job.to_dict())
\ No newline at end of file
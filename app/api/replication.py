@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Query
+from typing import Optional
+
+from app.core.responses import fast_response
+from app.services.replication_service import replication_service
+
+router = APIRouter()
+
+
+@router.post("/replication")
+async def start_replication(
+    source_store: str = Query(description="Store to copy the catalog from"),
+    target_store: str = Query(description="Store to apply the differences to"),
+    dry_run: bool = Query(default=False, description="Report the differences without writing to the target store"),
+    delete_missing: bool = Query(default=False, description="Delete target products whose SKU is not in the source store"),
+    job_id: Optional[str] = Query(default=None, description="Client-chosen id to poll progress with")
+):
+    job = replication_service.start(
+        source_store,
+        target_store,
+        dry_run=dry_run,
+        delete_missing=delete_missing,
+        job_id=job_id
+    )
+    return fast_response(job.to_dict(include_errors=False), status_code=202)
@@ -0,0 +1,49 @@
+from fastapi import APIRouter, Query, Request
+from typing import Optional
+
+from app.core.responses import fast_response
+from app.core.stores import current_store_id
+from app.models.schemas import NormalizedResponse, StockUpdateRequest
+from app.services.reconciliation_service import reconciliation_service
+from app.services.stock_buffer_service import stock_buffer
+
+router = APIRouter()
+
+
+@router.post("/stock", response_model=NormalizedResponse, status_code=202)
+async def update_stock(request: StockUpdateRequest):
+    result = stock_buffer.put_many(request.updates)
+    return fast_response(NormalizedResponse(
+        success=True,
+        data=result,
+        message=f"{result['accepted']} stock updates buffered"
+    ), status_code=202)
+
+
+@router.post("/stock/flush", response_model=NormalizedResponse)
+async def flush_stock():
+    result = await stock_buffer.flush()
+    return fast_response(NormalizedResponse(
+        success=result["requeued"] == 0 and result["dropped"] == 0,
+        data=result,
+        message=f"Flushed {result['flushed']} stock updates"
+    ))
+
+
+@router.get("/stock/stats")
+async def stock_stats():
+    return fast_response(stock_buffer.stats())
+
+
+@router.post("/stock/reconcile", status_code=202)
+async def reconcile_stock(
+    request: Request,
+    apply: bool = Query(default=False, description="Push the file quantities for mismatched products"),
+    sku_column: str = Query(default="sku", description="CSV column holding the SKU"),
+    quantity_column: str = Query(default="quantity", description="CSV column holding the stock quantity"),
+    job_id: Optional[str] = Query(default=None, description="Client-chosen id to poll progress with")
+):
+    job = reconciliation_service.create_job(job_id)
+    sorter = await reconciliation_service.spool(job, request.stream(), sku_column, quantity_column)
+    reconciliation_service.start(job, sorter, current_store_id(), apply=apply)
+    return fast_response(job.to_dict(include_errors=False), status_code=202)
\ No newline at end of file
@@ -1,14 +1,32 @@
 from fastapi import APIRouter, HTTPException
-from typing import Dict, Any
+from typing import Dict, Any, Optional, List
+import time
 from pydantic import ValidationError
 
-from app.models.schemas import NormalizedResponse
+from app.models.schemas import NormalizedResponse, StockUpdateRequest, VariationSpec
+from app.core.config import settings
+from app.core.responses import fast_response
+from app.core.metrics import SYNC_ACTION_DURATION
+from app.core.offload import cpu_offloader
+from app.core.admission import admission
+from app.core.deadlines import deadline_scope
+from app.core.stores import fan_out, store_scope
+from app.core.tracing import tracer, traced
 from app.services.woocommerce_service import woocommerce_service
 from app.services.wordpress_service import wordpress_service
 from app.services.i18n_template_service import i18n_template_service
+from app.services.stock_buffer_service import stock_buffer
+from app.services.taxonomy_service import PRODUCT_TERM_FIELDS, POST_TERM_FIELDS, needs_resolution, taxonomy_service
+from app.services.variation_service import client_price, variation_service
 
 router = APIRouter()
 
+SUPPORTED_ACTION_IDS = [
+    "create_wc_product", "create_wc_order", "create_wp_post",
+    "validate_product", "validate_i18n", "update_stock", "create_wc_variable_product"
+]
+FAN_OUT_ACTION_IDS = ["create_wc_product", "update_stock"]
+
 
 @router.post("/sync", response_model=NormalizedResponse)
 async def unified_sync_endpoint(request: Dict[str, Any]):
@@ -18,10 +36,7 @@ async def unified_sync_endpoint(request: Dict[str, Any]):
             detail={
                 "error": "Missing 'action_id' attribute",
                 "message": "Request must include 'action_id' field to determine routing",
-                "supported_action_ids": [
-                    "create_wc_product", "create_wc_order", "create_wp_post", 
-                    "validate_product", "validate_i18n"
-                ]
+                "supported_action_ids": SUPPORTED_ACTION_IDS
             }
         )
     
@@ -29,27 +44,68 @@ async def unified_sync_endpoint(request: Dict[str, Any]):
     data = request.get('data', {})
     language = request.get('language', 'en')
     fallback_language = request.get('fallback_language', 'en')
+    store_id = request.get('store_id')
+    store_ids = request.get('store_ids')
+    
+    if store_ids is not None and (action_id not in FAN_OUT_ACTION_IDS or not isinstance(store_ids, list) or not store_ids):
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "Invalid 'store_ids' attribute",
+                "message": "'store_ids' must be a non-empty list of store ids",
+                "fan_out_action_ids": FAN_OUT_ACTION_IDS
+            }
+        )
     
+    action_label = action_id if action_id in SUPPORTED_ACTION_IDS else "unsupported"
+    outcome = "error"
+    started = time.perf_counter()
+    try:
+        with deadline_scope(settings.DEADLINE_ACTIONS.get(action_id)), store_scope(store_id):
+            async with admission.admit(action_label):
+                with tracer.span(f"sync.{action_label}", attributes={"sync.language": language}):
+                    response = await dispatch_action(action_id, data, language, fallback_language, store_ids)
+        outcome = "success"
+        return response
+    except HTTPException as e:
+        outcome = f"http_{e.status_code}"
+        raise
+    finally:
+        SYNC_ACTION_DURATION.observe(
+            time.perf_counter() - started,
+            action_id=action_label,
+            outcome=outcome
+        )
+
+
+async def dispatch_action(
+    action_id: str,
+    data: Dict[str, Any],
+    language: str,
+    fallback_language: str,
+    store_ids: Optional[List[str]] = None
+):
     try:
         if action_id == 'create_wc_product':
-            return await create_wc_product(data, language, fallback_language)
+            return fast_response(await create_wc_product(data, language, fallback_language, store_ids))
         elif action_id == 'create_wc_order':
-            return await create_wc_order(data, language, fallback_language)
+            return fast_response(await create_wc_order(data, language, fallback_language))
         elif action_id == 'create_wp_post':
-            return await create_wp_post(data, language, fallback_language)
+            return fast_response(await create_wp_post(data, language, fallback_language))
         elif action_id == 'validate_product':
-            return await validate_product_schema(data)
+            return fast_response(await cpu_offloader.run(validate_product_schema, data, payload=data))
         elif action_id == 'validate_i18n':
-            return await validate_i18n_structure(data)
+            return fast_response(await cpu_offloader.run(validate_i18n_structure, data, payload=data))
+        elif action_id == 'update_stock':
+            return fast_response(await update_stock(data, store_ids), status_code=202)
+        elif action_id == 'create_wc_variable_product':
+            return fast_response(await create_wc_variable_product(data, language, fallback_language))
         else:
             raise HTTPException(
                 status_code=400,
                 detail={
                     "error": f"Unsupported action_id: {action_id}",
-                    "supported_action_ids": [
-                        "create_wc_product", "create_wc_order", "create_wp_post", 
-                        "validate_product", "validate_i18n"
-                    ]
+                    "supported_action_ids": SUPPORTED_ACTION_IDS
                 }
             )
     except HTTPException:
@@ -64,8 +120,35 @@ async def unified_sync_endpoint(request: Dict[str, Any]):
         )
 
 
-async def create_wc_product(data: Dict[str, Any], language: str, fallback_language: str) -> NormalizedResponse:
-    wc_product_data = i18n_template_service.transform_to_wc_product_i18n(data, language)
+async def create_wc_product(
+    data: Dict[str, Any],
+    language: str,
+    fallback_language: str,
+    store_ids: Optional[List[str]] = None
+) -> NormalizedResponse:
+    if store_ids and needs_resolution(data, PRODUCT_TERM_FIELDS):
+        async def create_in_store():
+            return await woocommerce_service.create_product(await wc_product_payload(data, language, fallback_language))
+        
+        results = await fan_out(store_ids, create_in_store)
+        created = sum(1 for result in results.values() if result["success"])
+        return NormalizedResponse(
+            success=created == len(results),
+            data=results,
+            message=f"WooCommerce product created in {created} of {len(results)} stores in {language}"
+        )
+    
+    wc_product_data = await wc_product_payload(data, language, fallback_language)
+    
+    if store_ids:
+        results = await fan_out(store_ids, lambda: woocommerce_service.create_product(wc_product_data))
+        created = sum(1 for result in results.values() if result["success"])
+        return NormalizedResponse(
+            success=created == len(results),
+            data=results,
+            message=f"WooCommerce product created in {created} of {len(results)} stores in {language}"
+        )
+    
     created_product = await woocommerce_service.create_product(wc_product_data)
     
     return NormalizedResponse(
@@ -75,8 +158,65 @@ async def create_wc_product(data: Dict[str, Any], language: str, fallback_langua
     )
 
 
+async def wc_product_payload(data: Dict[str, Any], language: str, fallback_language: str) -> Dict[str, Any]:
+    data = await taxonomy_service.resolve_terms(data, PRODUCT_TERM_FIELDS, language, fallback_language)
+    return await cpu_offloader.run(
+        i18n_template_service.transform_to_wc_product_i18n,
+        data,
+        language,
+        payload=data
+    )
+
+
+async def create_wc_variable_product(data: Dict[str, Any], language: str, fallback_language: str) -> NormalizedResponse:
+    try:
+        spec = VariationSpec.model_validate(data.get("variations") or {})
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "Invalid variation spec",
+                "details": str(e)
+            }
+        )
+    
+    product_data = {key: value for key, value in data.items() if key != "variations"}
+    product_data["type"] = "variable"
+    wc_product_data = await wc_product_payload(product_data, language, fallback_language)
+    variations = variation_service.plan(wc_product_data, spec, client_price(product_data))
+    if spec.sku:
+        wc_product_data = {**wc_product_data, "sku": spec.sku}
+    
+    created_product = await woocommerce_service.create_product(wc_product_data)
+    result = await variation_service.create_variations(created_product["id"], variations)
+    if not result["variation_ids"]:
+        parent_deleted = await variation_service.discard_parent(created_product["id"])
+        raise HTTPException(
+            status_code=502,
+            detail={
+                "error": "Failed to create product variations",
+                "details": {
+                    "product_id": created_product["id"],
+                    "parent_deleted": parent_deleted,
+                    "failed": result["failed"]
+                }
+            }
+        )
+    
+    return NormalizedResponse(
+        success=not result["failed"],
+        data={"product": created_product, **result},
+        message=f"WooCommerce variable product created with {len(result['variation_ids'])} of {len(variations)} variations in {language}"
+    )
+
+
 async def create_wc_order(data: Dict[str, Any], language: str, fallback_language: str) -> NormalizedResponse:
-    wc_order_data = i18n_template_service.transform_to_wc_order_i18n(data, language)
+    wc_order_data = await cpu_offloader.run(
+        i18n_template_service.transform_to_wc_order_i18n,
+        data,
+        language,
+        payload=data
+    )
     created_order = await woocommerce_service.create_order(wc_order_data)
     
     return NormalizedResponse(
@@ -87,7 +227,13 @@ async def create_wc_order(data: Dict[str, Any], language: str, fallback_language
 
 
 async def create_wp_post(data: Dict[str, Any], language: str, fallback_language: str) -> NormalizedResponse:
-    wp_post_data = i18n_template_service.transform_to_wp_post_i18n(data, language)
+    data = await taxonomy_service.resolve_terms(data, POST_TERM_FIELDS, language, fallback_language)
+    wp_post_data = await cpu_offloader.run(
+        i18n_template_service.transform_to_wp_post_i18n,
+        data,
+        language,
+        payload=data
+    )
     created_post = await wordpress_service.create_post(wp_post_data)
     
     return NormalizedResponse(
@@ -97,7 +243,41 @@ async def create_wp_post(data: Dict[str, Any], language: str, fallback_language:
     )
 
 
-async def validate_product_schema(data: Dict[str, Any]) -> NormalizedResponse:
+async def update_stock(data: Dict[str, Any], store_ids: Optional[List[str]] = None) -> NormalizedResponse:
+    try:
+        stock_request = StockUpdateRequest(**data)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "Invalid stock update",
+                "details": str(e)
+            }
+        )
+    
+    if store_ids:
+        results = await fan_out(store_ids, lambda: buffer_stock_updates(stock_request))
+        return NormalizedResponse(
+            success=True,
+            data=results,
+            message=f"{len(stock_request.updates)} stock updates buffered for {len(results)} stores"
+        )
+    
+    result = stock_buffer.put_many(stock_request.updates)
+    
+    return NormalizedResponse(
+        success=True,
+        data=result,
+        message=f"{result['accepted']} stock updates buffered"
+    )
+
+
+async def buffer_stock_updates(stock_request: StockUpdateRequest) -> Dict[str, Any]:
+    return stock_buffer.put_many(stock_request.updates)
+
+
+@traced
+def validate_product_schema(data: Dict[str, Any]) -> NormalizedResponse:
     errors = []
     warnings = []
     
@@ -146,7 +326,8 @@ async def validate_product_schema(data: Dict[str, Any]) -> NormalizedResponse:
     )
 
 
-async def validate_i18n_structure(data: Dict[str, Any]) -> NormalizedResponse:
+@traced
+def validate_i18n_structure(data: Dict[str, Any]) -> NormalizedResponse:
     errors = []
     warnings = []
     
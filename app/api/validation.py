@@ -2,6 +2,8 @@ from fastapi import APIRouter, HTTPException
 from pydantic import ValidationError
 from typing import Dict, Any, List
 
+from app.core.offload import cpu_offloader
+from app.core.tracing import traced
 from app.models.i18n_schemas import I18nData, I18nTranslation, MultiLanguageRequest
 from app.models.schemas import NormalizedResponse
 
@@ -10,6 +12,16 @@ router = APIRouter()
 
 @router.post("/validate-product", response_model=NormalizedResponse)
 async def validate_product_schema(data: Dict[str, Any]):
+    return await cpu_offloader.run(check_product_schema, data, payload=data)
+
+
+@router.post("/validate-i18n", response_model=NormalizedResponse)
+async def validate_i18n_structure(data: Dict[str, Any]):
+    return await cpu_offloader.run(check_i18n_structure, data, payload=data)
+
+
+@traced
+def check_product_schema(data: Dict[str, Any]) -> NormalizedResponse:
     errors = []
     warnings = []
     
@@ -66,8 +78,8 @@ async def validate_product_schema(data: Dict[str, Any]):
     )
 
 
-@router.post("/validate-i18n", response_model=NormalizedResponse)
-async def validate_i18n_structure(data: Dict[str, Any]):
+@traced
+def check_i18n_structure(data: Dict[str, Any]) -> NormalizedResponse:
     errors = []
     warnings = []
     
@@ -1,5 +1,7 @@
 from fastapi import APIRouter, HTTPException, Query
-from typing import Dict, Any
+from fastapi.responses import StreamingResponse
+from typing import Dict, Any, List, Optional
+from datetime import datetime, timezone
 
 from app.models.schemas import (
     PaginationParams, 
@@ -8,9 +10,12 @@ from app.models.schemas import (
     PaginatedResponse
 )
 from app.models.i18n_schemas import MultiLanguageRequest, LanguageCode
+from app.core.responses import fast_response
 from app.services.woocommerce_service import woocommerce_service
+from app.services.export_service import export_service
 from app.services.template_service import template_service
 from app.services.i18n_template_service import i18n_template_service
+from app.services.taxonomy_service import PRODUCT_TERM_FIELDS, taxonomy_service
 
 router = APIRouter()
 
@@ -23,7 +28,7 @@ async def get_products(
     try:
         pagination = PaginationParams(page=page, per_page=per_page)
         result = await woocommerce_service.get_products(pagination)
-        return result
+        return fast_response(result)
     except HTTPException:
         raise
     except Exception as e:
@@ -39,18 +44,24 @@ async def get_products(
 @router.post("/products", response_model=NormalizedResponse)
 async def create_product(request: MultiLanguageRequest):
     try:
+        data = await taxonomy_service.resolve_terms(
+            request.data,
+            PRODUCT_TERM_FIELDS,
+            request.language.value,
+            request.fallback_language.value
+        )
         wc_product_data = i18n_template_service.transform_to_wc_product_i18n(
-            request.data, 
+            data, 
             request.language.value
         )
         
         created_product = await woocommerce_service.create_product(wc_product_data)
         
-        return NormalizedResponse(
+        return fast_response(NormalizedResponse(
             success=True,
             data=created_product,
             message=f"Product created successfully in {request.language.value}"
-        )
+        ))
     except ValueError as e:
         raise HTTPException(
             status_code=400,
@@ -79,7 +90,7 @@ async def get_orders(
     try:
         pagination = PaginationParams(page=page, per_page=per_page)
         result = await woocommerce_service.get_orders(pagination)
-        return result
+        return fast_response(result)
     except HTTPException:
         raise
     except Exception as e:
@@ -92,6 +103,43 @@ async def get_orders(
         )
 
 
+@router.get("/orders/export")
+async def export_orders(
+    format: str = Query(default="csv", pattern="^(csv|parquet)$", description="Export format"),
+    after: Optional[datetime] = Query(default=None, description="Only orders created after this date (ISO 8601)"),
+    before: Optional[datetime] = Query(default=None, description="Only orders created before this date (ISO 8601)"),
+    status: Optional[List[str]] = Query(default=None, description="Order statuses to include")
+):
+    if format == "parquet" and not export_service.parquet_available():
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "Parquet export is not available",
+                "details": "Install the 'pyarrow' package to enable Parquet export"
+            }
+        )
+    
+    filters = {
+        "after": after.isoformat() if after else None,
+        "before": before.isoformat() if before else None,
+        "status": status
+    }
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+    
+    if format == "parquet":
+        return StreamingResponse(
+            export_service.stream_orders_parquet(**filters),
+            media_type="application/vnd.apache.parquet",
+            headers={"Content-Disposition": f'attachment; filename="orders-{stamp}.parquet"'}
+        )
+    
+    return StreamingResponse(
+        export_service.stream_orders_csv(**filters),
+        media_type="text/csv; charset=utf-8",
+        headers={"Content-Disposition": f'attachment; filename="orders-{stamp}.csv"'}
+    )
+
+
 @router.post("/orders", response_model=NormalizedResponse)
 async def create_order(request: MultiLanguageRequest):
     try:
@@ -102,11 +150,11 @@ async def create_order(request: MultiLanguageRequest):
         
         created_order = await woocommerce_service.create_order(wc_order_data)
         
-        return NormalizedResponse(
+        return fast_response(NormalizedResponse(
             success=True,
             data=created_order,
             message=f"Order created successfully in {request.language.value}"
-        )
+        ))
     except ValueError as e:
         raise HTTPException(
             status_code=400,
@@ -8,9 +8,11 @@ from app.models.schemas import (
     PaginatedResponse
 )
 from app.models.i18n_schemas import MultiLanguageRequest, LanguageCode
+from app.core.responses import fast_response
 from app.services.wordpress_service import wordpress_service
 from app.services.template_service import template_service
 from app.services.i18n_template_service import i18n_template_service
+from app.services.taxonomy_service import POST_TERM_FIELDS, taxonomy_service
 
 router = APIRouter()
 
@@ -23,7 +25,7 @@ async def get_posts(
     try:
         pagination = PaginationParams(page=page, per_page=per_page)
         result = await wordpress_service.get_posts(pagination)
-        return result
+        return fast_response(result)
     except HTTPException:
         raise
     except Exception as e:
@@ -39,18 +41,24 @@ async def get_posts(
 @router.post("/posts", response_model=NormalizedResponse)
 async def create_post(request: MultiLanguageRequest):
     try:
+        data = await taxonomy_service.resolve_terms(
+            request.data,
+            POST_TERM_FIELDS,
+            request.language.value,
+            request.fallback_language.value
+        )
         wp_post_data = i18n_template_service.transform_to_wp_post_i18n(
-            request.data, 
+            data, 
             request.language.value
         )
         
         created_post = await wordpress_service.create_post(wp_post_data)
         
-        return NormalizedResponse(
+        return fast_response(NormalizedResponse(
             success=True,
             data=created_post,
             message=f"Post created successfully in {request.language.value}"
-        )
+        ))
     except ValueError as e:
         raise HTTPException(
             status_code=400,
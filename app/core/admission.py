@@ -0,0 +1,189 @@
+import asyncio
+import contextlib
+import heapq
+import itertools
+import math
+import time
+from typing import Dict, Any, List, Tuple, Optional, AsyncIterator
+
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.core.deadlines import deadline_exceeded, remaining
+from app.core.metrics import registry, FAST_BUCKETS
+
+ACTION_CLASSES = ("cheap", "expensive")
+CLASS_RANK = {cost: rank for rank, cost in enumerate(ACTION_CLASSES)}
+CHEAP_ACTIONS = ("validate_product", "validate_i18n", "update_stock")
+
+ADMISSION_WAIT = registry.histogram(
+    "wpwc_admission_wait_seconds",
+    "Time sync requests waited for admission",
+    ("cost",),
+    buckets=FAST_BUCKETS + (2.5, 5.0, 10.0)
+)
+ADMISSION_REJECTED = registry.counter(
+    "wpwc_admission_rejected_total",
+    "Sync requests shed by admission control",
+    ("cost", "reason")
+)
+ADMISSION_IN_FLIGHT = registry.gauge(
+    "wpwc_admission_in_flight",
+    "Sync requests currently admitted",
+    ("cost",)
+)
+ADMISSION_QUEUED = registry.gauge(
+    "wpwc_admission_queued",
+    "Sync requests waiting for admission",
+    ("cost",)
+)
+
+
+def action_cost(action_id: str) -> str:
+    return "cheap" if action_id in CHEAP_ACTIONS else "expensive"
+
+
+class AdmissionController:
+    def __init__(
+        self,
+        enabled: bool,
+        max_in_flight: int,
+        max_queue: int,
+        max_queue_wait: float,
+        latency_target: Optional[float],
+        smoothing: float = 0.2
+    ):
+        self.enabled = enabled
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_queue = max(0, max_queue)
+        self.max_queue_wait = max_queue_wait
+        self.latency_target = latency_target
+        self.smoothing = smoothing
+        self.in_flight = {cost: 0 for cost in ACTION_CLASSES}
+        self.service_time: Dict[str, float] = {}
+        self._waiters: List[Tuple[int, int, str, asyncio.Future]] = []
+        self._sequence = itertools.count()
+    
+    def _total_in_flight(self) -> int:
+        return sum(self.in_flight.values())
+    
+    def _queued(self, cost: Optional[str] = None) -> int:
+        return sum(1 for _, _, waiter, future in self._waiters if (cost is None or waiter == cost) and not future.done())
+    
+    def _queued_ahead(self, cost: str) -> int:
+        rank = CLASS_RANK[cost]
+        return sum(1 for waiter_rank, _, _, future in self._waiters if waiter_rank <= rank and not future.done())
+    
+    def _take(self, cost: str) -> None:
+        self.in_flight[cost] += 1
+        ADMISSION_IN_FLIGHT.set(self.in_flight[cost], cost=cost)
+    
+    def _release(self, cost: str) -> None:
+        self.in_flight[cost] -= 1
+        ADMISSION_IN_FLIGHT.set(self.in_flight[cost], cost=cost)
+        self._dispatch()
+    
+    def _dispatch(self) -> None:
+        while self._waiters and self._total_in_flight() < self.max_in_flight:
+            _, _, cost, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue
+            self._take(cost)
+            future.set_result(None)
+    
+    def _record(self, cost: str, seconds: float) -> None:
+        previous = self.service_time.get(cost)
+        self.service_time[cost] = seconds if previous is None else previous + self.smoothing * (seconds - previous)
+    
+    def expected_wait(self, cost: str) -> float:
+        service_time = max(self.service_time.values(), default=0.0)
+        waves = (self._queued_ahead(cost) + 1) / self.max_in_flight
+        return waves * service_time
+    
+    def retry_after(self) -> int:
+        service_time = max(self.service_time.values(), default=1.0)
+        waves = (self._queued() + self._total_in_flight()) / self.max_in_flight
+        return max(1, math.ceil(waves * service_time))
+    
+    def _reject(self, cost: str, reason: str, details: str) -> HTTPException:
+        ADMISSION_REJECTED.inc(cost=cost, reason=reason)
+        return HTTPException(
+            status_code=503,
+            detail={"error": "Service overloaded", "details": details},
+            headers={"Retry-After": str(self.retry_after())}
+        )
+    
+    def _check_shed(self, cost: str) -> None:
+        queued = self._queued() if cost == "expensive" else self._queued(cost)
+        if queued >= self.max_queue:
+            raise self._reject(cost, "queue_full", f"{queued} sync requests are already waiting")
+        if cost == "expensive" and self.latency_target is not None:
+            expected = self.expected_wait(cost)
+            if expected > self.latency_target:
+                raise self._reject(
+                    cost,
+                    "latency_target",
+                    f"Expected queue wait {expected:.2f}s exceeds the {self.latency_target:.2f}s target"
+                )
+    
+    async def _acquire(self, cost: str) -> None:
+        if self._queued_ahead(cost) == 0 and self._total_in_flight() < self.max_in_flight:
+            self._take(cost)
+            return
+        
+        self._check_shed(cost)
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (CLASS_RANK[cost], next(self._sequence), cost, future))
+        ADMISSION_QUEUED.set(self._queued(cost), cost=cost)
+        budget = remaining()
+        timeout = self.max_queue_wait if budget is None else min(self.max_queue_wait, max(budget, 0))
+        try:
+            await asyncio.wait_for(future, timeout=timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if future.done() and not future.cancelled():
+                self._release(cost)
+            if not isinstance(e, asyncio.TimeoutError):
+                raise
+            if budget is not None and budget <= self.max_queue_wait:
+                raise deadline_exceeded("admission")
+            raise self._reject(cost, "queue_timeout", f"Not admitted within {self.max_queue_wait:.2f}s")
+        finally:
+            ADMISSION_QUEUED.set(self._queued(cost), cost=cost)
+    
+    @contextlib.asynccontextmanager
+    async def admit(self, action_id: str) -> AsyncIterator[None]:
+        if not self.enabled:
+            yield
+            return
+        
+        cost = action_cost(action_id)
+        queued_at = time.perf_counter()
+        await self._acquire(cost)
+        started = time.perf_counter()
+        ADMISSION_WAIT.observe(started - queued_at, cost=cost)
+        try:
+            yield
+        finally:
+            self._record(cost, time.perf_counter() - started)
+            self._release(cost)
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "max_in_flight": self.max_in_flight,
+            "max_queue": self.max_queue,
+            "max_queue_wait_seconds": self.max_queue_wait,
+            "latency_target_seconds": self.latency_target,
+            "in_flight": dict(self.in_flight),
+            "queued": {cost: self._queued(cost) for cost in ACTION_CLASSES},
+            "service_time_seconds": {cost: round(seconds, 4) for cost, seconds in self.service_time.items()}
+        }
+
+
+admission = AdmissionController(
+    settings.ADMISSION_ENABLED,
+    settings.ADMISSION_MAX_IN_FLIGHT,
+    settings.ADMISSION_MAX_QUEUE,
+    settings.ADMISSION_MAX_QUEUE_WAIT,
+    settings.ADMISSION_LATENCY_TARGET
+)
\ No newline at end of file
@@ -0,0 +1,160 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import secrets
+import time
+from typing import Dict, Any, Optional, AsyncGenerator, Generator
+from urllib.parse import quote
+
+import httpx
+from fastapi import HTTPException
+
+from app.core.cassette import SECRET_EXCHANGE, upstream_transport
+from app.core.config import settings
+from app.core.metrics import registry
+
+WP_AUTH_TYPES = ("basic", "jwt")
+WC_AUTH_TYPES = ("basic", "oauth1")
+
+AUTH_TOKEN_REFRESHES = registry.counter(
+    "wpwc_auth_token_refreshes_total",
+    "Upstream auth token fetches",
+    ("service", "outcome")
+)
+
+
+def token_expiry(token: str) -> Optional[float]:
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except (IndexError, ValueError):
+        return None
+    expires = claims.get("exp") if isinstance(claims, dict) else None
+    return float(expires) if isinstance(expires, (int, float)) else None
+
+
+class JwtAuth(httpx.Auth):
+    def __init__(
+        self,
+        service: str,
+        token_url: str,
+        username: str,
+        password: str,
+        refresh_margin: float,
+        default_ttl: float
+    ):
+        self.service = service
+        self.token_url = token_url
+        self.username = username
+        self.password = password
+        self.refresh_margin = refresh_margin
+        self.default_ttl = default_ttl
+        self.token: Optional[str] = None
+        self.expires_at = 0.0
+        self._lock = asyncio.Lock()
+    
+    def _fresh(self) -> bool:
+        return self.token is not None and time.time() < self.expires_at - self.refresh_margin
+    
+    async def _fetch(self) -> None:
+        try:
+            async with httpx.AsyncClient(transport=upstream_transport(), timeout=settings.UPSTREAM_TIMEOUT_SECONDS) as client:
+                response = await client.post(
+                    self.token_url,
+                    json={"username": self.username, "password": self.password},
+                    extensions={SECRET_EXCHANGE: True}
+                )
+            response.raise_for_status()
+            token = response.json()["token"]
+        except (httpx.HTTPError, ValueError, KeyError, TypeError) as e:
+            AUTH_TOKEN_REFRESHES.inc(service=self.service, outcome="error")
+            raise HTTPException(
+                status_code=502,
+                detail={"error": f"{self.service} authentication failed", "details": str(e)}
+            )
+        AUTH_TOKEN_REFRESHES.inc(service=self.service, outcome="success")
+        self.token = token
+        self.expires_at = token_expiry(token) or time.time() + self.default_ttl
+    
+    async def token_for_request(self, rejected: Optional[str] = None) -> str:
+        if self._fresh() and self.token != rejected:
+            return self.token
+        async with self._lock:
+            if not self._fresh() or self.token == rejected:
+                await self._fetch()
+            return self.token
+    
+    def sync_auth_flow(self, request: httpx.Request) -> Generator[httpx.Request, httpx.Response, None]:
+        raise RuntimeError("JwtAuth is only supported with httpx.AsyncClient")
+    
+    async def async_auth_flow(self, request: httpx.Request) -> AsyncGenerator[httpx.Request, httpx.Response]:
+        token = await self.token_for_request()
+        request.headers["Authorization"] = f"Bearer {token}"
+        response = yield request
+        if response.status_code == 401:
+            await response.aread()
+            token = await self.token_for_request(rejected=token)
+            request.headers["Authorization"] = f"Bearer {token}"
+            yield request
+
+
+def _encode(value: str) -> str:
+    return quote(value, safe="~")
+
+
+class OAuth1Auth(httpx.Auth):
+    def __init__(self, consumer_key: str, consumer_secret: str):
+        self.consumer_key = consumer_key
+        self.signing_key = f"{_encode(consumer_secret)}&".encode()
+    
+    def signature(self, method: str, url: httpx.URL, params: Dict[str, Any]) -> str:
+        normalized = "&".join(
+            f"{key}={value}"
+            for key, value in sorted((_encode(str(key)), _encode(str(value))) for key, value in params.items())
+        )
+        base_url = str(url.copy_with(query=None, fragment=None))
+        base = "&".join((method.upper(), _encode(base_url), _encode(normalized)))
+        return base64.b64encode(hmac.new(self.signing_key, base.encode(), hashlib.sha256).digest()).decode()
+    
+    def auth_flow(self, request: httpx.Request) -> Generator[httpx.Request, httpx.Response, None]:
+        oauth = {
+            "oauth_consumer_key": self.consumer_key,
+            "oauth_nonce": secrets.token_hex(16),
+            "oauth_signature_method": "HMAC-SHA256",
+            "oauth_timestamp": str(int(time.time()))
+        }
+        params = {**dict(request.url.params.multi_items()), **oauth}
+        oauth["oauth_signature"] = self.signature(request.method, request.url, params)
+        request.url = request.url.copy_merge_params(oauth)
+        yield request
+
+
+def wordpress_auth(
+    auth_type: str,
+    base_url: str,
+    username: str,
+    password: str,
+    service: str = "wordpress"
+) -> httpx.Auth:
+    if auth_type == "basic":
+        return httpx.BasicAuth(username or "", password or "")
+    if auth_type == "jwt":
+        return JwtAuth(
+            service,
+            base_url + settings.WP_JWT_TOKEN_PATH,
+            username,
+            password,
+            settings.AUTH_TOKEN_REFRESH_MARGIN,
+            settings.WP_JWT_DEFAULT_TTL
+        )
+    raise ValueError(f"WP_AUTH_TYPE must be one of {', '.join(WP_AUTH_TYPES)}")
+
+
+def woocommerce_auth(auth_type: str, consumer_key: str, consumer_secret: str) -> httpx.Auth:
+    if auth_type == "basic":
+        return httpx.BasicAuth(consumer_key or "", consumer_secret or "")
+    if auth_type == "oauth1":
+        return OAuth1Auth(consumer_key, consumer_secret)
+    raise ValueError(f"WC_AUTH_TYPE must be one of {', '.join(WC_AUTH_TYPES)}")
\ No newline at end of file
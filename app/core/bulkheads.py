@@ -0,0 +1,140 @@
+import asyncio
+import contextlib
+import heapq
+import itertools
+import time
+from contextvars import ContextVar
+from typing import Dict, Any, List, Tuple, Iterator, AsyncIterator
+
+from app.core.config import settings
+from app.core.deadlines import deadline_exceeded, remaining
+from app.core.metrics import registry, FAST_BUCKETS
+
+PRIORITIES = ("interactive", "background")
+PRIORITY_RANK = {priority: rank for rank, priority in enumerate(PRIORITIES)}
+READ_METHODS = ("GET", "HEAD", "OPTIONS")
+
+BULKHEAD_WAIT = registry.histogram(
+    "wpwc_bulkhead_wait_seconds",
+    "Time upstream calls waited for a bulkhead slot",
+    ("pool", "priority"),
+    buckets=FAST_BUCKETS + (2.5, 5.0, 10.0, 30.0)
+)
+BULKHEAD_IN_USE = registry.gauge(
+    "wpwc_bulkhead_in_use",
+    "Bulkhead slots currently held",
+    ("pool", "priority")
+)
+BULKHEAD_QUEUED = registry.gauge(
+    "wpwc_bulkhead_queued",
+    "Upstream calls waiting for a bulkhead slot",
+    ("pool", "priority")
+)
+
+_priority: ContextVar[str] = ContextVar("wpwc_priority", default="interactive")
+
+
+def current_priority() -> str:
+    return _priority.get()
+
+
+@contextlib.contextmanager
+def priority_scope(priority: str) -> Iterator[None]:
+    if priority not in PRIORITY_RANK:
+        raise ValueError(f"priority must be one of {', '.join(PRIORITIES)}")
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class Bulkhead:
+    def __init__(self, name: str, limit: int, background_share: float):
+        self.name = name
+        self.limit = max(1, limit)
+        self.background_limit = max(1, int(self.limit * background_share))
+        self.in_use = {priority: 0 for priority in PRIORITIES}
+        self._waiters: List[Tuple[int, int, str, asyncio.Future]] = []
+        self._sequence = itertools.count()
+    
+    def _can_grant(self, priority: str) -> bool:
+        if sum(self.in_use.values()) >= self.limit:
+            return False
+        return priority != "background" or self.in_use["background"] < self.background_limit
+    
+    def _take(self, priority: str) -> None:
+        self.in_use[priority] += 1
+        BULKHEAD_IN_USE.set(self.in_use[priority], pool=self.name, priority=priority)
+    
+    def _release(self, priority: str) -> None:
+        self.in_use[priority] -= 1
+        BULKHEAD_IN_USE.set(self.in_use[priority], pool=self.name, priority=priority)
+        self._dispatch()
+    
+    def _dispatch(self) -> None:
+        while self._waiters:
+            _, _, priority, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if not self._can_grant(priority):
+                return
+            heapq.heappop(self._waiters)
+            self._take(priority)
+            future.set_result(None)
+    
+    def _queued(self, priority: str) -> int:
+        return sum(1 for _, _, waiter, future in self._waiters if waiter == priority and not future.done())
+    
+    async def _acquire(self, priority: str) -> None:
+        rank = PRIORITY_RANK[priority]
+        ahead = any(waiter_rank <= rank and not future.done() for waiter_rank, _, _, future in self._waiters)
+        if not ahead and self._can_grant(priority):
+            self._take(priority)
+            return
+        
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (rank, next(self._sequence), priority, future))
+        BULKHEAD_QUEUED.set(self._queued(priority), pool=self.name, priority=priority)
+        budget = remaining()
+        try:
+            await asyncio.wait_for(future, timeout=max(budget, 0) if budget is not None else None)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if future.done() and not future.cancelled():
+                self._release(priority)
+            if isinstance(e, asyncio.TimeoutError):
+                raise deadline_exceeded("bulkhead")
+            raise
+        finally:
+            BULKHEAD_QUEUED.set(self._queued(priority), pool=self.name, priority=priority)
+    
+    @contextlib.asynccontextmanager
+    async def slot(self, priority: str) -> AsyncIterator[None]:
+        started = time.perf_counter()
+        await self._acquire(priority)
+        BULKHEAD_WAIT.observe(time.perf_counter() - started, pool=self.name, priority=priority)
+        try:
+            yield
+        finally:
+            self._release(priority)
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "background_limit": self.background_limit,
+            "in_use": dict(self.in_use),
+            "queued": {priority: self._queued(priority) for priority in PRIORITIES}
+        }
+
+
+bulkheads = {
+    "read": Bulkhead("read", settings.BULKHEAD_READ_LIMIT, settings.BULKHEAD_BACKGROUND_SHARE),
+    "write": Bulkhead("write", settings.BULKHEAD_WRITE_LIMIT, settings.BULKHEAD_BACKGROUND_SHARE)
+}
+
+
+def upstream_slot(method: str):
+    if not settings.BULKHEAD_ENABLED:
+        return contextlib.nullcontext()
+    return bulkheads["read" if method in READ_METHODS else "write"].slot(current_priority())
\ No newline at end of file
@@ -0,0 +1,184 @@
+import asyncio
+import base64
+import collections
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Any, Optional, List, Tuple, Deque
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import httpx
+
+from app.core.config import settings
+
+UPSTREAM_MODES = ("live", "record", "replay")
+REDACTED = "REDACTED"
+SECRET_HEADERS = {"authorization", "proxy-authorization", "cookie", "set-cookie", "x-wp-nonce"}
+SECRET_PARAMS = {"consumer_key", "consumer_secret", "password", "token", "access_token", "refresh_token"}
+SECRET_EXCHANGE = "wpwc_secret_exchange"
+
+
+def redact_url(url: str) -> str:
+    parts = urlsplit(url)
+    query = [
+        (key, REDACTED if key.lower() in SECRET_PARAMS or key.lower().startswith("oauth_") else value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+    ]
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(sorted(query)), ""))
+
+
+def match_path(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.path}?{parts.query}"
+
+
+def redact_headers(headers: httpx.Headers) -> List[Tuple[str, str]]:
+    return [
+        (key, REDACTED if key.lower() in SECRET_HEADERS else value)
+        for key, value in headers.multi_items()
+    ]
+
+
+def body_digest(content: bytes) -> Optional[str]:
+    return hashlib.sha1(content).hexdigest() if content else None
+
+
+def redact_body(content: bytes) -> bytes:
+    try:
+        data = json.loads(content)
+    except ValueError:
+        return REDACTED.encode()
+    if not isinstance(data, dict):
+        return REDACTED.encode()
+    return json.dumps({key: REDACTED if key.lower() in SECRET_PARAMS else value for key, value in data.items()}).encode()
+
+
+class Cassette:
+    def __init__(self, path: str):
+        self.path = path
+        self._write_lock = threading.Lock()
+        self._exact: Dict[Tuple[str, str, Optional[str]], Deque[Dict[str, Any]]] = {}
+        self._by_url: Dict[Tuple[str, str], Deque[Dict[str, Any]]] = {}
+        self._loaded = False
+    
+    def append(self, entry: Dict[str, Any]) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+        with self._write_lock:
+            with gzip.open(self.path, "at", encoding="utf-8") as f:
+                f.write(line)
+    
+    def load(self) -> None:
+        if self._loaded:
+            return
+        if not os.path.exists(self.path):
+            raise FileNotFoundError(f"Cassette {self.path} does not exist; record it with UPSTREAM_MODE=record")
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                path = match_path(entry["url"])
+                self._exact.setdefault((entry["method"], path, entry.get("body_sha1")), collections.deque()).append(entry)
+                self._by_url.setdefault((entry["method"], path), collections.deque()).append(entry)
+        self._loaded = True
+    
+    def lookup(self, method: str, url: str, digest: Optional[str]) -> Optional[Dict[str, Any]]:
+        self.load()
+        path = match_path(url)
+        entries = self._exact.get((method, path, digest)) or self._by_url.get((method, path))
+        if not entries:
+            return None
+        entry = entries[0]
+        entries.rotate(-1)
+        return entry
+    
+    def __len__(self) -> int:
+        self.load()
+        return sum(len(entries) for entries in self._by_url.values())
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    def __init__(self, cassette: Cassette):
+        self.cassette = cassette
+        self.transport = httpx.AsyncHTTPTransport()
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        response = await self.transport.handle_async_request(request)
+        try:
+            content = b"".join([chunk async for chunk in response.aiter_raw()])
+        finally:
+            await response.aclose()
+        elapsed = time.perf_counter() - started
+        secret = request.extensions.get(SECRET_EXCHANGE, False)
+        headers = redact_headers(response.headers)
+        body = content
+        if secret:
+            body = redact_body(httpx.Response(response.status_code, headers=response.headers, content=content).read())
+            headers = [(key, value) for key, value in headers if key.lower() not in ("content-encoding", "content-length")]
+        
+        entry = {
+            "method": request.method,
+            "url": redact_url(str(request.url)),
+            "body_sha1": None if secret else body_digest(request.content),
+            "status": response.status_code,
+            "headers": headers,
+            "body_b64": base64.b64encode(body).decode("ascii"),
+            "elapsed": round(elapsed, 6),
+            "recorded_at": time.time()
+        }
+        await asyncio.get_running_loop().run_in_executor(None, self.cassette.append, entry)
+        
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            content=content,
+            extensions=response.extensions
+        )
+    
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    def __init__(self, cassette: Cassette, delay_factor: float):
+        self.cassette = cassette
+        self.delay_factor = delay_factor
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        entry = self.cassette.lookup(request.method, redact_url(str(request.url)), body_digest(request.content))
+        if entry is None:
+            raise httpx.ConnectError(
+                f"No recorded response for {request.method} {redact_url(str(request.url))} in {self.cassette.path}",
+                request=request
+            )
+        
+        if self.delay_factor > 0:
+            await asyncio.sleep(entry["elapsed"] * self.delay_factor)
+        
+        return httpx.Response(
+            status_code=entry["status"],
+            headers=entry["headers"],
+            content=base64.b64decode(entry["body_b64"]),
+            extensions={"http_version": b"HTTP/1.1"}
+        )
+
+
+if settings.UPSTREAM_MODE not in UPSTREAM_MODES:
+    raise ValueError(f"UPSTREAM_MODE must be one of {', '.join(UPSTREAM_MODES)}")
+
+upstream_cassette = Cassette(settings.UPSTREAM_CASSETTE)
+
+
+def upstream_transport() -> Optional[httpx.AsyncBaseTransport]:
+    if settings.UPSTREAM_MODE == "record":
+        return RecordingTransport(upstream_cassette)
+    if settings.UPSTREAM_MODE == "replay":
+        return ReplayTransport(upstream_cassette, settings.UPSTREAM_REPLAY_DELAY_FACTOR)
+    return None
\ No newline at end of file
@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Dict, Any, Optional
 
 
 class Settings(BaseSettings):
@@ -8,9 +8,19 @@ class Settings(BaseSettings):
     WP_USERNAME: Optional[str] = "demo_user"
     WP_APP_PASSWORD: Optional[str] = "demo_password"
     WP_AUTH_TYPE: str = "basic"
+    WP_JWT_TOKEN_PATH: str = "/wp-json/jwt-auth/v1/token"
+    WP_JWT_DEFAULT_TTL: float = 3600.0
     
     WC_CONSUMER_KEY: Optional[str] = "demo_consumer_key"
     WC_CONSUMER_SECRET: Optional[str] = "demo_consumer_secret"
+    WC_AUTH_TYPE: str = "basic"
+    
+    AUTH_TOKEN_REFRESH_MARGIN: float = 60.0
+    
+    STORES: Dict[str, Dict[str, Any]] = {}
+    STORE_HEADER: str = "X-Store-Id"
+    STORE_MAX_CONNECTIONS: int = 20
+    STORE_MAX_CONCURRENCY: int = 16
     
     ENABLE_SCHEDULER: bool = False
     SYNC_CRON: str = "*/15 * * * *"
@@ -19,6 +29,113 @@ class Settings(BaseSettings):
     PORT: int = 8000
     DEBUG: bool = False
     
+    FAST_JSON_RESPONSES: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    
+    JOB_HISTORY_SIZE: int = 100
+    IMPORT_MAX_IN_FLIGHT: int = 8
+    IMPORT_MAX_LINE_BYTES: int = 1048576
+    IMPORT_MAX_ERRORS_REPORTED: int = 1000
+    IMPORT_PROGRESS_EVERY: int = 1000
+    
+    EXPORT_CSV_CHUNK_ROWS: int = 500
+    EXPORT_PARQUET_ROW_GROUP_SIZE: int = 10000
+    
+    EXTERNAL_SORT_RUN_SIZE: int = 10000
+    EXTERNAL_SORT_DIR: Optional[str] = None
+    REPLICATION_BATCH_SIZE: int = 100
+    REPLICATION_MAX_IN_FLIGHT: int = 4
+    REPLICATION_REPORT_LIMIT: int = 100
+    RECONCILE_BATCH_SIZE: int = 100
+    RECONCILE_MAX_IN_FLIGHT: int = 4
+    RECONCILE_REPORT_LIMIT: int = 1000
+    RECONCILE_MAX_PENDING_VARIATIONS: int = 1000
+    VARIATION_BATCH_SIZE: int = 100
+    VARIATION_MAX_IN_FLIGHT: int = 4
+    VARIATION_MAX_COMBINATIONS: int = 1000
+    TAXONOMY_INDEX_TTL: float = 300.0
+    TAXONOMY_FULL_RELOAD_INTERVAL: float = 3600.0
+    TAXONOMY_CREATE_MISSING: bool = True
+    TAXONOMY_CREATE_BATCH_SIZE: int = 100
+    TAXONOMY_CREATE_CONCURRENCY: int = 4
+    
+    ANALYTICS_CHUNK_ORDERS: int = 1000
+    ANALYTICS_REFRESH_INTERVAL: float = 60.0
+    ANALYTICS_MAX_CACHED_RESULTS: int = 64
+    
+    STOCK_BUFFER_FLUSH_INTERVAL: float = 5.0
+    STOCK_BUFFER_MAX_SIZE: int = 500
+    STOCK_BUFFER_BATCH_SIZE: int = 100
+    STOCK_BUFFER_MAX_PENDING: int = 10000
+    
+    ADMIN_TOKEN: Optional[str] = None
+    
+    PROFILING_ENABLED: bool = False
+    PROFILING_SAMPLE_RATE: float = 0.0
+    PROFILING_HEADER: str = "X-Profile"
+    PROFILING_INTERVAL: float = 0.001
+    PROFILING_DIR: str = "profiles"
+    PROFILING_MAX_PROFILES: int = 50
+    
+    LOOP_MONITOR_ENABLED: bool = True
+    LOOP_MONITOR_INTERVAL: float = 0.1
+    LOOP_MONITOR_THRESHOLD: float = 0.1
+    LOOP_MONITOR_WINDOW: int = 1000
+    
+    OFFLOAD_MODE: str = "inline"
+    OFFLOAD_WORKERS: Optional[int] = None
+    OFFLOAD_THRESHOLD_BYTES: int = 65536
+    
+    UPSTREAM_MODE: str = "live"
+    UPSTREAM_CASSETTE: str = "cassettes/upstream.ndjson.gz"
+    UPSTREAM_REPLAY_DELAY_FACTOR: float = 1.0
+    
+    MEMORY_TRACING_ENABLED: bool = False
+    MEMORY_TRACE_FRAMES: int = 10
+    MEMORY_MAX_SNAPSHOTS: int = 5
+    MEMORY_SNAPSHOT_INTERVAL: float = 0.0
+    
+    TRACING_ENABLED: bool = False
+    TRACING_SERVICE_NAME: str = "wp-woo-sync"
+    TRACING_SAMPLE_RATIO: float = 1.0
+    TRACING_EXPORTER: str = "file"
+    TRACING_FILE: str = "traces/spans.ndjson"
+    TRACING_OTLP_ENDPOINT: str = "http://localhost:4318/v1/traces"
+    TRACING_EXPORT_INTERVAL: float = 5.0
+    TRACING_BATCH_SIZE: int = 512
+    TRACING_MAX_QUEUE: int = 4096
+    
+    SERVICE_WARMUP: str = "background"
+    TEMPLATES_PRECOMPILED_DIR: Optional[str] = "app/templates/compiled"
+    
+    DEADLINE_HEADER: str = "X-Request-Timeout"
+    DEADLINE_DEFAULT_SECONDS: Optional[float] = None
+    DEADLINE_ACTIONS: Dict[str, float] = {}
+    UPSTREAM_TIMEOUT_SECONDS: float = 30.0
+    CANCEL_ON_DISCONNECT: bool = True
+    
+    HEDGE_ENABLED: bool = False
+    HEDGE_PERCENTILE: float = 95.0
+    HEDGE_MIN_DELAY: float = 0.05
+    HEDGE_MAX_DELAY: float = 2.0
+    HEDGE_MIN_SAMPLES: int = 50
+    HEDGE_WINDOW: int = 1000
+    HEDGE_BUDGET_RATIO: float = 0.05
+    HEDGE_BUDGET_BURST: float = 10.0
+    
+    BULKHEAD_ENABLED: bool = True
+    BULKHEAD_READ_LIMIT: int = 20
+    BULKHEAD_WRITE_LIMIT: int = 10
+    BULKHEAD_BACKGROUND_SHARE: float = 0.5
+    
+    ADMISSION_ENABLED: bool = True
+    ADMISSION_MAX_IN_FLIGHT: int = 64
+    ADMISSION_MAX_QUEUE: int = 128
+    ADMISSION_MAX_QUEUE_WAIT: float = 2.0
+    ADMISSION_LATENCY_TARGET: Optional[float] = 1.0
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
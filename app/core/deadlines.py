@@ -0,0 +1,137 @@
+import asyncio
+import contextlib
+import math
+import time
+from contextvars import ContextVar
+from typing import Dict, Any, Optional, Iterator
+
+from fastapi import HTTPException
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import registry
+
+CLIENT_CLOSED_REQUEST = 499
+
+DEADLINE_EXCEEDED = registry.counter(
+    "wpwc_deadline_exceeded_total",
+    "Work abandoned because the request deadline had passed",
+    ("stage",)
+)
+DISCONNECT_CANCELLATIONS = registry.counter(
+    "wpwc_client_disconnect_cancellations_total",
+    "Requests whose in-flight work was cancelled because the client disconnected",
+    ("method",)
+)
+UPSTREAM_CANCELLED = registry.counter(
+    "wpwc_upstream_cancelled_total",
+    "Upstream requests cancelled before completing",
+    ("service",)
+)
+
+_deadline: ContextVar[Optional[float]] = ContextVar("wpwc_deadline", default=None)
+
+
+def parse_timeout(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        return None
+    return seconds if seconds > 0 and math.isfinite(seconds) else None
+
+
+def remaining() -> Optional[float]:
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+@contextlib.contextmanager
+def deadline_scope(seconds: Optional[float]) -> Iterator[None]:
+    if seconds is None:
+        yield
+        return
+    deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None and current <= deadline:
+        yield
+        return
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def deadline_exceeded(stage: str) -> HTTPException:
+    DEADLINE_EXCEEDED.inc(stage=stage)
+    return HTTPException(
+        status_code=504,
+        detail={
+            "error": "Deadline exceeded",
+            "details": f"The request deadline passed during {stage}"
+        }
+    )
+
+
+def check_deadline(stage: str) -> Optional[float]:
+    budget = remaining()
+    if budget is not None and budget <= 0:
+        raise deadline_exceeded(stage)
+    return budget
+
+
+class DeadlineMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        seconds = parse_timeout(Headers(scope=scope).get(settings.DEADLINE_HEADER)) or settings.DEADLINE_DEFAULT_SECONDS
+        with deadline_scope(seconds):
+            if settings.CANCEL_ON_DISCONNECT:
+                await self._run_cancellable(scope, receive, send)
+            else:
+                await self.app(scope, receive, send)
+    
+    async def _run_cancellable(self, scope: Scope, receive: Receive, send: Send) -> None:
+        messages: asyncio.Queue = asyncio.Queue(maxsize=1)
+        state: Dict[str, Any] = {"started": False, "complete": False, "disconnected": False}
+        
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                state["started"] = True
+            elif message["type"] == "http.response.body" and not message.get("more_body", False):
+                state["complete"] = True
+            await send(message)
+        
+        task = asyncio.create_task(self.app(scope, messages.get, send_wrapper))
+        
+        async def watch() -> None:
+            while True:
+                message = await receive()
+                if message["type"] == "http.disconnect":
+                    if not state["complete"] and not task.done():
+                        state["disconnected"] = True
+                        task.cancel()
+                    await messages.put(message)
+                    return
+                await messages.put(message)
+        
+        watcher = asyncio.create_task(watch())
+        try:
+            await task
+        except asyncio.CancelledError:
+            if not state["disconnected"] or not task.cancelled():
+                raise
+            DISCONNECT_CANCELLATIONS.inc(method=scope["method"])
+            if not state["started"]:
+                await send({"type": "http.response.start", "status": CLIENT_CLOSED_REQUEST, "headers": []})
+                await send({"type": "http.response.body", "body": b""})
+        finally:
+            watcher.cancel()
\ No newline at end of file
@@ -0,0 +1,75 @@
+import asyncio
+import heapq
+import tempfile
+from typing import Dict, Any, Optional, List, IO, Iterator, AsyncIterator, Callable
+
+import orjson
+
+from app.core.config import settings
+from app.core.metrics import registry
+
+EXTERNAL_SORT_RUNS = registry.counter(
+    "wpwc_external_sort_runs_total",
+    "Sorted runs spilled to disk by external sorts"
+)
+
+
+class ExternalSorter:
+    def __init__(
+        self,
+        key: Callable[[Dict[str, Any]], Any],
+        run_size: int = settings.EXTERNAL_SORT_RUN_SIZE,
+        directory: Optional[str] = settings.EXTERNAL_SORT_DIR
+    ):
+        self.key = key
+        self.run_size = max(1, run_size)
+        self.directory = directory
+        self.items = 0
+        self._buffer: List[Dict[str, Any]] = []
+        self._runs: List[IO[bytes]] = []
+    
+    @property
+    def runs(self) -> int:
+        return len(self._runs)
+    
+    def _spill(self, items: List[Dict[str, Any]]) -> IO[bytes]:
+        items.sort(key=self.key)
+        run = tempfile.TemporaryFile(mode="w+b", dir=self.directory)
+        for item in items:
+            run.write(orjson.dumps(item))
+            run.write(b"\n")
+        run.seek(0)
+        return run
+    
+    async def add(self, item: Dict[str, Any]) -> None:
+        self.items += 1
+        self._buffer.append(item)
+        if len(self._buffer) >= self.run_size:
+            items, self._buffer = self._buffer, []
+            run = await asyncio.get_running_loop().run_in_executor(None, self._spill, items)
+            self._runs.append(run)
+            EXTERNAL_SORT_RUNS.inc()
+    
+    def _read(self, run: IO[bytes]) -> Iterator[Dict[str, Any]]:
+        for line in run:
+            yield orjson.loads(line)
+    
+    async def sorted(self) -> AsyncIterator[Dict[str, Any]]:
+        self._buffer.sort(key=self.key)
+        streams = [self._read(run) for run in self._runs] + [iter(self._buffer)]
+        for index, item in enumerate(heapq.merge(*streams, key=self.key)):
+            yield item
+            if index % self.run_size == self.run_size - 1:
+                await asyncio.sleep(0)
+    
+    def close(self) -> None:
+        for run in self._runs:
+            run.close()
+        self._runs.clear()
+        self._buffer.clear()
+    
+    def __enter__(self) -> "ExternalSorter":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
\ No newline at end of file
@@ -0,0 +1,185 @@
+import asyncio
+import collections
+import time
+from typing import Dict, Any, Optional, Callable, Awaitable, Deque, Tuple
+
+import httpx
+
+from app.core.config import settings
+from app.core.loop_monitor import percentile
+from app.core.memory import cache_registry
+from app.core.metrics import registry
+
+HEDGEABLE_METHODS = ("GET", "HEAD")
+
+HEDGEABLE_REQUESTS = registry.counter(
+    "wpwc_upstream_hedgeable_requests_total",
+    "Idempotent upstream requests eligible for hedging",
+    ("service",)
+)
+HEDGES = registry.counter(
+    "wpwc_upstream_hedges_total",
+    "Hedge decisions for slow idempotent upstream requests",
+    ("service", "outcome")
+)
+HEDGE_WINS = registry.counter(
+    "wpwc_upstream_hedge_wins_total",
+    "Which request answered first once a hedge was sent",
+    ("service", "winner")
+)
+
+
+def retryable(response: httpx.Response) -> bool:
+    return response.status_code == 429 or response.status_code >= 500
+
+
+class HedgeBudget:
+    def __init__(self, ratio: float, burst: float):
+        self.ratio = ratio
+        self.burst = burst
+        self.tokens = burst
+    
+    def deposit(self) -> None:
+        self.tokens = min(self.burst, self.tokens + self.ratio)
+    
+    def withdraw(self) -> bool:
+        if self.tokens < 1.0:
+            return False
+        self.tokens -= 1.0
+        return True
+
+
+class LatencyTracker:
+    def __init__(self, window: int, fraction: float, min_samples: int, refresh_every: int = 20):
+        self.window = window
+        self.fraction = fraction
+        self.min_samples = min_samples
+        self.refresh_every = refresh_every
+        self._samples: Dict[Tuple[str, str], Deque[float]] = {}
+        self._delays: Dict[Tuple[str, str], float] = {}
+        self._since_refresh: Dict[Tuple[str, str], int] = collections.Counter()
+    
+    def record(self, key: Tuple[str, str], seconds: float) -> None:
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = collections.deque(maxlen=self.window)
+        samples.append(seconds)
+        self._since_refresh[key] += 1
+        if len(samples) >= self.min_samples and (key not in self._delays or self._since_refresh[key] >= self.refresh_every):
+            self._delays[key] = percentile(sorted(samples), self.fraction)
+            self._since_refresh[key] = 0
+    
+    def __len__(self) -> int:
+        return sum(len(samples) for samples in self._samples.values())
+    
+    def delay(self, key: Tuple[str, str]) -> Optional[float]:
+        return self._delays.get(key)
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            f"{service} {endpoint}": {
+                "samples": len(samples),
+                "delay_seconds": self._delays.get((service, endpoint))
+            }
+            for (service, endpoint), samples in sorted(self._samples.items())
+        }
+
+
+class Hedger:
+    def __init__(
+        self,
+        enabled: bool,
+        fraction: float,
+        min_delay: float,
+        max_delay: float,
+        min_samples: int,
+        budget_ratio: float,
+        budget_burst: float,
+        window: int
+    ):
+        self.enabled = enabled
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.tracker = LatencyTracker(window, fraction, min_samples)
+        self.budget = HedgeBudget(budget_ratio, budget_burst)
+    
+    def hedge_delay(self, key: Tuple[str, str]) -> Optional[float]:
+        delay = self.tracker.delay(key)
+        if delay is None:
+            return None
+        return min(max(delay, self.min_delay), self.max_delay)
+    
+    def _record(self, key: Tuple[str, str], response: httpx.Response, started: float) -> None:
+        if response.is_success:
+            self.tracker.record(key, time.perf_counter() - started)
+    
+    async def run(
+        self,
+        service: str,
+        endpoint: str,
+        attempt: Callable[[int], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        key = (service, endpoint)
+        HEDGEABLE_REQUESTS.inc(service=service)
+        self.budget.deposit()
+        delay = self.hedge_delay(key)
+        started = time.perf_counter()
+        
+        primary = asyncio.create_task(attempt(0))
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done or not self.budget.withdraw():
+                if not done:
+                    HEDGES.inc(service=service, outcome="budget_exhausted")
+                response = await primary
+                self._record(key, response, started)
+                return response
+            
+            HEDGES.inc(service=service, outcome="sent")
+            hedge = asyncio.create_task(attempt(1))
+            tasks.add(hedge)
+            pending = set(tasks)
+            fallback: Optional[httpx.Response] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                responses = [task for task in done if task.exception() is None]
+                winner = next((task for task in responses if not retryable(task.result())), None)
+                if winner is not None:
+                    HEDGE_WINS.inc(service=service, winner="hedge" if winner is hedge else "primary")
+                    self._record(key, winner.result(), started)
+                    return winner.result()
+                if responses and fallback is None:
+                    fallback = responses[0].result()
+            if fallback is not None:
+                return fallback
+            return await primary
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "percentile": self.tracker.fraction * 100,
+            "min_delay_seconds": self.min_delay,
+            "max_delay_seconds": self.max_delay,
+            "budget_tokens": round(self.budget.tokens, 3),
+            "endpoints": self.tracker.stats()
+        }
+
+
+hedger = Hedger(
+    settings.HEDGE_ENABLED,
+    settings.HEDGE_PERCENTILE / 100,
+    settings.HEDGE_MIN_DELAY,
+    settings.HEDGE_MAX_DELAY,
+    settings.HEDGE_MIN_SAMPLES,
+    settings.HEDGE_BUDGET_RATIO,
+    settings.HEDGE_BUDGET_BURST,
+    settings.HEDGE_WINDOW
+)
+
+cache_registry.register("hedging.latency_samples", lambda: len(hedger.tracker))
@@ -0,0 +1,103 @@
+import time
+import uuid
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List
+
+from app.core.config import settings
+from app.core.memory import cache_registry
+
+
+class Job:
+    def __init__(self, kind: str, job_id: Optional[str] = None, max_errors: int = 1000):
+        self.id = job_id or uuid.uuid4().hex
+        self.kind = kind
+        self.status = "running"
+        self.progress: Dict[str, Any] = {}
+        self.errors: List[Dict[str, Any]] = []
+        self.errors_dropped = 0
+        self.max_errors = max_errors
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.started_at = time.time()
+        self.finished_at: Optional[float] = None
+    
+    @property
+    def finished(self) -> bool:
+        return self.finished_at is not None
+    
+    def increment(self, key: str, amount: int = 1) -> None:
+        self.progress[key] = self.progress.get(key, 0) + amount
+    
+    def add_error(self, entry: Dict[str, Any]) -> None:
+        self.increment("errors")
+        if len(self.errors) < self.max_errors:
+            self.errors.append(entry)
+        else:
+            self.errors_dropped += 1
+    
+    def complete(self, result: Optional[Dict[str, Any]] = None) -> None:
+        self.status = "completed"
+        self.result = result
+        self.finished_at = time.time()
+    
+    def fail(self, error: str) -> None:
+        self.status = "failed"
+        self.error = error
+        self.finished_at = time.time()
+    
+    def to_dict(self, include_errors: bool = True) -> Dict[str, Any]:
+        elapsed = (self.finished_at or time.time()) - self.started_at
+        data = {
+            "id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "progress": dict(self.progress),
+            "result": self.result,
+            "error": self.error,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "elapsed_seconds": round(elapsed, 3),
+            "errors_dropped": self.errors_dropped
+        }
+        if include_errors:
+            data["errors"] = list(self.errors)
+        return data
+
+
+class JobRegistry:
+    def __init__(self, max_jobs: int = 100):
+        self.max_jobs = max_jobs
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._jobs)
+    
+    def create(self, kind: str, job_id: Optional[str] = None, max_errors: int = 1000) -> Job:
+        if job_id and job_id in self._jobs and not self._jobs[job_id].finished:
+            raise ValueError(f"Job {job_id} is already running")
+        
+        job = Job(kind, job_id=job_id, max_errors=max_errors)
+        self._jobs.pop(job.id, None)
+        self._jobs[job.id] = job
+        self._evict()
+        return job
+    
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+    
+    def list(self, kind: Optional[str] = None) -> List[Job]:
+        return [job for job in self._jobs.values() if kind is None or job.kind == kind]
+    
+    def _evict(self) -> None:
+        while len(self._jobs) > self.max_jobs:
+            for job_id, job in self._jobs.items():
+                if job.finished:
+                    del self._jobs[job_id]
+                    break
+            else:
+                return
+
+
+job_registry = JobRegistry(max_jobs=settings.JOB_HISTORY_SIZE)
+
+cache_registry.register("jobs", lambda: len(job_registry))
\ No newline at end of file
@@ -0,0 +1,92 @@
+import asyncio
+import importlib
+import logging
+import threading
+import time
+from typing import Any, Callable, List, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+WARMUP_MODES = ("background", "startup", "off")
+
+
+class LazyProxy:
+    __slots__ = ("_lazy_name", "_lazy_factory", "_lazy_instance", "_lazy_lock")
+    
+    def __init__(self, name: str, factory: Callable[[], Any]):
+        object.__setattr__(self, "_lazy_name", name)
+        object.__setattr__(self, "_lazy_factory", factory)
+        object.__setattr__(self, "_lazy_instance", None)
+        object.__setattr__(self, "_lazy_lock", threading.Lock())
+        LAZY_OBJECTS.append(self)
+    
+    def _lazy_resolve(self) -> Any:
+        instance = self._lazy_instance
+        if instance is None:
+            with self._lazy_lock:
+                instance = self._lazy_instance
+                if instance is None:
+                    instance = self._lazy_factory()
+                    object.__setattr__(self, "_lazy_instance", instance)
+        return instance
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._lazy_resolve(), name)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._lazy_resolve(), name, value)
+    
+    def __delattr__(self, name: str) -> None:
+        delattr(self._lazy_resolve(), name)
+    
+    def __reduce__(self):
+        return self._lazy_resolve().__reduce__()
+    
+    def __repr__(self) -> str:
+        if self._lazy_instance is None:
+            return f"<LazyProxy {self._lazy_name} (not initialized)>"
+        return repr(self._lazy_instance)
+
+
+LAZY_OBJECTS: List[LazyProxy] = []
+
+
+def resolve(obj: Any) -> Any:
+    return obj._lazy_resolve() if isinstance(obj, LazyProxy) else obj
+
+
+def is_initialized(obj: Any) -> bool:
+    return not isinstance(obj, LazyProxy) or obj._lazy_instance is not None
+
+
+def warm(modules: Iterable[str] = ()) -> List[str]:
+    initialized = []
+    for module in modules:
+        importlib.import_module(module)
+    for proxy in list(LAZY_OBJECTS):
+        if proxy._lazy_instance is None:
+            proxy._lazy_resolve()
+            initialized.append(proxy._lazy_name)
+    return initialized
+
+
+def _warm_logged(modules: Iterable[str]) -> None:
+    started = time.perf_counter()
+    try:
+        initialized = warm(modules)
+    except Exception:
+        logger.exception("Service warm-up failed")
+        return
+    logger.info("Warmed up %s in %.3fs", ", ".join(initialized) or "nothing", time.perf_counter() - started)
+
+
+async def warm_up(mode: str, modules: Iterable[str] = ()) -> Optional[asyncio.Future]:
+    if mode not in WARMUP_MODES:
+        raise ValueError(f"SERVICE_WARMUP must be one of {', '.join(WARMUP_MODES)}")
+    if mode == "off":
+        return None
+    future = asyncio.get_running_loop().run_in_executor(None, _warm_logged, tuple(modules))
+    if mode == "startup":
+        await future
+        return None
+    return future
\ No newline at end of file
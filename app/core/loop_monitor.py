@@ -0,0 +1,149 @@
+import asyncio
+import collections
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import Dict, Any, Optional, List, Deque
+
+from app.core.config import settings
+from app.core.memory import cache_registry
+from app.core.metrics import registry, FAST_BUCKETS
+
+logger = logging.getLogger(__name__)
+
+LOOP_LAG = registry.histogram(
+    "wpwc_event_loop_lag_seconds",
+    "Delay between when the loop monitor should have woken up and when it did",
+    buckets=FAST_BUCKETS
+)
+LOOP_STALLS = registry.counter(
+    "wpwc_event_loop_stalls_total",
+    "Times the event loop was blocked for longer than LOOP_MONITOR_THRESHOLD"
+)
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(int(round(fraction * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+class LoopLagMonitor:
+    def __init__(
+        self,
+        interval: float,
+        threshold: float,
+        window: int,
+        max_stalls: int = 20,
+        stack_limit: int = 30
+    ):
+        self.interval = interval
+        self.threshold = threshold
+        self.stack_limit = stack_limit
+        self.samples: Deque[float] = collections.deque(maxlen=window)
+        self.stalls: Deque[Dict[str, Any]] = collections.deque(maxlen=max_stalls)
+        self.max_lag = 0.0
+        self._heartbeat = time.monotonic()
+        self._reported_heartbeat: Optional[float] = None
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+    
+    async def start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._run())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-lag-watchdog", daemon=True)
+        self._watchdog.start()
+    
+    async def stop(self) -> None:
+        self._stopping.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1.0)
+            self._watchdog = None
+    
+    async def _run(self) -> None:
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            lag = max(now - expected, 0.0)
+            self._heartbeat = now
+            self.samples.append(lag)
+            self.max_lag = max(self.max_lag, lag)
+            LOOP_LAG.observe(lag)
+    
+    def _watch(self) -> None:
+        check_every = max(min(self.threshold / 2, self.interval), 0.01)
+        while not self._stopping.wait(check_every):
+            heartbeat = self._heartbeat
+            blocked_for = time.monotonic() - heartbeat - self.interval
+            if blocked_for > self.threshold and self._reported_heartbeat != heartbeat:
+                self._reported_heartbeat = heartbeat
+                self._capture(blocked_for)
+    
+    def _capture(self, blocked_for: float) -> None:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return
+        stack = traceback.format_stack(frame, limit=self.stack_limit)
+        LOOP_STALLS.inc()
+        self.stalls.append({
+            "detected_at": time.time(),
+            "blocked_for_seconds": round(blocked_for, 4),
+            "stack": [line.rstrip() for line in stack]
+        })
+        logger.warning(
+            "Event loop blocked for more than %.3fs, currently running:\n%s",
+            blocked_for,
+            "".join(stack)
+        )
+    
+    def percentiles(self) -> Dict[str, float]:
+        values = sorted(self.samples)
+        return {
+            "p50": percentile(values, 0.50),
+            "p95": percentile(values, 0.95),
+            "p99": percentile(values, 0.99)
+        }
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "interval_seconds": self.interval,
+            "threshold_seconds": self.threshold,
+            "samples": len(self.samples),
+            "lag_seconds": self.percentiles(),
+            "max_lag_seconds": self.max_lag,
+            "stalls": list(self.stalls)
+        }
+
+
+loop_monitor = LoopLagMonitor(
+    settings.LOOP_MONITOR_INTERVAL,
+    settings.LOOP_MONITOR_THRESHOLD,
+    settings.LOOP_MONITOR_WINDOW
+)
+
+cache_registry.register("loop_monitor.samples", lambda: len(loop_monitor.samples))
+
+for quantile in ("p50", "p95", "p99"):
+    registry.gauge(
+        f"wpwc_event_loop_lag_{quantile}_seconds",
+        f"Event loop lag {quantile} over the last LOOP_MONITOR_WINDOW samples",
+        function=lambda quantile=quantile: loop_monitor.percentiles()[quantile]
+    )
\ No newline at end of file
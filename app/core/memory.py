@@ -0,0 +1,266 @@
+import asyncio
+import collections
+import logging
+import os
+import sys
+import sysconfig
+import time
+import tracemalloc
+from typing import Dict, Any, Optional, List, Callable, Deque
+
+from app.core.config import settings
+from app.core.metrics import Metric, registry, _format_labels, _format_value
+
+logger = logging.getLogger(__name__)
+
+APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_ROOT = os.path.dirname(APP_ROOT)
+STDLIB_ROOT = os.path.abspath(sysconfig.get_paths()["stdlib"])
+GROUP_BY = ("area", "module", "line")
+SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>")
+)
+
+
+def module_name(filename: str) -> str:
+    if filename.startswith("<template>"):
+        return "templates"
+    path = os.path.abspath(filename)
+    if path.startswith(APP_ROOT + os.sep):
+        return os.path.splitext(os.path.relpath(path, PROJECT_ROOT))[0].replace(os.sep, ".")
+    parts = path.split(os.sep)
+    for marker in ("site-packages", "dist-packages"):
+        if marker in parts:
+            index = parts.index(marker)
+            return os.path.splitext(".".join(parts[index + 1:]))[0]
+    if path.startswith(STDLIB_ROOT + os.sep):
+        return "stdlib." + os.path.splitext(os.path.relpath(path, STDLIB_ROOT))[0].replace(os.sep, ".")
+    return filename
+
+
+def area_name(filename: str) -> str:
+    module = module_name(filename)
+    if module == "templates":
+        return module
+    if module.startswith("app."):
+        return ".".join(module.split(".")[:2])
+    if module.startswith("stdlib."):
+        return "stdlib"
+    return module.split(".")[0]
+
+
+def owner_frame(traceback: tracemalloc.Traceback) -> tracemalloc.Frame:
+    for frame in reversed(traceback):
+        if frame.filename.startswith("<template>") or os.path.abspath(frame.filename).startswith(APP_ROOT + os.sep):
+            return frame
+    return traceback[-1]
+
+
+def rss_bytes() -> Optional[int]:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+        usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return usage if sys.platform == "darwin" else usage * 1024
+    except ImportError:
+        return None
+
+
+class CacheRegistry(Metric):
+    type = "gauge"
+    
+    def __init__(self):
+        super().__init__("wpwc_cache_entries", "Entries held by internal caches and buffers", ("cache",))
+        self._caches: Dict[str, Dict[str, Callable[[], int]]] = {}
+    
+    def register(self, name: str, entries: Callable[[], int], size_bytes: Optional[Callable[[], int]] = None) -> None:
+        self._caches[name] = {"entries": entries}
+        if size_bytes is not None:
+            self._caches[name]["size_bytes"] = size_bytes
+    
+    def sizes(self) -> Dict[str, Dict[str, int]]:
+        result = {}
+        for name, probes in sorted(self._caches.items()):
+            try:
+                result[name] = {key: int(probe()) for key, probe in probes.items()}
+            except Exception as e:
+                logger.warning("Cache size probe %s failed: %s", name, e)
+        return result
+    
+    def samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, (name,))} {_format_value(sizes['entries'])}"
+            for name, sizes in self.sizes().items()
+        ]
+
+
+class MemoryProfiler:
+    def __init__(self, frames: int, max_snapshots: int, snapshot_interval: float):
+        self.frames = frames
+        self.snapshot_interval = snapshot_interval
+        self.snapshots: Deque[Dict[str, Any]] = collections.deque(maxlen=max_snapshots)
+        self.baseline: Optional[Dict[str, Any]] = None
+        self._next_id = 1
+        self._task: Optional[asyncio.Task] = None
+    
+    @property
+    def tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+    
+    def start_tracing(self, frames: Optional[int] = None) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames or self.frames)
+    
+    def stop_tracing(self) -> None:
+        tracemalloc.stop()
+        self.snapshots.clear()
+        self.baseline = None
+    
+    def take_snapshot(self, label: str = "") -> Dict[str, Any]:
+        if not tracemalloc.is_tracing():
+            raise RuntimeError("tracemalloc is not tracing; start it first")
+        snapshot = tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+        entry = {
+            "id": self._next_id,
+            "label": label,
+            "taken_at": time.time(),
+            "traced_bytes": sum(stat.size for stat in snapshot.statistics("filename")),
+            "rss_bytes": rss_bytes(),
+            "snapshot": snapshot
+        }
+        self._next_id += 1
+        self.snapshots.append(entry)
+        return entry
+    
+    def get(self, snapshot_id: Optional[int]) -> Optional[Dict[str, Any]]:
+        if snapshot_id is None:
+            return self.snapshots[-1] if self.snapshots else None
+        if self.baseline is not None and self.baseline["id"] == snapshot_id:
+            return self.baseline
+        for entry in self.snapshots:
+            if entry["id"] == snapshot_id:
+                return entry
+        return None
+    
+    def set_baseline(self, snapshot_id: Optional[int] = None) -> Dict[str, Any]:
+        entry = self.get(snapshot_id) if snapshot_id is not None else None
+        if entry is None:
+            if snapshot_id is not None:
+                raise KeyError(snapshot_id)
+            entry = self.take_snapshot("baseline")
+        self.baseline = entry
+        return entry
+    
+    def diff(
+        self,
+        snapshot_id: Optional[int] = None,
+        baseline_id: Optional[int] = None,
+        group_by: str = "area",
+        limit: int = 20
+    ) -> Dict[str, Any]:
+        baseline = self.get(baseline_id) if baseline_id is not None else self.baseline
+        if baseline is None:
+            raise KeyError("baseline" if baseline_id is None else baseline_id)
+        current = self.get(snapshot_id) if snapshot_id is not None else self.take_snapshot("diff")
+        if current is None:
+            raise KeyError(snapshot_id)
+        
+        if group_by == "line":
+            key = lambda frame: f"{module_name(frame.filename)}:{frame.lineno}"
+        elif group_by == "module":
+            key = lambda frame: module_name(frame.filename)
+        else:
+            key = lambda frame: area_name(frame.filename)
+        
+        totals: Dict[str, Dict[str, Any]] = {}
+        for stat in current["snapshot"].compare_to(baseline["snapshot"], "traceback"):
+            name = key(owner_frame(stat.traceback))
+            group = totals.setdefault(name, {"key": name, "size_diff": 0, "size": 0, "count_diff": 0, "count": 0})
+            group["size_diff"] += stat.size_diff
+            group["size"] += stat.size
+            group["count_diff"] += stat.count_diff
+            group["count"] += stat.count
+        
+        groups = list(totals.values())
+        groups.sort(key=lambda group: abs(group["size_diff"]), reverse=True)
+        return {
+            "baseline": self.describe(baseline),
+            "snapshot": self.describe(current),
+            "group_by": group_by,
+            "traced_bytes_diff": current["traced_bytes"] - baseline["traced_bytes"],
+            "rss_bytes_diff": (
+                current["rss_bytes"] - baseline["rss_bytes"]
+                if current["rss_bytes"] is not None and baseline["rss_bytes"] is not None else None
+            ),
+            "top": groups[:limit]
+        }
+    
+    def describe(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: value for key, value in entry.items() if key != "snapshot"}
+    
+    async def start(self) -> None:
+        self.start_tracing()
+        if self.snapshot_interval > 0 and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.snapshot_interval)
+            try:
+                entry = await loop.run_in_executor(None, self.take_snapshot, "periodic")
+                if self.baseline is None:
+                    self.baseline = entry
+            except Exception:
+                logger.exception("Periodic memory snapshot failed")
+    
+    def stats(self) -> Dict[str, Any]:
+        current, peak = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+        return {
+            "tracing": tracemalloc.is_tracing(),
+            "frames": tracemalloc.get_traceback_limit() if tracemalloc.is_tracing() else 0,
+            "traced_bytes": current,
+            "traced_peak_bytes": peak,
+            "rss_bytes": rss_bytes(),
+            "snapshot_interval_seconds": self.snapshot_interval,
+            "baseline": self.describe(self.baseline) if self.baseline else None,
+            "snapshots": [self.describe(entry) for entry in self.snapshots]
+        }
+
+
+cache_registry = registry.register(CacheRegistry())
+
+memory_profiler = MemoryProfiler(
+    settings.MEMORY_TRACE_FRAMES,
+    settings.MEMORY_MAX_SNAPSHOTS,
+    settings.MEMORY_SNAPSHOT_INTERVAL
+)
+
+cache_registry.register("memory.snapshots", lambda: len(memory_profiler.snapshots))
+
+registry.gauge(
+    "wpwc_process_resident_memory_bytes",
+    "Resident set size of the worker process",
+    function=lambda: rss_bytes() or 0
+)
+registry.gauge(
+    "wpwc_tracemalloc_traced_bytes",
+    "Memory currently traced by tracemalloc (0 when tracing is off)",
+    function=lambda: tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0
+)
\ No newline at end of file
@@ -0,0 +1,122 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Optional, Callable, Tuple
+
+import orjson
+from pydantic import ValidationError
+
+from app.core.config import settings
+from app.core.deadlines import check_deadline, deadline_exceeded
+from app.core.lazy import warm
+from app.core.metrics import registry
+from app.core.tracing import tracer
+
+OFFLOAD_MODES = ("inline", "process")
+WARM_MODULES = (
+    "app.services.i18n_template_service",
+    "app.api.validation",
+    "app.api.unified"
+)
+
+OFFLOAD_TASKS = registry.counter(
+    "wpwc_offload_tasks_total",
+    "CPU-bound transformations and validations by where they ran",
+    ("task", "mode")
+)
+OFFLOAD_DURATION = registry.histogram(
+    "wpwc_offload_duration_seconds",
+    "Wall time of tasks dispatched to the process pool, including pickling",
+    ("task",)
+)
+
+
+def _warm_worker(modules: Tuple[str, ...]) -> None:
+    warm(modules)
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def _invoke(func: Callable, args: Tuple[Any, ...]) -> Tuple[str, Any]:
+    try:
+        return "ok", func(*args)
+    except ValidationError as e:
+        line_errors = []
+        for error in e.errors(include_url=False):
+            line_error = {"type": error["type"], "loc": error["loc"], "input": error["input"]}
+            if error.get("ctx"):
+                line_error["ctx"] = error["ctx"]
+            line_errors.append(line_error)
+        return "validation_error", (e.title, line_errors)
+
+
+class CpuOffloader:
+    def __init__(self, mode: str, workers: Optional[int], threshold_bytes: int):
+        if mode not in OFFLOAD_MODES:
+            raise ValueError(f"OFFLOAD_MODE must be one of {', '.join(OFFLOAD_MODES)}")
+        self.mode = mode
+        self.workers = workers or os.cpu_count() or 1
+        self.threshold_bytes = threshold_bytes
+        self._pool: Optional[ProcessPoolExecutor] = None
+    
+    @property
+    def enabled(self) -> bool:
+        return self.mode == "process"
+    
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm_worker,
+                initargs=(WARM_MODULES,)
+            )
+        return self._pool
+    
+    async def start(self) -> None:
+        if not self.enabled:
+            return
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool()
+        await asyncio.gather(*[loop.run_in_executor(pool, _ping) for _ in range(self.workers)])
+    
+    async def stop(self) -> None:
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            await asyncio.get_running_loop().run_in_executor(None, pool.shutdown)
+    
+    def should_offload(self, payload: Any) -> bool:
+        if not self.enabled:
+            return False
+        try:
+            return len(orjson.dumps(payload)) >= self.threshold_bytes
+        except TypeError:
+            return False
+    
+    async def run(self, func: Callable, *args, payload: Any = None) -> Any:
+        task = func.__name__
+        budget = check_deadline("cpu_task")
+        if not self.should_offload(payload):
+            OFFLOAD_TASKS.inc(task=task, mode="inline")
+            return func(*args)
+        
+        OFFLOAD_TASKS.inc(task=task, mode="process")
+        with OFFLOAD_DURATION.time(task=task), tracer.span(f"offload.{task}", attributes={"offload.mode": "process"}):
+            future = asyncio.get_running_loop().run_in_executor(self._get_pool(), _invoke, func, args)
+            try:
+                status, value = await asyncio.wait_for(future, timeout=budget)
+            except asyncio.TimeoutError:
+                raise deadline_exceeded("cpu_task")
+        if status == "validation_error":
+            raise ValidationError.from_exception_data(*value)
+        return value
+
+
+cpu_offloader = CpuOffloader(
+    settings.OFFLOAD_MODE,
+    settings.OFFLOAD_WORKERS,
+    settings.OFFLOAD_THRESHOLD_BYTES
+)
\ No newline at end of file
@@ -0,0 +1,139 @@
+import cProfile
+import os
+import random
+import re
+import time
+import uuid
+from typing import Dict, Any, Optional, List
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+try:
+    from pyinstrument import Profiler
+    from pyinstrument.renderers import SpeedscopeRenderer
+except ImportError:
+    Profiler = None
+    SpeedscopeRenderer = None
+
+
+PROFILE_NAME = re.compile(r"^[A-Za-z0-9_.-]+$")
+TRUTHY = {"1", "true", "yes", "on"}
+
+
+class ProfileStore:
+    def __init__(self, directory: str, max_profiles: int):
+        self.directory = directory
+        self.max_profiles = max_profiles
+    
+    def _files(self) -> List[os.DirEntry]:
+        if not os.path.isdir(self.directory):
+            return []
+        entries = [entry for entry in os.scandir(self.directory) if entry.is_file()]
+        return sorted(entries, key=lambda entry: entry.stat().st_mtime)
+    
+    def new_name(self, label: str, extension: str) -> str:
+        safe_label = re.sub(r"[^A-Za-z0-9_-]+", "_", label).strip("_")[:60] or "request"
+        return f"{time.strftime('%Y%m%dT%H%M%S')}-{safe_label}-{uuid.uuid4().hex[:8]}.{extension}"
+    
+    def temp_path(self, name: str) -> str:
+        os.makedirs(self.directory, exist_ok=True)
+        return os.path.join(self.directory, f".{name}.tmp")
+    
+    def commit(self, name: str) -> None:
+        os.replace(self.temp_path(name), os.path.join(self.directory, name))
+        self._trim()
+    
+    def write(self, name: str, content: bytes) -> None:
+        with open(self.temp_path(name), "wb") as f:
+            f.write(content)
+        self.commit(name)
+    
+    def _trim(self) -> None:
+        files = self._files()
+        for entry in files[:max(len(files) - self.max_profiles, 0)]:
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass
+    
+    def list(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "name": entry.name,
+                "size": entry.stat().st_size,
+                "created_at": entry.stat().st_mtime,
+                "format": "speedscope" if entry.name.endswith(".speedscope.json") else "pstats"
+            }
+            for entry in reversed(self._files())
+            if not entry.name.startswith(".")
+        ]
+    
+    def path(self, name: str) -> Optional[str]:
+        if not PROFILE_NAME.match(name) or name.startswith("."):
+            return None
+        path = os.path.join(self.directory, name)
+        return path if os.path.isfile(path) else None
+
+
+profile_store = ProfileStore(settings.PROFILING_DIR, settings.PROFILING_MAX_PROFILES)
+
+
+class ProfilingMiddleware:
+    def __init__(self, app: ASGIApp, store: ProfileStore = profile_store):
+        self.app = app
+        self.store = store
+        self.header = settings.PROFILING_HEADER.lower()
+        self.sample_rate = settings.PROFILING_SAMPLE_RATE
+        self.interval = settings.PROFILING_INTERVAL
+        self._active = False
+    
+    def should_profile(self, scope: Scope) -> bool:
+        if self._active or scope["type"] != "http":
+            return False
+        if Headers(scope=scope).get(self.header, "").lower() in TRUTHY:
+            return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self.should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+        
+        extension = "speedscope.json" if Profiler is not None else "pstats"
+        name = self.store.new_name(f"{scope['method']}-{scope['path']}", extension)
+        
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Profile-Id"] = name
+            await send(message)
+        
+        self._active = True
+        try:
+            if Profiler is not None:
+                await self._run_pyinstrument(scope, receive, send_wrapper, name)
+            else:
+                await self._run_cprofile(scope, receive, send_wrapper, name)
+        finally:
+            self._active = False
+    
+    async def _run_pyinstrument(self, scope: Scope, receive: Receive, send: Send, name: str) -> None:
+        profiler = Profiler(interval=self.interval, async_mode="enabled")
+        profiler.start()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            profiler.stop()
+            self.store.write(name, profiler.output(renderer=SpeedscopeRenderer()).encode("utf-8"))
+    
+    async def _run_cprofile(self, scope: Scope, receive: Receive, send: Send, name: str) -> None:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            profiler.disable()
+            profiler.dump_stats(self.store.temp_path(name))
+            self.store.commit(name)
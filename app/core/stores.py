@@ -0,0 +1,192 @@
+import asyncio
+import contextlib
+from contextvars import ContextVar
+from typing import Dict, Any, Optional, List, Callable, Awaitable, Iterator
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+from starlette.datastructures import Headers, QueryParams
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.bulkheads import Bulkhead
+from app.core.config import settings
+from app.core.lazy import LazyProxy
+from app.core.responses import FastJSONResponse
+
+DEFAULT_STORE = "default"
+STORE_QUERY_PARAM = "store_id"
+
+
+class StoreConfig(BaseModel):
+    base_url: str
+    wp_username: Optional[str] = None
+    wp_app_password: Optional[str] = None
+    wp_auth_type: str = "basic"
+    wc_consumer_key: Optional[str] = None
+    wc_consumer_secret: Optional[str] = None
+    wc_auth_type: str = "basic"
+    max_connections: int = settings.STORE_MAX_CONNECTIONS
+    max_concurrency: int = settings.STORE_MAX_CONCURRENCY
+
+
+def load_store_configs() -> Dict[str, StoreConfig]:
+    configs = {
+        DEFAULT_STORE: StoreConfig(
+            base_url=settings.BASE_URL,
+            wp_username=settings.WP_USERNAME,
+            wp_app_password=settings.WP_APP_PASSWORD,
+            wp_auth_type=settings.WP_AUTH_TYPE,
+            wc_consumer_key=settings.WC_CONSUMER_KEY,
+            wc_consumer_secret=settings.WC_CONSUMER_SECRET,
+            wc_auth_type=settings.WC_AUTH_TYPE
+        )
+    }
+    for store_id, config in settings.STORES.items():
+        configs[store_id] = StoreConfig(**config)
+    return configs
+
+
+STORE_CONFIGS = load_store_configs()
+STORE_LIMITERS = {
+    store_id: Bulkhead(
+        f"store:{store_id}",
+        config.max_concurrency,
+        settings.BULKHEAD_BACKGROUND_SHARE if settings.BULKHEAD_ENABLED else 1.0
+    )
+    for store_id, config in STORE_CONFIGS.items()
+}
+
+_store: ContextVar[str] = ContextVar("wpwc_store", default=DEFAULT_STORE)
+
+
+def unknown_store(store_id: str) -> HTTPException:
+    return HTTPException(
+        status_code=404,
+        detail={
+            "error": "Unknown store",
+            "details": f"Store '{store_id}' is not configured; known stores: {', '.join(sorted(STORE_CONFIGS))}"
+        }
+    )
+
+
+def store_config(store_id: str) -> StoreConfig:
+    config = STORE_CONFIGS.get(store_id)
+    if config is None:
+        raise unknown_store(store_id)
+    return config
+
+
+def store_limiter(store_id: str) -> Bulkhead:
+    store_config(store_id)
+    return STORE_LIMITERS[store_id]
+
+
+def current_store_id() -> str:
+    return _store.get()
+
+
+@contextlib.contextmanager
+def store_scope(store_id: Optional[str]) -> Iterator[None]:
+    if store_id is None:
+        yield
+        return
+    store_config(store_id)
+    token = _store.set(store_id)
+    try:
+        yield
+    finally:
+        _store.reset(token)
+
+
+class StoreProxy(LazyProxy):
+    __slots__ = ("_store_factory", "_store_instances")
+    
+    def __init__(self, name: str, factory: Callable[[str], Any]):
+        super().__init__(name, lambda: factory(DEFAULT_STORE))
+        object.__setattr__(self, "_store_factory", factory)
+        object.__setattr__(self, "_store_instances", {})
+        STORE_PROXIES.append(self)
+    
+    def for_store(self, store_id: str) -> Any:
+        if store_id == DEFAULT_STORE:
+            return LazyProxy._lazy_resolve(self)
+        instance = self._store_instances.get(store_id)
+        if instance is None:
+            store_config(store_id)
+            with self._lazy_lock:
+                instance = self._store_instances.get(store_id)
+                if instance is None:
+                    instance = self._store_factory(store_id)
+                    self._store_instances[store_id] = instance
+        return instance
+    
+    def _lazy_resolve(self) -> Any:
+        return self.for_store(current_store_id())
+    
+    def instances(self) -> List[Any]:
+        initialized = [self._lazy_instance] if self._lazy_instance is not None else []
+        return initialized + list(self._store_instances.values())
+
+
+STORE_PROXIES: List[StoreProxy] = []
+
+
+async def close_store_clients() -> None:
+    for proxy in STORE_PROXIES:
+        for instance in proxy.instances():
+            await instance.aclose()
+
+
+async def fan_out(store_ids: List[str], operation: Callable[[], Awaitable[Any]]) -> Dict[str, Dict[str, Any]]:
+    for store_id in store_ids:
+        store_config(store_id)
+    
+    async def run(store_id: str):
+        with store_scope(store_id):
+            try:
+                return store_id, {"success": True, "data": await operation()}
+            except HTTPException as e:
+                return store_id, {"success": False, "status_code": e.status_code, "error": e.detail}
+    
+    return dict(await asyncio.gather(*(run(store_id) for store_id in dict.fromkeys(store_ids))))
+
+
+def stores_stats() -> Dict[str, Any]:
+    return {
+        store_id: {
+            "base_url": config.base_url,
+            "wp_auth_type": config.wp_auth_type,
+            "wc_auth_type": config.wc_auth_type,
+            "max_connections": config.max_connections,
+            "max_concurrency": config.max_concurrency,
+            "limiter": STORE_LIMITERS[store_id].stats()
+        }
+        for store_id, config in STORE_CONFIGS.items()
+    }
+
+
+class StoreMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        store_id = Headers(scope=scope).get(settings.STORE_HEADER)
+        if store_id is None:
+            store_id = QueryParams(scope.get("query_string", b"")).get(STORE_QUERY_PARAM)
+        if store_id is None:
+            await self.app(scope, receive, send)
+            return
+        if store_id not in STORE_CONFIGS:
+            response = FastJSONResponse({"detail": unknown_store(store_id).detail}, status_code=404)
+            await response(scope, receive, send)
+            return
+        
+        token = _store.set(store_id)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _store.reset(token)
\ No newline at end of file
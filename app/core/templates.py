@@ -0,0 +1,75 @@
+import argparse
+import hashlib
+import importlib
+import os
+import shutil
+from typing import Dict, List
+
+import jinja2
+from jinja2 import ChoiceLoader, DictLoader, Environment, ModuleLoader
+
+from app.core.config import settings
+
+TEMPLATE_MODULES = (
+    "app.services.template_service",
+    "app.services.i18n_template_service"
+)
+
+INLINE_TEMPLATES: Dict[str, Dict[str, str]] = {}
+
+
+def register_templates(namespace: str, templates: Dict[str, str]) -> None:
+    INLINE_TEMPLATES[namespace] = templates
+
+
+def source_digest(templates: Dict[str, str]) -> str:
+    digest = hashlib.sha1(jinja2.__version__.encode())
+    for name in sorted(templates):
+        digest.update(name.encode())
+        digest.update(b"\0")
+        digest.update(templates[name].encode())
+        digest.update(b"\0")
+    return digest.hexdigest()[:12]
+
+
+def compiled_path(directory: str, namespace: str) -> str:
+    return os.path.join(directory, f"{namespace}-{source_digest(INLINE_TEMPLATES[namespace])}")
+
+
+def template_environment(namespace: str) -> Environment:
+    loaders = []
+    if settings.TEMPLATES_PRECOMPILED_DIR:
+        path = compiled_path(settings.TEMPLATES_PRECOMPILED_DIR, namespace)
+        if os.path.isdir(path):
+            loaders.append(ModuleLoader(path))
+    loaders.append(DictLoader(INLINE_TEMPLATES[namespace]))
+    return Environment(loader=ChoiceLoader(loaders), autoescape=False, auto_reload=False)
+
+
+def precompile(directory: str) -> List[str]:
+    for module in TEMPLATE_MODULES:
+        importlib.import_module(module)
+    
+    if os.path.isdir(directory):
+        shutil.rmtree(directory)
+    written = []
+    for namespace, templates in sorted(INLINE_TEMPLATES.items()):
+        path = compiled_path(directory, namespace)
+        env = Environment(loader=DictLoader(templates), autoescape=False)
+        env.compile_templates(path, zip=None, ignore_errors=False)
+        written.append(path)
+    return written
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Precompile the inline Jinja templates to Python modules")
+    parser.add_argument("--output", default=settings.TEMPLATES_PRECOMPILED_DIR or "app/templates/compiled")
+    args = parser.parse_args()
+    
+    for path in precompile(args.output):
+        print(f"compiled {path}")
+
+
+if __name__ == "__main__":
+    from app.core.templates import main
+    main()
\ No newline at end of file
@@ -0,0 +1,346 @@
+import asyncio
+import contextlib
+import functools
+import json
+import logging
+import os
+import re
+import secrets
+import time
+from contextvars import ContextVar
+from typing import Dict, Any, Optional, List, Callable, Iterator, NamedTuple
+
+import httpx
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+TRACING_EXPORTERS = ("file", "otlp", "none")
+
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+
+class SpanContext(NamedTuple):
+    trace_id: str
+    span_id: str
+    sampled: bool
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[SpanContext]:
+    if not value:
+        return None
+    match = TRACEPARENT.match(value.strip().lower())
+    if match is None or set(match.group(1)) == {"0"} or set(match.group(2)) == {"0"}:
+        return None
+    return SpanContext(match.group(1), match.group(2), bool(int(match.group(3), 16) & 1))
+
+
+def _attribute_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class Span:
+    def __init__(
+        self,
+        name: str,
+        context: SpanContext,
+        parent_span_id: Optional[str],
+        kind: int,
+        attributes: Optional[Dict[str, Any]] = None
+    ):
+        self.name = name
+        self.context = context
+        self.parent_span_id = parent_span_id
+        self.kind = kind
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.status_code = STATUS_UNSET
+        self.status_message = ""
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+    
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.context.trace_id}-{self.context.span_id}-{'01' if self.context.sampled else '00'}"
+    
+    def set_attribute(self, key: str, value: Any) -> None:
+        if value is not None:
+            self.attributes[key] = value
+    
+    def set_status(self, code: int, message: str = "") -> None:
+        self.status_code = code
+        self.status_message = message
+    
+    def record_exception(self, exc: BaseException) -> None:
+        self.set_attribute("exception.type", type(exc).__name__)
+        self.set_attribute("exception.message", str(exc)[:500])
+        self.set_status(STATUS_ERROR, type(exc).__name__)
+    
+    def end(self) -> None:
+        if self.end_ns is None:
+            self.end_ns = time.time_ns()
+    
+    def to_otlp(self) -> Dict[str, Any]:
+        span = {
+            "traceId": self.context.trace_id,
+            "spanId": self.context.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or time.time_ns()),
+            "attributes": [{"key": key, "value": _attribute_value(value)} for key, value in self.attributes.items()],
+            "status": {"code": self.status_code, "message": self.status_message}
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        return span
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("wpwc_current_span", default=None)
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def otlp_payload(spans: List[Span], service_name: str) -> Dict[str, Any]:
+    return {
+        "resourceSpans": [{
+            "resource": {
+                "attributes": [
+                    {"key": "service.name", "value": {"stringValue": service_name}},
+                    {"key": "process.pid", "value": {"intValue": str(os.getpid())}}
+                ]
+            },
+            "scopeSpans": [{
+                "scope": {"name": "app.core.tracing"},
+                "spans": [span.to_otlp() for span in spans]
+            }]
+        }]
+    }
+
+
+class FileSpanExporter:
+    def __init__(self, path: str, service_name: str):
+        self.path = path
+        self.service_name = service_name
+    
+    def _write(self, line: str) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line)
+    
+    async def export(self, spans: List[Span]) -> None:
+        line = json.dumps(otlp_payload(spans, self.service_name), separators=(",", ":")) + "\n"
+        await asyncio.get_running_loop().run_in_executor(None, self._write, line)
+
+
+class OtlpHttpSpanExporter:
+    def __init__(self, endpoint: str, service_name: str, timeout: float = 10.0):
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.timeout = timeout
+    
+    async def export(self, spans: List[Span]) -> None:
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            response = await client.post(self.endpoint, json=otlp_payload(spans, self.service_name))
+            response.raise_for_status()
+
+
+class BatchSpanProcessor:
+    def __init__(self, exporter: Any, max_queue: int, batch_size: int, interval: float):
+        self.exporter = exporter
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.interval = interval
+        self.exported = 0
+        self.dropped = 0
+        self.failed = 0
+        self._queue: List[Span] = []
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+    
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+    
+    def on_end(self, span: Span) -> None:
+        if not self.running:
+            return
+        if len(self._queue) >= self.max_queue:
+            self.dropped += 1
+            return
+        self._queue.append(span)
+        if len(self._queue) >= self.batch_size:
+            self._wakeup.set()
+    
+    async def start(self) -> None:
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        while self._queue:
+            await self.flush()
+    
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            while self._queue:
+                await self.flush()
+    
+    async def flush(self) -> None:
+        batch, self._queue = self._queue[:self.batch_size], self._queue[self.batch_size:]
+        if not batch:
+            return
+        try:
+            await self.exporter.export(batch)
+            self.exported += len(batch)
+        except Exception as e:
+            self.failed += len(batch)
+            logger.warning("Exporting %d spans failed: %s", len(batch), e)
+
+
+class Tracer:
+    def __init__(self, enabled: bool, sample_ratio: float, processor: Optional[BatchSpanProcessor]):
+        self.enabled = enabled
+        self.sample_ratio = sample_ratio
+        self.processor = processor
+    
+    def _should_sample(self, trace_id: str) -> bool:
+        if self.sample_ratio >= 1.0:
+            return True
+        return int(trace_id[16:], 16) < self.sample_ratio * (1 << 64)
+    
+    @contextlib.contextmanager
+    def span(
+        self,
+        name: str,
+        kind: int = SPAN_KIND_INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None,
+        parent: Optional[SpanContext] = None
+    ) -> Iterator[Optional[Span]]:
+        if not self.enabled:
+            yield None
+            return
+        
+        if parent is None:
+            parent_span = _current_span.get()
+            parent = parent_span.context if parent_span is not None else None
+        if parent is not None:
+            context = SpanContext(parent.trace_id, secrets.token_hex(8), parent.sampled)
+        else:
+            trace_id = secrets.token_hex(16)
+            context = SpanContext(trace_id, secrets.token_hex(8), self._should_sample(trace_id))
+        
+        span = Span(name, context, parent.span_id if parent else None, kind, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_exception(e)
+            raise
+        finally:
+            span.end()
+            _current_span.reset(token)
+            if context.sampled and self.processor is not None:
+                self.processor.on_end(span)
+    
+    async def start(self) -> None:
+        if self.enabled and self.processor is not None:
+            await self.processor.start()
+    
+    async def stop(self) -> None:
+        if self.processor is not None:
+            await self.processor.stop()
+
+
+def traced(func: Callable) -> Callable:
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not tracer.enabled:
+            return func(*args, **kwargs)
+        with tracer.span(func.__qualname__):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+class TracingMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not tracer.enabled:
+            await self.app(scope, receive, send)
+            return
+        
+        method = scope["method"]
+        parent = parse_traceparent(Headers(scope=scope).get("traceparent"))
+        attributes = {"http.method": method, "http.target": scope["path"], "http.scheme": scope.get("scheme", "http")}
+        with tracer.span(f"{method} {scope['path']}", SPAN_KIND_SERVER, attributes, parent) as span:
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.status_code", message["status"])
+                    if message["status"] >= 500:
+                        span.set_status(STATUS_ERROR, f"HTTP {message['status']}")
+                    MutableHeaders(scope=message)["X-Trace-Id"] = span.context.trace_id
+                await send(message)
+            
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = scope.get("route")
+                if route is not None:
+                    span.name = f"{method} {route.path}"
+                    span.set_attribute("http.route", route.path)
+
+
+def _build_exporter() -> Optional[Any]:
+    if settings.TRACING_EXPORTER not in TRACING_EXPORTERS:
+        raise ValueError(f"TRACING_EXPORTER must be one of {', '.join(TRACING_EXPORTERS)}")
+    if settings.TRACING_EXPORTER == "file":
+        return FileSpanExporter(settings.TRACING_FILE, settings.TRACING_SERVICE_NAME)
+    if settings.TRACING_EXPORTER == "otlp":
+        return OtlpHttpSpanExporter(settings.TRACING_OTLP_ENDPOINT, settings.TRACING_SERVICE_NAME)
+    return None
+
+
+_exporter = _build_exporter()
+
+tracer = Tracer(
+    settings.TRACING_ENABLED,
+    settings.TRACING_SAMPLE_RATIO,
+    BatchSpanProcessor(
+        _exporter,
+        settings.TRACING_MAX_QUEUE,
+        settings.TRACING_BATCH_SIZE,
+        settings.TRACING_EXPORT_INTERVAL
+    ) if _exporter is not None else None
+)
\ No newline at end of file
@@ -1,6 +1,6 @@
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, PlainTextResponse
 from fastapi.templating import Jinja2Templates
 from contextlib import asynccontextmanager
 import os
@@ -8,29 +8,66 @@ from dotenv import load_dotenv
 
 from app.core.config import settings
 from app.core.scheduler import scheduler
-from app.api import unified
+from app.core.responses import FastJSONResponse
+from app.core.compression import CompressionMiddleware
+from app.core.deadlines import DeadlineMiddleware
+from app.core.metrics import MetricsMiddleware, registry
+from app.core.profiling import ProfilingMiddleware
+from app.core.loop_monitor import loop_monitor
+from app.core.offload import cpu_offloader
+from app.core.memory import memory_profiler
+from app.core.tracing import TracingMiddleware, tracer
+from app.core.lazy import warm_up
+from app.core.stores import StoreMiddleware, close_store_clients
+from app.api import unified, validation, wc, wp, bulk, jobs, analytics, stock, admin, replication
+from app.services.reconciliation_service import reconciliation_service
+from app.services.replication_service import replication_service
+from app.services.stock_buffer_service import stock_buffer
 
 load_dotenv()
 
 templates = Jinja2Templates(directory="app/templates")
 
+DEFERRED_MODULES = ("app.services.analytics_service",)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     if settings.ENABLE_SCHEDULER:
         scheduler.start()
+    if settings.LOOP_MONITOR_ENABLED:
+        await loop_monitor.start()
+    if settings.MEMORY_TRACING_ENABLED:
+        await memory_profiler.start()
+    await tracer.start()
+    await cpu_offloader.start()
+    await stock_buffer.start()
+    warmup = await warm_up(settings.SERVICE_WARMUP, DEFERRED_MODULES)
     
-    yield
-    
-    if settings.ENABLE_SCHEDULER:
-        scheduler.shutdown()
+    try:
+        yield
+    finally:
+        if warmup is not None:
+            await warmup
+        await replication_service.stop()
+        await reconciliation_service.stop()
+        await stock_buffer.stop()
+        await close_store_clients()
+        await cpu_offloader.stop()
+        await tracer.stop()
+        await memory_profiler.stop()
+        await loop_monitor.stop()
+        
+        if settings.ENABLE_SCHEDULER:
+            scheduler.shutdown()
 
 
 app = FastAPI(
     title="WP/WC Sync API",
     description="WordPress and WooCommerce synchronization API",
     version="2.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse
 )
 
 app.add_middleware(
@@ -41,7 +78,35 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(StoreMiddleware)
+
+app.add_middleware(DeadlineMiddleware)
+
+app.add_middleware(MetricsMiddleware)
+
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=settings.COMPRESSION_BROTLI_QUALITY
+)
+
+if settings.PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware)
+
+if settings.TRACING_ENABLED:
+    app.add_middleware(TracingMiddleware)
+
 app.include_router(unified.router, prefix="/api", tags=["Unified API"])
+app.include_router(validation.router, prefix="/api", tags=["Validation"])
+app.include_router(bulk.router, prefix="/api", tags=["Bulk Import"])
+app.include_router(jobs.router, prefix="/api", tags=["Jobs"])
+app.include_router(replication.router, prefix="/api", tags=["Replication"])
+app.include_router(analytics.router, prefix="/api", tags=["Analytics"])
+app.include_router(stock.router, prefix="/api", tags=["Stock"])
+app.include_router(admin.router, prefix="/admin", tags=["Admin"])
+app.include_router(wc.router, prefix="/wc", tags=["WooCommerce"])
+app.include_router(wp.router, prefix="/wp", tags=["WordPress"])
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -69,6 +134,11 @@ async def api_info():
     }
 
 
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics():
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
+
 @app.get("/health")
 async def health_check():
     return {"status": "healthy", "version": "2.0.0"}
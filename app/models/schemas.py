@@ -30,4 +30,36 @@ class PaginatedResponse(BaseModel):
 class ErrorResponse(BaseModel):
     success: bool = Field(default=False, description="Operation success status")
     error: str = Field(..., description="Error message")
-    details: Optional[Dict[str, Any]] = Field(None, description="Error details") 
\ No newline at end of file
+    details: Optional[Dict[str, Any]] = Field(None, description="Error details") 
+
+
+class StockUpdate(BaseModel):
+    product_id: int = Field(..., ge=1, description="WooCommerce product id")
+    stock_quantity: Optional[int] = Field(None, description="New stock quantity")
+    manage_stock: Optional[bool] = Field(None, description="Enable stock management")
+    stock_status: Optional[str] = Field(None, description="instock, outofstock or onbackorder")
+    regular_price: Optional[str] = Field(None, description="New regular price")
+    sale_price: Optional[str] = Field(None, description="New sale price")
+
+
+class StockUpdateRequest(BaseModel):
+    updates: List[StockUpdate] = Field(..., min_length=1, description="Stock and price updates")
+
+
+class VariationOverride(BaseModel):
+    attributes: Dict[str, str] = Field(..., description="Options a combination must have for the override to apply")
+    sku: Optional[str] = Field(None, description="Variation SKU")
+    regular_price: Optional[str] = Field(None, description="Variation regular price")
+    sale_price: Optional[str] = Field(None, description="Variation sale price")
+    stock_quantity: Optional[int] = Field(None, description="Variation stock quantity")
+    stock_status: Optional[str] = Field(None, description="instock, outofstock or onbackorder")
+    weight: Optional[str] = Field(None, description="Variation weight")
+
+
+class VariationSpec(BaseModel):
+    sku: Optional[str] = Field(None, description="Parent SKU, also the prefix of generated variation SKUs")
+    include: List[Dict[str, str]] = Field(default_factory=list, description="Only keep combinations matching one of these")
+    exclude: List[Dict[str, str]] = Field(default_factory=list, description="Drop combinations matching one of these")
+    overrides: List[VariationOverride] = Field(default_factory=list, description="Per-combination fields, later entries win")
+    regular_price: Optional[str] = Field(None, description="Default variation price, the price sent for the product if omitted")
+    stock_quantity: Optional[int] = Field(None, description="Default variation stock quantity")
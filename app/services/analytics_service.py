@@ -0,0 +1,346 @@
+import asyncio
+import time
+from typing import Dict, Any, Optional, List, Tuple
+
+import numpy as np
+
+from app.core.bulkheads import priority_scope
+from app.core.config import settings
+from app.core.memory import cache_registry
+from app.core.stores import current_store_id
+from app.services.woocommerce_service import woocommerce_service
+
+
+DIMENSIONS = ("period", "product", "status", "currency")
+PERIODS = ("day", "week", "month")
+
+
+class Categories:
+    def __init__(self):
+        self.labels: List[Any] = []
+        self.codes: Dict[Any, int] = {}
+    
+    def code(self, label: Any) -> int:
+        code = self.codes.get(label)
+        if code is None:
+            code = len(self.labels)
+            self.codes[label] = code
+            self.labels.append(label)
+        return code
+
+
+class LineItemColumns:
+    FIELDS = {
+        "order_id": np.int64,
+        "product_id": np.int64,
+        "status": np.int32,
+        "currency": np.int32,
+        "quantity": np.float64,
+        "total": np.float64
+    }
+    
+    def __init__(self):
+        self.statuses = Categories()
+        self.currencies = Categories()
+        self.arrays: Dict[str, np.ndarray] = {
+            name: np.empty(0, dtype=dtype) for name, dtype in self.FIELDS.items()
+        }
+        self.arrays["day"] = np.empty(0, dtype="datetime64[D]")
+    
+    def __len__(self) -> int:
+        return len(self.arrays["order_id"])
+    
+    def build_chunk(self, orders: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        rows: Dict[str, list] = {name: [] for name in self.FIELDS}
+        days: List[str] = []
+        for order in orders:
+            status = self.statuses.code(order.get("status") or "")
+            currency = self.currencies.code(order.get("currency") or "")
+            day = (order.get("date_created") or "")[:10] or "NaT"
+            for item in order.get("line_items") or []:
+                rows["order_id"].append(order.get("id") or 0)
+                rows["product_id"].append(item.get("product_id") or 0)
+                rows["status"].append(status)
+                rows["currency"].append(currency)
+                rows["quantity"].append(_to_float(item.get("quantity")))
+                rows["total"].append(_to_float(item.get("total")))
+                days.append(day)
+        
+        chunk = {name: np.asarray(rows[name], dtype=dtype) for name, dtype in self.FIELDS.items()}
+        chunk["day"] = np.asarray(days, dtype="datetime64[D]")
+        return chunk
+    
+    def replace(self, chunks: List[Dict[str, np.ndarray]], drop_orders: Optional[np.ndarray] = None) -> None:
+        keep = None
+        if drop_orders is not None and len(drop_orders) and len(self):
+            keep = ~np.isin(self.arrays["order_id"], drop_orders)
+        
+        for name, current in self.arrays.items():
+            parts = [current if keep is None else current[keep]]
+            parts.extend(chunk[name] for chunk in chunks)
+            self.arrays[name] = np.concatenate(parts)
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def period_start(days: np.ndarray, period: str) -> np.ndarray:
+    if period == "week":
+        offsets = (days.astype(np.int64) + 3) % 7
+        return days - offsets.astype("timedelta64[D]")
+    if period == "month":
+        return days.astype("datetime64[M]").astype("datetime64[D]")
+    return days
+
+
+class SalesDataset:
+    def __init__(self, store_id: str, chunk_orders: int, refresh_interval: float, max_cached_results: int):
+        self.store_id = store_id
+        self.columns = LineItemColumns()
+        self.chunk_orders = chunk_orders
+        self.refresh_interval = refresh_interval
+        self.max_cached_results = max_cached_results
+        self.last_modified: Optional[str] = None
+        self.loaded = False
+        self.version = 0
+        self.checked_at = 0.0
+        self.refreshed_at: Optional[float] = None
+        self._results: Dict[Tuple, Dict[str, Any]] = {}
+        self._lock = asyncio.Lock()
+    
+    async def _fetch(
+        self,
+        columns: LineItemColumns,
+        modified_after: Optional[str] = None
+    ) -> Tuple[List[Dict[str, np.ndarray]], List[int], Optional[str]]:
+        chunks: List[Dict[str, np.ndarray]] = []
+        order_ids: List[int] = []
+        batch: List[Dict[str, Any]] = []
+        last_modified = modified_after
+        
+        with priority_scope("background"):
+            async for order in woocommerce_service.for_store(self.store_id).iter_orders(modified_after=modified_after):
+                batch.append(order)
+                order_ids.append(order.get("id") or 0)
+                modified = order.get("date_modified") or order.get("date_created")
+                if modified and (last_modified is None or modified > last_modified):
+                    last_modified = modified
+                if len(batch) >= self.chunk_orders:
+                    chunks.append(columns.build_chunk(batch))
+                    batch = []
+        
+        if batch:
+            chunks.append(columns.build_chunk(batch))
+        return chunks, order_ids, last_modified
+    
+    async def refresh(self, force: bool = False) -> bool:
+        async with self._lock:
+            now = time.monotonic()
+            if self.loaded and not force and now - self.checked_at < self.refresh_interval:
+                return False
+            
+            if not self.loaded or force:
+                columns = LineItemColumns()
+                chunks, order_ids, last_modified = await self._fetch(columns)
+                columns.replace(chunks)
+                self.columns = columns
+                self.loaded = True
+            else:
+                chunks, order_ids, last_modified = await self._fetch(self.columns, modified_after=self.last_modified)
+                self.checked_at = now
+                if not order_ids:
+                    return False
+                self.columns.replace(chunks, drop_orders=np.asarray(order_ids, dtype=np.int64))
+            
+            self.last_modified = last_modified
+            self.checked_at = now
+            self.version += 1
+            self.refreshed_at = time.time()
+            self._results.clear()
+            return True
+    
+    async def aggregate(
+        self,
+        group_by: List[str],
+        period: str = "day",
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        status: Optional[List[str]] = None,
+        force_refresh: bool = False
+    ) -> Dict[str, Any]:
+        await self.refresh(force=force_refresh)
+        
+        key = (tuple(group_by), period, after, before, tuple(status or ()))
+        cached = self._results.get(key)
+        if cached is not None:
+            return {**cached, "cached": True}
+        
+        result = self._compute(group_by, period, after, before, status)
+        if len(self._results) >= self.max_cached_results:
+            self._results.pop(next(iter(self._results)))
+        self._results[key] = result
+        return {**result, "cached": False}
+    
+    def _compute(
+        self,
+        group_by: List[str],
+        period: str,
+        after: Optional[str],
+        before: Optional[str],
+        status: Optional[List[str]]
+    ) -> Dict[str, Any]:
+        columns = self.columns
+        arrays = columns.arrays
+        
+        mask = np.ones(len(columns), dtype=bool)
+        if after:
+            mask &= arrays["day"] >= np.datetime64(after[:10], "D")
+        if before:
+            mask &= arrays["day"] < np.datetime64(before[:10], "D")
+        if status:
+            codes = [columns.statuses.codes[s] for s in status if s in columns.statuses.codes]
+            mask &= np.isin(arrays["status"], np.asarray(codes, dtype=np.int32))
+        
+        order_id = arrays["order_id"][mask]
+        quantity = arrays["quantity"][mask]
+        total = arrays["total"][mask]
+        
+        dimension_values = {
+            "period": lambda: period_start(arrays["day"][mask], period),
+            "product": lambda: arrays["product_id"][mask],
+            "status": lambda: arrays["status"][mask],
+            "currency": lambda: arrays["currency"][mask]
+        }
+        
+        combined = np.zeros(len(order_id), dtype=np.int64)
+        dimension_uniques = []
+        for dimension in group_by:
+            uniques, inverse = np.unique(dimension_values[dimension](), return_inverse=True)
+            combined = combined * len(uniques) + inverse
+            dimension_uniques.append(uniques)
+        
+        groups, group_index = np.unique(combined, return_inverse=True)
+        group_count = len(groups)
+        
+        revenue = np.bincount(group_index, weights=total, minlength=group_count)
+        units = np.bincount(group_index, weights=quantity, minlength=group_count)
+        line_items = np.bincount(group_index, minlength=group_count)
+        
+        order_codes, order_inverse = np.unique(order_id, return_inverse=True)
+        group_orders = np.unique(group_index.astype(np.int64) * max(len(order_codes), 1) + order_inverse)
+        orders = np.bincount(group_orders // max(len(order_codes), 1), minlength=group_count)
+        
+        currency_codes, currency_index = np.unique(arrays["currency"][mask], return_inverse=True)
+        currency_revenue = np.bincount(currency_index, weights=total, minlength=len(currency_codes))
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            avg_order = np.where(orders > 0, revenue / np.maximum(orders, 1), 0.0)
+            avg_line = np.where(line_items > 0, revenue / np.maximum(line_items, 1), 0.0)
+        
+        decoded = {}
+        remainder = groups.copy()
+        for dimension, uniques in reversed(list(zip(group_by, dimension_uniques))):
+            codes = remainder % len(uniques)
+            remainder = remainder // len(uniques)
+            decoded[dimension] = self._labels(dimension, uniques[codes])
+        
+        rows = []
+        for i in range(group_count):
+            row = {dimension: decoded[dimension][i] for dimension in group_by}
+            row.update({
+                "revenue": round(float(revenue[i]), 2),
+                "units": float(units[i]),
+                "line_items": int(line_items[i]),
+                "orders": int(orders[i]),
+                "avg_order_revenue": round(float(avg_order[i]), 2),
+                "avg_line_revenue": round(float(avg_line[i]), 2)
+            })
+            rows.append(row)
+        
+        return {
+            "store_id": self.store_id,
+            "group_by": group_by,
+            "period": period,
+            "groups": rows,
+            "totals": {
+                "revenue": round(float(total.sum()), 2) if len(currency_codes) <= 1 else None,
+                "revenue_by_currency": {
+                    currency: round(float(amount), 2)
+                    for currency, amount in zip(self._labels("currency", currency_codes), currency_revenue)
+                },
+                "units": float(quantity.sum()),
+                "line_items": int(len(order_id)),
+                "orders": int(len(order_codes))
+            },
+            "data_version": self.version,
+            "refreshed_at": self.refreshed_at,
+            "line_items_loaded": len(columns)
+        }
+    
+    def _labels(self, dimension: str, values: np.ndarray) -> List[Any]:
+        if dimension == "period":
+            return [str(value) for value in values]
+        if dimension == "status":
+            return [self.columns.statuses.labels[code] for code in values.tolist()]
+        if dimension == "currency":
+            return [self.columns.currencies.labels[code] for code in values.tolist()]
+        return values.tolist()
+
+
+class SalesAnalyticsService:
+    def __init__(self):
+        self.chunk_orders = settings.ANALYTICS_CHUNK_ORDERS
+        self.refresh_interval = settings.ANALYTICS_REFRESH_INTERVAL
+        self.max_cached_results = settings.ANALYTICS_MAX_CACHED_RESULTS
+        self.datasets: Dict[str, SalesDataset] = {}
+    
+    def dataset(self, store_id: Optional[str] = None) -> SalesDataset:
+        store_id = store_id or current_store_id()
+        dataset = self.datasets.get(store_id)
+        if dataset is None:
+            dataset = self.datasets[store_id] = SalesDataset(
+                store_id,
+                self.chunk_orders,
+                self.refresh_interval,
+                self.max_cached_results
+            )
+        return dataset
+    
+    async def aggregate(
+        self,
+        group_by: List[str],
+        period: str = "day",
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        status: Optional[List[str]] = None,
+        force_refresh: bool = False
+    ) -> Dict[str, Any]:
+        return await self.dataset().aggregate(group_by, period, after, before, status, force_refresh)
+
+
+sales_analytics_service = SalesAnalyticsService()
+
+cache_registry.register(
+    "analytics.results",
+    lambda: sum(len(dataset._results) for dataset in sales_analytics_service.datasets.values())
+)
+cache_registry.register(
+    "analytics.line_items",
+    lambda: sum(len(dataset.columns) for dataset in sales_analytics_service.datasets.values()),
+    lambda: sum(
+        array.nbytes
+        for dataset in sales_analytics_service.datasets.values()
+        for array in dataset.columns.arrays.values()
+    )
+)
+cache_registry.register(
+    "analytics.categories",
+    lambda: sum(
+        len(dataset.columns.statuses.labels) + len(dataset.columns.currencies.labels)
+        for dataset in sales_analytics_service.datasets.values()
+    )
+)
\ No newline at end of file
@@ -0,0 +1,255 @@
+import asyncio
+import csv
+import json
+import logging
+from typing import Dict, Any, Optional, List, AsyncIterator, Tuple
+
+from fastapi import HTTPException
+from pydantic import ValidationError
+
+from app.core.config import settings
+from app.core.jobs import Job
+from app.models.i18n_schemas import I18nProductData, I18nOrderData, LanguageCode
+from app.services.woocommerce_service import woocommerce_service
+from app.services.i18n_template_service import i18n_template_service
+
+logger = logging.getLogger(__name__)
+
+LANGUAGE_CODES = {code.value for code in LanguageCode}
+
+
+class RowError(Exception):
+    def __init__(self, stage: str, errors: List[str]):
+        super().__init__("; ".join(errors))
+        self.stage = stage
+        self.errors = errors
+
+
+async def iter_lines(chunks: AsyncIterator[bytes], max_line_bytes: int) -> AsyncIterator[str]:
+    buffer = b""
+    first = True
+    async for chunk in chunks:
+        if not chunk:
+            continue
+        buffer += chunk
+        if b"\n" in chunk:
+            lines = buffer.split(b"\n")
+            buffer = lines.pop()
+            for line in lines:
+                if len(line) > max_line_bytes:
+                    raise ValueError(f"Line exceeds {max_line_bytes} bytes")
+                text = line.decode("utf-8").rstrip("\r")
+                if first:
+                    text = text.lstrip("\ufeff")
+                    first = False
+                yield text
+        if len(buffer) > max_line_bytes:
+            raise ValueError(f"Line exceeds {max_line_bytes} bytes")
+    
+    if buffer:
+        text = buffer.decode("utf-8").rstrip("\r")
+        yield text.lstrip("\ufeff") if first else text
+
+
+async def iter_ndjson_rows(lines: AsyncIterator[str]) -> AsyncIterator[Tuple[int, Any]]:
+    row_number = 0
+    async for line in lines:
+        if not line.strip():
+            continue
+        row_number += 1
+        try:
+            yield row_number, json.loads(line)
+        except ValueError as e:
+            yield row_number, RowError("parse", [f"Invalid JSON: {str(e)}"])
+
+
+async def iter_csv_records(lines: AsyncIterator[str]) -> AsyncIterator[List[str]]:
+    pending: List[str] = []
+    quotes = 0
+    async for line in lines:
+        pending.append(line)
+        quotes += line.count('"')
+        if quotes % 2:
+            continue
+        
+        record = "\n".join(pending)
+        pending = []
+        quotes = 0
+        if record.strip():
+            yield next(csv.reader([record]))
+    
+    if pending:
+        yield next(csv.reader(["\n".join(pending)]))
+
+
+def parse_csv_cell(value: str) -> Any:
+    stripped = value.strip()
+    if stripped[:1] in ("[", "{"):
+        try:
+            return json.loads(stripped)
+        except ValueError:
+            return value
+    return value
+
+
+def csv_row_to_record(header: List[str], values: List[str]) -> Dict[str, Any]:
+    record: Dict[str, Any] = {}
+    for column, value in zip(header, values):
+        if value == "":
+            continue
+        
+        path = [part for part in column.strip().split(".") if part]
+        if not path:
+            continue
+        
+        target = record
+        for part in path[:-1]:
+            target = target.setdefault(part, {})
+        
+        leaf = path[-1]
+        if leaf in LANGUAGE_CODES and len(path) > 1:
+            target[leaf] = {"translation": value}
+        else:
+            target[leaf] = parse_csv_cell(value)
+    
+    return record
+
+
+async def iter_csv_rows(lines: AsyncIterator[str]) -> AsyncIterator[Tuple[int, Any]]:
+    header: Optional[List[str]] = None
+    row_number = 0
+    async for values in iter_csv_records(lines):
+        if header is None:
+            header = values
+            continue
+        
+        row_number += 1
+        if len(values) > len(header):
+            yield row_number, RowError("parse", [f"Row has {len(values)} columns, header has {len(header)}"])
+            continue
+        yield row_number, csv_row_to_record(header, values)
+
+
+class BulkImportService:
+    ENTITIES = {
+        "product": I18nProductData,
+        "order": I18nOrderData
+    }
+    
+    def __init__(self):
+        self.max_in_flight = settings.IMPORT_MAX_IN_FLIGHT
+        self.max_line_bytes = settings.IMPORT_MAX_LINE_BYTES
+        self.progress_every = settings.IMPORT_PROGRESS_EVERY
+    
+    def iter_rows(self, chunks: AsyncIterator[bytes], file_format: str) -> AsyncIterator[Tuple[int, Any]]:
+        lines = iter_lines(chunks, self.max_line_bytes)
+        if file_format == "csv":
+            return iter_csv_rows(lines)
+        return iter_ndjson_rows(lines)
+    
+    def prepare(self, entity: str, record: Any, language: str) -> Dict[str, Any]:
+        if isinstance(record, RowError):
+            raise record
+        if not isinstance(record, dict):
+            raise RowError("parse", ["Row must be a JSON object"])
+        
+        try:
+            self.ENTITIES[entity](**record)
+        except ValidationError as e:
+            raise RowError("validation", [
+                f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}" for err in e.errors()
+            ])
+        
+        try:
+            if entity == "product":
+                return i18n_template_service.transform_to_wc_product_i18n(record, language)
+            return i18n_template_service.transform_to_wc_order_i18n(record, language)
+        except Exception as e:
+            raise RowError("transform", [str(e)])
+    
+    async def write(self, entity: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        if entity == "product":
+            return await woocommerce_service.create_product(payload)
+        return await woocommerce_service.create_order(payload)
+    
+    async def _write_row(self, entity: str, row_number: int, payload: Dict[str, Any]) -> Tuple[int, Any]:
+        try:
+            return row_number, await self.write(entity, payload)
+        except HTTPException as e:
+            return row_number, RowError("upstream", [json.dumps(e.detail, default=str)])
+        except Exception as e:
+            return row_number, RowError("upstream", [str(e)])
+    
+    def _collect(self, job: Job, done: set) -> None:
+        for task in done:
+            row_number, result = task.result()
+            if isinstance(result, RowError):
+                job.increment("rows_failed")
+                job.add_error({"row": row_number, "stage": result.stage, "errors": result.errors})
+            else:
+                job.increment("rows_written")
+    
+    async def run(
+        self,
+        job: Job,
+        chunks: AsyncIterator[bytes],
+        entity: str,
+        file_format: str,
+        language: str = "en",
+        dry_run: bool = False
+    ) -> Dict[str, Any]:
+        for key in ("rows_read", "rows_valid", "rows_failed", "rows_written", "in_flight"):
+            job.progress[key] = 0
+        
+        pending: set = set()
+        try:
+            async for row_number, record in self.iter_rows(chunks, file_format):
+                job.increment("rows_read")
+                if job.progress["rows_read"] % self.progress_every == 0:
+                    logger.info("Import %s progress: %s", job.id, job.progress)
+                
+                try:
+                    payload = self.prepare(entity, record, language)
+                except RowError as e:
+                    job.increment("rows_failed")
+                    job.add_error({"row": row_number, "stage": e.stage, "errors": e.errors})
+                    continue
+                
+                job.increment("rows_valid")
+                if dry_run:
+                    continue
+                
+                if len(pending) >= self.max_in_flight:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    self._collect(job, done)
+                    job.progress["in_flight"] = len(pending)
+                
+                pending.add(asyncio.create_task(self._write_row(entity, row_number, payload)))
+                job.progress["in_flight"] = len(pending)
+            
+            if pending:
+                done, pending = await asyncio.wait(pending)
+                self._collect(job, done)
+                job.progress["in_flight"] = 0
+        except (ValueError, UnicodeDecodeError) as e:
+            for task in pending:
+                task.cancel()
+            job.fail(f"Failed to read upload: {str(e)}")
+            return job.to_dict()
+        except BaseException:
+            for task in pending:
+                task.cancel()
+            job.fail("Import aborted")
+            raise
+        
+        job.complete({
+            "entity": entity,
+            "format": file_format,
+            "language": language,
+            "dry_run": dry_run
+        })
+        logger.info("Import %s finished: %s", job.id, job.progress)
+        return job.to_dict()
+
+
+bulk_import_service = BulkImportService()
\ No newline at end of file
@@ -0,0 +1,198 @@
+import csv
+import io
+from typing import Dict, Any, Optional, List, AsyncIterator
+
+from app.core.config import settings
+from app.services.woocommerce_service import woocommerce_service
+
+
+BILLING_FIELDS = [
+    "first_name", "last_name", "company", "address_1", "address_2",
+    "city", "state", "postcode", "country", "email", "phone"
+]
+SHIPPING_FIELDS = [
+    "first_name", "last_name", "company", "address_1", "address_2",
+    "city", "state", "postcode", "country"
+]
+
+ORDER_COLUMNS = [
+    ("order_id", "int"),
+    ("order_number", "str"),
+    ("status", "str"),
+    ("currency", "str"),
+    ("date_created", "str"),
+    ("date_modified", "str"),
+    ("payment_method", "str"),
+    ("payment_method_title", "str"),
+    ("order_total", "float"),
+    ("order_subtotal", "float"),
+    ("order_total_tax", "float"),
+    ("order_shipping_total", "float")
+] + [
+    (f"billing_{field}", "str") for field in BILLING_FIELDS
+] + [
+    (f"shipping_{field}", "str") for field in SHIPPING_FIELDS
+] + [
+    ("line_item_id", "int"),
+    ("line_item_name", "str"),
+    ("product_id", "int"),
+    ("quantity", "int"),
+    ("item_price", "float"),
+    ("item_subtotal", "float"),
+    ("item_total", "float")
+]
+
+COLUMN_NAMES = [name for name, _ in ORDER_COLUMNS]
+
+
+def flatten_order(order: Dict[str, Any]) -> List[Dict[str, Any]]:
+    billing = order.get("billing") or {}
+    shipping = order.get("shipping") or {}
+    
+    base = {
+        "order_id": order.get("id"),
+        "order_number": order.get("number"),
+        "status": order.get("status"),
+        "currency": order.get("currency"),
+        "date_created": order.get("date_created"),
+        "date_modified": order.get("date_modified"),
+        "payment_method": order.get("payment_method"),
+        "payment_method_title": order.get("payment_method_title"),
+        "order_total": order.get("total"),
+        "order_subtotal": order.get("subtotal"),
+        "order_total_tax": order.get("total_tax"),
+        "order_shipping_total": order.get("shipping_total")
+    }
+    for field in BILLING_FIELDS:
+        base[f"billing_{field}"] = billing.get(field)
+    for field in SHIPPING_FIELDS:
+        base[f"shipping_{field}"] = shipping.get(field)
+    
+    line_items = order.get("line_items") or [{}]
+    rows = []
+    for item in line_items:
+        row = dict(base)
+        row["line_item_id"] = item.get("id")
+        row["line_item_name"] = item.get("name")
+        row["product_id"] = item.get("product_id")
+        row["quantity"] = item.get("quantity")
+        row["item_price"] = item.get("price")
+        row["item_subtotal"] = item.get("subtotal")
+        row["item_total"] = item.get("total")
+        rows.append(row)
+    return rows
+
+
+def _coerce(value: Any, kind: str) -> Any:
+    if value is None or value == "":
+        return None
+    try:
+        if kind == "int":
+            return int(value)
+        if kind == "float":
+            return float(value)
+    except (TypeError, ValueError):
+        return None
+    return str(value)
+
+
+class _ChunkSink(io.RawIOBase):
+    def __init__(self):
+        super().__init__()
+        self._chunks: List[bytes] = []
+        self._position = 0
+    
+    def writable(self) -> bool:
+        return True
+    
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+    
+    def tell(self) -> int:
+        return self._position
+    
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+class ExportService:
+    def __init__(self):
+        self.csv_chunk_rows = settings.EXPORT_CSV_CHUNK_ROWS
+        self.parquet_row_group_size = settings.EXPORT_PARQUET_ROW_GROUP_SIZE
+    
+    def parquet_available(self) -> bool:
+        try:
+            import pyarrow
+        except ImportError:
+            return False
+        return True
+    
+    async def iter_order_rows(
+        self,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        status: Optional[List[str]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        async for order in woocommerce_service.iter_orders(after=after, before=before, status=status):
+            for row in flatten_order(order):
+                yield row
+    
+    async def stream_orders_csv(self, **filters) -> AsyncIterator[bytes]:
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=COLUMN_NAMES, extrasaction="ignore")
+        writer.writeheader()
+        
+        pending = 0
+        async for row in self.iter_order_rows(**filters):
+            writer.writerow(row)
+            pending += 1
+            if pending >= self.csv_chunk_rows:
+                yield buffer.getvalue().encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate(0)
+                pending = 0
+        
+        yield buffer.getvalue().encode("utf-8")
+    
+    async def stream_orders_parquet(self, **filters) -> AsyncIterator[bytes]:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        types = {"int": pa.int64(), "float": pa.float64(), "str": pa.string()}
+        schema = pa.schema([(name, types[kind]) for name, kind in ORDER_COLUMNS])
+        
+        sink = _ChunkSink()
+        writer = pq.ParquetWriter(sink, schema, compression="zstd")
+        columns: Dict[str, List[Any]] = {name: [] for name in COLUMN_NAMES}
+        pending = 0
+        
+        def write_row_group() -> bytes:
+            table = pa.Table.from_pydict(columns, schema=schema)
+            writer.write_table(table)
+            for values in columns.values():
+                values.clear()
+            return sink.drain()
+        
+        try:
+            async for row in self.iter_order_rows(**filters):
+                for name, kind in ORDER_COLUMNS:
+                    columns[name].append(_coerce(row.get(name), kind))
+                pending += 1
+                if pending >= self.parquet_row_group_size:
+                    yield write_row_group()
+                    pending = 0
+            
+            if pending:
+                yield write_row_group()
+        finally:
+            writer.close()
+        
+        yield sink.drain()
+
+
+export_service = ExportService()
\ No newline at end of file
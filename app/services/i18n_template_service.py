@@ -1,36 +1,16 @@
+import json
 import os
 from typing import Dict, Any, Optional
-from jinja2 import Environment, FileSystemLoader, Template
+from jinja2 import Environment, FileSystemLoader
+from app.core.lazy import LazyProxy, is_initialized, resolve
+from app.core.memory import cache_registry
+from app.core.metrics import timed_transform
+from app.core.templates import register_templates, template_environment
+from app.core.tracing import traced
 from app.models.i18n_schemas import I18nData, LanguageCode
 
 
-class I18nTemplateService:
-    def __init__(self):
-        template_dir = os.path.join(os.path.dirname(__file__), "..", "templates")
-        self.env = Environment(
-            loader=FileSystemLoader(template_dir),
-            autoescape=False,
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
-    
-    def extract_i18n_data(self, data: Dict[str, Any]) -> Dict[str, I18nData]:
-        i18n_data = {}
-        
-        for key, value in data.items():
-            if isinstance(value, dict) and any(lang in value for lang in ['en', 'fr', 'de', 'it', 'es']):
-                i18n_data[key] = I18nData(**value)
-            elif isinstance(value, str):
-                i18n_data[key] = I18nData(
-                    en={"translation": value, "notes": f"Auto-generated for {key}"}
-                )
-        
-        return i18n_data
-    
-    def transform_to_wc_product_i18n(self, client_data: Dict[str, Any], language: str = "en") -> Dict[str, Any]:
-        i18n_data = self.extract_i18n_data(client_data)
-        
-        template_content = """
+WC_PRODUCT_TEMPLATE = """
 {
     "name": "{{ i18n_data.get('name', {}).get_translation(language) if i18n_data.get('name') else client_data.get('name', 'Product') }}",
     "type": "{{ client_data.get('type', 'simple') }}",
@@ -71,21 +51,8 @@ class I18nTemplateService:
     "weight": "{{ client_data.get('weight', '0') }}"
 }
         """
-        
-        template = Template(template_content)
-        rendered = template.render(
-            client_data=client_data,
-            i18n_data=i18n_data,
-            language=language
-        )
-        
-        import json
-        return json.loads(rendered)
-    
-    def transform_to_wc_order_i18n(self, client_data: Dict[str, Any], language: str = "en") -> Dict[str, Any]:
-        i18n_data = self.extract_i18n_data(client_data)
-        
-        template_content = """
+
+WC_ORDER_TEMPLATE = """
 {
     "payment_method": "{{ client_data.get('payment_method', 'bacs') }}",
     "payment_method_title": "{{ i18n_data.get('payment_method_title', {}).get_translation(language) if i18n_data.get('payment_method_title') else client_data.get('payment_method_title', 'Bank transfer') }}",
@@ -124,21 +91,8 @@ class I18nTemplateService:
     ]
 }
         """
-        
-        template = Template(template_content)
-        rendered = template.render(
-            client_data=client_data,
-            i18n_data=i18n_data,
-            language=language
-        )
-        
-        import json
-        return json.loads(rendered)
-    
-    def transform_to_wp_post_i18n(self, client_data: Dict[str, Any], language: str = "en") -> Dict[str, Any]:
-        i18n_data = self.extract_i18n_data(client_data)
-        
-        template_content = """
+
+WP_POST_TEMPLATE = """
 {
     "title": "{{ i18n_data.get('title', {}).get_translation(language) if i18n_data.get('title') else client_data.get('title', client_data.get('name', 'Post')) }}",
     "content": "{{ i18n_data.get('content', {}).get_translation(language) if i18n_data.get('content') else client_data.get('content', client_data.get('description', '')) }}",
@@ -162,16 +116,94 @@ class I18nTemplateService:
     }
 }
         """
+
+
+register_templates("i18n_templates", {
+    "wc_product.json": WC_PRODUCT_TEMPLATE,
+    "wc_order.json": WC_ORDER_TEMPLATE,
+    "wp_post.json": WP_POST_TEMPLATE
+})
+
+
+class I18nTemplateService:
+    def __init__(self):
+        template_dir = os.path.join(os.path.dirname(__file__), "..", "templates")
+        self.env = Environment(
+            loader=FileSystemLoader(template_dir),
+            autoescape=False,
+            trim_blocks=True,
+            lstrip_blocks=True
+        )
+        self.inline_env = template_environment("i18n_templates")
+        self.wc_product_template = self.inline_env.get_template("wc_product.json")
+        self.wc_order_template = self.inline_env.get_template("wc_order.json")
+        self.wp_post_template = self.inline_env.get_template("wp_post.json")
+    
+    def __reduce__(self):
+        return (get_i18n_template_service, ())
+    
+    @traced
+    def extract_i18n_data(self, data: Dict[str, Any]) -> Dict[str, I18nData]:
+        i18n_data = {}
         
-        template = Template(template_content)
-        rendered = template.render(
+        for key, value in data.items():
+            if isinstance(value, dict) and any(lang in value for lang in ['en', 'fr', 'de', 'it', 'es']):
+                i18n_data[key] = I18nData(**value)
+            elif isinstance(value, str):
+                i18n_data[key] = I18nData(
+                    en={"translation": value, "notes": f"Auto-generated for {key}"}
+                )
+        
+        return i18n_data
+    
+    @traced
+    @timed_transform
+    def transform_to_wc_product_i18n(self, client_data: Dict[str, Any], language: str = "en") -> Dict[str, Any]:
+        i18n_data = self.extract_i18n_data(client_data)
+        
+        rendered = self.wc_product_template.render(
             client_data=client_data,
             i18n_data=i18n_data,
             language=language
         )
         
-        import json
         return json.loads(rendered)
+    
+    @traced
+    @timed_transform
+    def transform_to_wc_order_i18n(self, client_data: Dict[str, Any], language: str = "en") -> Dict[str, Any]:
+        i18n_data = self.extract_i18n_data(client_data)
+        
+        rendered = self.wc_order_template.render(
+            client_data=client_data,
+            i18n_data=i18n_data,
+            language=language
+        )
+        
+        return json.loads(rendered)
+    
+    @traced
+    @timed_transform
+    def transform_to_wp_post_i18n(self, client_data: Dict[str, Any], language: str = "en") -> Dict[str, Any]:
+        i18n_data = self.extract_i18n_data(client_data)
+        
+        rendered = self.wp_post_template.render(
+            client_data=client_data,
+            i18n_data=i18n_data,
+            language=language
+        )
+        
+        return json.loads(rendered)
+
+
+i18n_template_service = LazyProxy("i18n_template_service", I18nTemplateService)
+
+cache_registry.register(
+    "i18n_templates.jinja_cache",
+    lambda: len(i18n_template_service.env.cache or {}) + len(i18n_template_service.inline_env.cache or {}) if is_initialized(i18n_template_service) else 0
+)
 
 
-i18n_template_service = I18nTemplateService() 
\ No newline at end of file
+def get_i18n_template_service() -> I18nTemplateService:
+    return resolve(i18n_template_service)
+ 
\ No newline at end of file
@@ -0,0 +1,290 @@
+import asyncio
+import contextvars
+import logging
+import time
+from typing import Dict, Any, Optional, List, AsyncIterator, Iterator
+
+from fastapi import HTTPException
+
+from app.core.bulkheads import priority_scope
+from app.core.config import settings
+from app.core.external_sort import ExternalSorter
+from app.core.jobs import Job, job_registry
+from app.core.metrics import registry
+from app.services.bulk_import_service import RowError, iter_csv_rows, iter_lines
+from app.services.replication_service import merge_join, sku_key, unique_skus
+from app.services.woocommerce_service import woocommerce_service
+
+logger = logging.getLogger(__name__)
+
+RECONCILE_FIELDS = ["id", "sku", "stock_quantity"]
+
+RECONCILIATION_ITEMS = registry.counter(
+    "wpwc_reconciliation_items_total",
+    "SKUs handled by inventory reconciliation",
+    ("outcome",)
+)
+
+
+def parse_quantity(value: Any) -> Optional[int]:
+    try:
+        quantity = float(str(value).strip())
+    except ValueError:
+        return None
+    return int(quantity) if quantity.is_integer() else None
+
+
+class ReconciliationService:
+    def __init__(self):
+        self.max_line_bytes = settings.IMPORT_MAX_LINE_BYTES
+        self.batch_size = settings.RECONCILE_BATCH_SIZE
+        self.max_in_flight = settings.RECONCILE_MAX_IN_FLIGHT
+        self.report_limit = settings.RECONCILE_REPORT_LIMIT
+        self.max_pending_variations = max(1, settings.RECONCILE_MAX_PENDING_VARIATIONS)
+        self._tasks: set = set()
+    
+    def create_job(self, job_id: Optional[str] = None) -> Job:
+        try:
+            return job_registry.create("reconciliation", job_id=job_id, max_errors=settings.IMPORT_MAX_ERRORS_REPORTED)
+        except ValueError as e:
+            raise HTTPException(status_code=409, detail={"error": str(e)})
+    
+    async def spool(
+        self,
+        job: Job,
+        chunks: AsyncIterator[bytes],
+        sku_column: str = "sku",
+        quantity_column: str = "quantity"
+    ) -> ExternalSorter:
+        for key in ("file_rows", "file_invalid"):
+            job.progress[key] = 0
+        sorter = ExternalSorter(sku_key)
+        try:
+            async for row_number, record in iter_csv_rows(iter_lines(chunks, self.max_line_bytes)):
+                job.increment("file_rows")
+                if isinstance(record, RowError):
+                    job.increment("file_invalid")
+                    job.add_error({"row": row_number, "stage": record.stage, "errors": record.errors})
+                    continue
+                
+                sku = str(record.get(sku_column, "")).strip()
+                quantity = parse_quantity(record.get(quantity_column, ""))
+                if not sku or quantity is None:
+                    job.increment("file_invalid")
+                    job.add_error({
+                        "row": row_number,
+                        "stage": "parse",
+                        "errors": [f"Row needs a '{sku_column}' and an integer '{quantity_column}'"]
+                    })
+                    continue
+                await sorter.add({"sku": sku, "quantity": quantity, "row": row_number})
+        except (ValueError, UnicodeDecodeError) as e:
+            sorter.close()
+            job.fail(f"Failed to read upload: {str(e)}")
+            raise HTTPException(status_code=400, detail={"error": "Invalid stock file", "details": str(e)})
+        except BaseException:
+            sorter.close()
+            job.fail("Reconciliation aborted")
+            raise
+        job.progress["file_runs"] = sorter.runs
+        return sorter
+    
+    def start(self, job: Job, sorter: ExternalSorter, store_id: str, apply: bool = False) -> None:
+        task = asyncio.create_task(self.run(job, sorter, store_id, apply), context=contextvars.Context())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def stop(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+    
+    async def _add_shop_item(self, sorter: ExternalSorter, job: Job, item: Dict[str, Any]) -> None:
+        job.increment("shop_read")
+        if not item.get("sku"):
+            job.increment("shop_missing_sku")
+            return
+        await sorter.add(item)
+    
+    async def _load_variations(self, store_id: str, job: Job, sorter: ExternalSorter, parents: Iterator[int]) -> None:
+        service = woocommerce_service.for_store(store_id)
+        for parent_id in parents:
+            async for variation in service.iter_variations(parent_id, fields=RECONCILE_FIELDS):
+                job.increment("shop_variations")
+                await self._add_shop_item(sorter, job, {**variation, "parent_id": parent_id})
+    
+    async def _load_shop(self, store_id: str, job: Job) -> ExternalSorter:
+        sorter = ExternalSorter(sku_key)
+        parents: List[int] = []
+        try:
+            async for product in woocommerce_service.for_store(store_id).iter_products(fields=[*RECONCILE_FIELDS, "type"]):
+                if product.pop("type", None) == "variable":
+                    parents.append(product["id"])
+                await self._add_shop_item(sorter, job, product)
+            
+            job.progress["shop_variable_products"] = len(parents)
+            remaining = iter(parents)
+            workers = [
+                asyncio.create_task(self._load_variations(store_id, job, sorter, remaining))
+                for _ in range(min(self.max_in_flight, len(parents)))
+            ]
+            try:
+                for worker in asyncio.as_completed(workers):
+                    await worker
+            finally:
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+        except BaseException:
+            sorter.close()
+            raise
+        job.progress["shop_runs"] = sorter.runs
+        return sorter
+    
+    async def _write_batch(
+        self,
+        store_id: str,
+        job: Job,
+        updates: List[Dict[str, Any]],
+        parent_id: Optional[int] = None
+    ) -> None:
+        service = woocommerce_service.for_store(store_id)
+        try:
+            if parent_id is None:
+                result = await service.batch_update_products(updates)
+            else:
+                result = await service.batch_update_variations(parent_id, updates)
+        except HTTPException as e:
+            job.increment("failed", len(updates))
+            RECONCILIATION_ITEMS.inc(len(updates), outcome="failed")
+            job.add_error({
+                "stage": "batch",
+                "products": len(updates),
+                "parent_id": parent_id,
+                "status_code": e.status_code,
+                "error": e.detail
+            })
+            return
+        
+        for product in result["update"]:
+            if product.get("error"):
+                job.increment("failed")
+                RECONCILIATION_ITEMS.inc(outcome="failed")
+                job.add_error({"stage": "update", "id": product.get("id"), "parent_id": parent_id, "error": product["error"]})
+            else:
+                job.increment("corrected")
+                RECONCILIATION_ITEMS.inc(outcome="corrected")
+    
+    async def _submit(
+        self,
+        pending: set,
+        store_id: str,
+        job: Job,
+        updates: List[Dict[str, Any]],
+        parent_id: Optional[int] = None
+    ) -> set:
+        if len(pending) >= self.max_in_flight:
+            _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        pending.add(asyncio.create_task(self._write_batch(store_id, job, updates, parent_id)))
+        return pending
+    
+    async def run(self, job: Job, file_sorter: ExternalSorter, store_id: str, apply: bool = False) -> Dict[str, Any]:
+        for key in ("shop_read", "matched", "mismatched", "missing_in_shop", "missing_in_file"):
+            job.progress[key] = 0
+        started = time.perf_counter()
+        shop_sorter: Optional[ExternalSorter] = None
+        mismatches: List[Dict[str, Any]] = []
+        missing_in_shop: List[Dict[str, Any]] = []
+        pending: set = set()
+        try:
+            with priority_scope("background"):
+                shop_sorter = await self._load_shop(store_id, job)
+                scanned = time.perf_counter()
+                
+                batches: Dict[Optional[int], List[Dict[str, Any]]] = {}
+                pending_variations = 0
+                async for item, product in merge_join(
+                    unique_skus(file_sorter.sorted(), job, "file"),
+                    unique_skus(shop_sorter.sorted(), job, "shop")
+                ):
+                    if product is None:
+                        job.increment("missing_in_shop")
+                        RECONCILIATION_ITEMS.inc(outcome="missing_in_shop")
+                        if len(missing_in_shop) < self.report_limit:
+                            missing_in_shop.append({"sku": item["sku"], "row": item["row"]})
+                        continue
+                    if item is None:
+                        job.increment("missing_in_file")
+                        RECONCILIATION_ITEMS.inc(outcome="missing_in_file")
+                        continue
+                    if product.get("stock_quantity") == item["quantity"]:
+                        job.increment("matched")
+                        RECONCILIATION_ITEMS.inc(outcome="matched")
+                        continue
+                    
+                    job.increment("mismatched")
+                    RECONCILIATION_ITEMS.inc(outcome="mismatched")
+                    parent_id = product.get("parent_id")
+                    if len(mismatches) < self.report_limit:
+                        mismatch = {
+                            "sku": item["sku"],
+                            "id": product["id"],
+                            "row": item["row"],
+                            "shop_quantity": product.get("stock_quantity"),
+                            "file_quantity": item["quantity"]
+                        }
+                        if parent_id is not None:
+                            mismatch["parent_id"] = parent_id
+                        mismatches.append(mismatch)
+                    if not apply:
+                        continue
+                    
+                    update = {"id": product["id"], "stock_quantity": item["quantity"]}
+                    if product.get("stock_quantity") is None:
+                        update["manage_stock"] = True
+                    batch = batches.setdefault(parent_id, [])
+                    batch.append(update)
+                    if parent_id is not None:
+                        pending_variations += 1
+                    if len(batch) < self.batch_size and pending_variations < self.max_pending_variations:
+                        continue
+                    if len(batch) < self.batch_size:
+                        parent_id = max((key for key in batches if key is not None), key=lambda key: len(batches[key]))
+                    flushed = batches.pop(parent_id)
+                    if parent_id is not None:
+                        pending_variations -= len(flushed)
+                    pending = await self._submit(pending, store_id, job, flushed, parent_id)
+                
+                for parent_id, batch in batches.items():
+                    pending = await self._submit(pending, store_id, job, batch, parent_id)
+                if pending:
+                    await asyncio.wait(pending)
+                    pending = set()
+        except asyncio.CancelledError:
+            for task in pending:
+                task.cancel()
+            job.fail("Reconciliation cancelled")
+            raise
+        except Exception as e:
+            for task in pending:
+                task.cancel()
+            logger.exception("Reconciliation %s failed", job.id)
+            job.fail(str(e.detail) if isinstance(e, HTTPException) else str(e))
+            return job.to_dict()
+        finally:
+            file_sorter.close()
+            if shop_sorter is not None:
+                shop_sorter.close()
+        
+        job.complete({
+            "store_id": store_id,
+            "apply": apply,
+            "shop_scan_seconds": round(scanned - started, 3),
+            "mismatches": mismatches,
+            "missing_in_shop": missing_in_shop
+        })
+        logger.info("Reconciliation %s finished: %s", job.id, job.progress)
+        return job.to_dict()
+
+
+reconciliation_service = ReconciliationService()
\ No newline at end of file
@@ -0,0 +1,265 @@
+import asyncio
+import contextvars
+import logging
+import time
+from typing import Dict, Any, Optional, List, AsyncIterator, Tuple
+
+from fastapi import HTTPException
+
+from app.core.bulkheads import priority_scope
+from app.core.config import settings
+from app.core.external_sort import ExternalSorter
+from app.core.jobs import Job, job_registry
+from app.core.metrics import registry
+from app.core.stores import store_config
+from app.services.woocommerce_service import woocommerce_service
+
+logger = logging.getLogger(__name__)
+
+REPLICATED_FIELDS = (
+    "name", "type", "status", "featured", "catalog_visibility",
+    "description", "short_description", "regular_price", "sale_price",
+    "tax_status", "tax_class", "manage_stock", "stock_quantity", "stock_status",
+    "backorders", "weight", "dimensions", "shipping_class", "menu_order"
+)
+BATCH_ACTIONS = ("create", "update", "delete")
+
+REPLICATION_PRODUCTS = registry.counter(
+    "wpwc_replication_products_total",
+    "Products handled by catalog replication",
+    ("outcome",)
+)
+REPLICATION_BATCH_DURATION = registry.histogram(
+    "wpwc_replication_batch_duration_seconds",
+    "Duration of replication batch writes to the target store"
+)
+
+
+def sku_key(product: Dict[str, Any]) -> str:
+    return product.get("sku") or ""
+
+
+def changed_fields(source: Dict[str, Any], target: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        field: source[field]
+        for field in REPLICATED_FIELDS
+        if field in source and source[field] != target.get(field)
+    }
+
+
+async def unique_skus(products: AsyncIterator[Dict[str, Any]], job: Job, side: str) -> AsyncIterator[Dict[str, Any]]:
+    previous = None
+    async for product in products:
+        sku = product["sku"]
+        if sku == previous:
+            job.increment(f"{side}_duplicate_skus")
+            job.add_error({"store": side, "sku": sku, "id": product.get("id"), "stage": "duplicate_sku"})
+            continue
+        previous = sku
+        yield product
+
+
+async def merge_join(
+    source: AsyncIterator[Dict[str, Any]],
+    target: AsyncIterator[Dict[str, Any]]
+) -> AsyncIterator[Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]]:
+    source_item = await anext(source, None)
+    target_item = await anext(target, None)
+    while source_item is not None or target_item is not None:
+        if target_item is None or (source_item is not None and source_item["sku"] < target_item["sku"]):
+            yield source_item, None
+            source_item = await anext(source, None)
+        elif source_item is None or target_item["sku"] < source_item["sku"]:
+            yield None, target_item
+            target_item = await anext(target, None)
+        else:
+            yield source_item, target_item
+            source_item = await anext(source, None)
+            target_item = await anext(target, None)
+
+
+class ReplicationService:
+    def __init__(self):
+        self.batch_size = settings.REPLICATION_BATCH_SIZE
+        self.max_in_flight = settings.REPLICATION_MAX_IN_FLIGHT
+        self.report_limit = settings.REPLICATION_REPORT_LIMIT
+        self._tasks: set = set()
+    
+    def start(
+        self,
+        source_store: str,
+        target_store: str,
+        dry_run: bool = False,
+        delete_missing: bool = False,
+        job_id: Optional[str] = None
+    ) -> Job:
+        store_config(source_store)
+        store_config(target_store)
+        if source_store == target_store:
+            raise HTTPException(
+                status_code=400,
+                detail={"error": "Invalid replication", "details": "Source and target store must differ"}
+            )
+        try:
+            job = job_registry.create("replication", job_id=job_id, max_errors=settings.IMPORT_MAX_ERRORS_REPORTED)
+        except ValueError as e:
+            raise HTTPException(status_code=409, detail={"error": str(e)})
+        
+        task = asyncio.create_task(
+            self.run(job, source_store, target_store, dry_run, delete_missing),
+            context=contextvars.Context()
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+    
+    async def stop(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+    
+    async def _load(self, store_id: str, job: Job, side: str) -> ExternalSorter:
+        sorter = ExternalSorter(sku_key)
+        try:
+            service = woocommerce_service.for_store(store_id)
+            async for product in service.iter_products(fields=["id", "sku", *REPLICATED_FIELDS]):
+                job.increment(f"{side}_read")
+                if not product.get("sku"):
+                    job.increment(f"{side}_missing_sku")
+                    continue
+                await sorter.add(product)
+        except BaseException:
+            sorter.close()
+            raise
+        job.progress[f"{side}_runs"] = sorter.runs
+        return sorter
+    
+    def _record_change(
+        self,
+        job: Job,
+        changes: List[Dict[str, Any]],
+        action: str,
+        sku: str,
+        fields: Optional[List[str]] = None
+    ) -> None:
+        job.increment(f"to_{action}")
+        REPLICATION_PRODUCTS.inc(outcome=f"to_{action}")
+        if len(changes) < self.report_limit:
+            entry: Dict[str, Any] = {"action": action, "sku": sku}
+            if fields is not None:
+                entry["fields"] = fields
+            changes.append(entry)
+    
+    async def _write_batch(self, target_store: str, job: Job, batch: Dict[str, List[Any]]) -> None:
+        started = time.perf_counter()
+        try:
+            result = await woocommerce_service.for_store(target_store).batch_products(**batch)
+        except HTTPException as e:
+            count = sum(len(items) for items in batch.values())
+            job.increment("failed", count)
+            REPLICATION_PRODUCTS.inc(count, outcome="failed")
+            job.add_error({"stage": "batch", "products": count, "status_code": e.status_code, "error": e.detail})
+            return
+        finally:
+            REPLICATION_BATCH_DURATION.observe(time.perf_counter() - started)
+        
+        for action, done in (("create", "created"), ("update", "updated"), ("delete", "deleted")):
+            for product in result[action]:
+                if product.get("error"):
+                    job.increment("failed")
+                    REPLICATION_PRODUCTS.inc(outcome="failed")
+                    job.add_error({"stage": action, "id": product.get("id"), "sku": product.get("sku"), "error": product["error"]})
+                else:
+                    job.increment(done)
+                    REPLICATION_PRODUCTS.inc(outcome=done)
+    
+    async def run(
+        self,
+        job: Job,
+        source_store: str,
+        target_store: str,
+        dry_run: bool = False,
+        delete_missing: bool = False
+    ) -> Dict[str, Any]:
+        for key in ("source_read", "target_read", "compared", "unchanged", "to_create", "to_update", "to_delete"):
+            job.progress[key] = 0
+        started = time.perf_counter()
+        sorters: List[ExternalSorter] = []
+        changes: List[Dict[str, Any]] = []
+        pending: set = set()
+        try:
+            with priority_scope("background"):
+                loads = await asyncio.gather(
+                    self._load(source_store, job, "source"),
+                    self._load(target_store, job, "target"),
+                    return_exceptions=True
+                )
+                sorters = [load for load in loads if isinstance(load, ExternalSorter)]
+                for load in loads:
+                    if isinstance(load, BaseException):
+                        raise load
+                loaded = time.perf_counter()
+                source, target = (unique_skus(sorter.sorted(), job, side) for sorter, side in zip(sorters, ("source", "target")))
+                
+                batch: Dict[str, List[Any]] = {action: [] for action in BATCH_ACTIONS}
+                async for source_item, target_item in merge_join(source, target):
+                    job.increment("compared")
+                    if target_item is None:
+                        self._record_change(job, changes, "create", source_item["sku"])
+                        batch["create"].append({key: value for key, value in source_item.items() if key != "id"})
+                    elif source_item is None:
+                        if not delete_missing:
+                            continue
+                        self._record_change(job, changes, "delete", target_item["sku"])
+                        batch["delete"].append(target_item["id"])
+                    else:
+                        fields = changed_fields(source_item, target_item)
+                        if not fields:
+                            job.increment("unchanged")
+                            continue
+                        self._record_change(job, changes, "update", source_item["sku"], sorted(fields))
+                        batch["update"].append({"id": target_item["id"], **fields})
+                    
+                    if dry_run or sum(len(items) for items in batch.values()) < self.batch_size:
+                        continue
+                    if len(pending) >= self.max_in_flight:
+                        _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    pending.add(asyncio.create_task(self._write_batch(target_store, job, batch)))
+                    batch = {action: [] for action in BATCH_ACTIONS}
+                
+                if not dry_run and any(batch.values()):
+                    pending.add(asyncio.create_task(self._write_batch(target_store, job, batch)))
+                if pending:
+                    await asyncio.wait(pending)
+                    pending = set()
+        except asyncio.CancelledError:
+            for task in pending:
+                task.cancel()
+            job.fail("Replication cancelled")
+            raise
+        except Exception as e:
+            for task in pending:
+                task.cancel()
+            logger.exception("Replication %s failed", job.id)
+            job.fail(str(e.detail) if isinstance(e, HTTPException) else str(e))
+            return job.to_dict()
+        finally:
+            for sorter in sorters:
+                sorter.close()
+        
+        elapsed = time.perf_counter() - started
+        read = job.progress["source_read"] + job.progress["target_read"]
+        job.complete({
+            "source_store": source_store,
+            "target_store": target_store,
+            "dry_run": dry_run,
+            "delete_missing": delete_missing,
+            "load_seconds": round(loaded - started, 3),
+            "products_per_second": round(read / elapsed, 1) if elapsed else None,
+            "changes": changes
+        })
+        logger.info("Replication %s finished: %s", job.id, job.progress)
+        return job.to_dict()
+
+
+replication_service = ReplicationService()
\ No newline at end of file
@@ -0,0 +1,240 @@
+import asyncio
+import logging
+import math
+import time
+from typing import Dict, Any, Optional, List, Tuple
+
+from fastapi import HTTPException
+
+from app.core.bulkheads import priority_scope
+from app.core.config import settings
+from app.core.memory import cache_registry
+from app.core.metrics import registry
+from app.core.stores import current_store_id
+from app.models.schemas import StockUpdate
+from app.services.woocommerce_service import woocommerce_service
+
+logger = logging.getLogger(__name__)
+
+STOCK_UPDATES = registry.counter(
+    "wpwc_stock_buffer_updates_total",
+    "Stock/price updates handled by the write-behind buffer",
+    ("result",)
+)
+STOCK_FLUSH_DURATION = registry.histogram(
+    "wpwc_stock_buffer_flush_duration_seconds",
+    "Duration of stock buffer flushes"
+)
+STOCK_DROPPED = registry.counter(
+    "wpwc_stock_buffer_dropped_total",
+    "Stock/price updates dropped because the write-behind buffer was full",
+    ("reason",)
+)
+
+
+class StockUpdateBuffer:
+    def __init__(self):
+        self.flush_interval = settings.STOCK_BUFFER_FLUSH_INTERVAL
+        self.max_size = settings.STOCK_BUFFER_MAX_SIZE
+        self.batch_size = settings.STOCK_BUFFER_BATCH_SIZE
+        self.max_pending = max(1, settings.STOCK_BUFFER_MAX_PENDING)
+        self._pending: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        
+        self.received = 0
+        self.coalesced = 0
+        self.flushes = 0
+        self.flushed_items = 0
+        self.failed_items = 0
+        self.requeued_items = 0
+        self.rejected_items = 0
+        self.dropped_items = 0
+        self.last_flush_latency: Optional[float] = None
+        self.max_flush_latency = 0.0
+        self.total_flush_latency = 0.0
+        self.last_flush_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+    
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+    
+    def put(self, product_id: int, fields: Dict[str, Any]) -> bool:
+        self.received += 1
+        STOCK_UPDATES.inc(result="received")
+        key = (current_store_id(), product_id)
+        existing = self._pending.get(key)
+        if existing is not None:
+            existing.update(fields)
+            self.coalesced += 1
+            STOCK_UPDATES.inc(result="coalesced")
+        else:
+            self._pending[key] = dict(fields)
+        
+        if len(self._pending) >= self.max_size:
+            self._wakeup.set()
+        return existing is not None
+    
+    def put_many(self, updates: List[StockUpdate]) -> Dict[str, Any]:
+        store_id = current_store_id()
+        new_keys = {(store_id, update.product_id) for update in updates} - self._pending.keys()
+        if len(self._pending) + len(new_keys) > self.max_pending:
+            self.rejected_items += len(updates)
+            STOCK_DROPPED.inc(len(updates), reason="buffer_full")
+            self._wakeup.set()
+            raise HTTPException(
+                status_code=503,
+                detail={
+                    "error": "Stock buffer full",
+                    "details": f"{len(self._pending)} products are waiting to be flushed (limit {self.max_pending})"
+                },
+                headers={"Retry-After": str(max(1, math.ceil(self.flush_interval)))}
+            )
+        
+        coalesced = 0
+        for update in updates:
+            fields = update.model_dump(exclude={"product_id"}, exclude_none=True)
+            if self.put(update.product_id, fields):
+                coalesced += 1
+        
+        return {
+            "accepted": len(updates),
+            "coalesced": coalesced,
+            "pending": len(self._pending)
+        }
+    
+    async def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        
+        await self.flush()
+        if self._pending:
+            logger.warning("Stock buffer stopped with %d unflushed updates", len(self._pending))
+    
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            
+            try:
+                with priority_scope("background"):
+                    await self.flush()
+            except Exception:
+                logger.exception("Stock buffer flush failed")
+    
+    async def flush(self) -> Dict[str, Any]:
+        async with self._flush_lock:
+            if not self._pending:
+                return {"flushed": 0, "failed": 0, "requeued": 0, "dropped": 0}
+            
+            items, self._pending = self._pending, {}
+            started = time.perf_counter()
+            
+            by_store: Dict[str, List[Tuple[int, Dict[str, Any]]]] = {}
+            for (store_id, product_id), fields in items.items():
+                by_store.setdefault(store_id, []).append((product_id, fields))
+            results = await asyncio.gather(*(
+                self._flush_store(store_id, entries) for store_id, entries in by_store.items()
+            ))
+            flushed, failed, requeued, dropped = (sum(counts) for counts in zip(*results))
+            
+            latency = time.perf_counter() - started
+            self.flushes += 1
+            self.flushed_items += flushed
+            self.failed_items += failed
+            self.requeued_items += requeued
+            self.dropped_items += dropped
+            self.last_flush_latency = latency
+            self.max_flush_latency = max(self.max_flush_latency, latency)
+            self.total_flush_latency += latency
+            self.last_flush_at = time.time()
+            STOCK_FLUSH_DURATION.observe(latency)
+            STOCK_UPDATES.inc(flushed, result="flushed")
+            STOCK_UPDATES.inc(failed, result="failed")
+            STOCK_UPDATES.inc(requeued, result="requeued")
+            if dropped:
+                STOCK_DROPPED.inc(dropped, reason="requeue_overflow")
+                logger.warning("Stock buffer full, dropped %d updates that failed to flush", dropped)
+            
+            return {"flushed": flushed, "failed": failed, "requeued": requeued, "dropped": dropped}
+    
+    async def _flush_store(self, store_id: str, entries: List[Tuple[int, Dict[str, Any]]]) -> Tuple[int, int, int, int]:
+        service = woocommerce_service.for_store(store_id)
+        flushed = failed = requeued = dropped = 0
+        for offset in range(0, len(entries), self.batch_size):
+            chunk = entries[offset:offset + self.batch_size]
+            try:
+                result = await service.batch_update_products([
+                    {"id": product_id, **fields} for product_id, fields in chunk
+                ])
+            except Exception as e:
+                self.last_error = str(e)
+                for product_id, fields in chunk:
+                    key = (store_id, product_id)
+                    pending = self._pending.get(key)
+                    if pending is None and len(self._pending) >= self.max_pending:
+                        dropped += 1
+                        continue
+                    self._pending[key] = {**fields, **(pending or {})}
+                    requeued += 1
+                continue
+            
+            for product in result["update"]:
+                if product.get("error"):
+                    failed += 1
+                    self.last_error = str(product["error"])
+                else:
+                    flushed += 1
+        return flushed, failed, requeued, dropped
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pending": len(self._pending),
+            "received": self.received,
+            "coalesced": self.coalesced,
+            "coalescing_ratio": round(self.coalesced / self.received, 4) if self.received else 0.0,
+            "flushes": self.flushes,
+            "flushed_items": self.flushed_items,
+            "failed_items": self.failed_items,
+            "requeued_items": self.requeued_items,
+            "rejected_items": self.rejected_items,
+            "dropped_items": self.dropped_items,
+            "last_flush_latency_seconds": self.last_flush_latency,
+            "avg_flush_latency_seconds": self.total_flush_latency / self.flushes if self.flushes else None,
+            "max_flush_latency_seconds": self.max_flush_latency,
+            "last_flush_at": self.last_flush_at,
+            "last_error": self.last_error,
+            "flush_interval_seconds": self.flush_interval,
+            "max_size": self.max_size,
+            "max_pending": self.max_pending
+        }
+
+
+stock_buffer = StockUpdateBuffer()
+
+cache_registry.register("stock_buffer.pending", lambda: stock_buffer.pending)
+
+registry.gauge(
+    "wpwc_stock_buffer_pending",
+    "Products with buffered stock/price updates",
+    function=lambda: stock_buffer.pending
+)
+registry.gauge(
+    "wpwc_stock_buffer_coalescing_ratio",
+    "Share of received updates that were merged into an already pending update",
+    function=lambda: stock_buffer.coalesced / stock_buffer.received if stock_buffer.received else 0.0
+)
\ No newline at end of file
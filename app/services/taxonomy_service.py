@@ -0,0 +1,319 @@
+import asyncio
+import contextlib
+import html
+import logging
+import time
+from typing import Dict, Any, Optional, List, Tuple
+
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.core.memory import cache_registry
+from app.core.metrics import registry
+from app.core.stores import current_store_id
+from app.services.woocommerce_service import woocommerce_service
+from app.services.wordpress_service import wordpress_service
+
+logger = logging.getLogger(__name__)
+
+TAXONOMIES = {
+    "product_cat": (woocommerce_service, "categories", True),
+    "category": (wordpress_service, "categories", False),
+    "post_tag": (wordpress_service, "tags", False)
+}
+PRODUCT_TERM_FIELDS = {"categories": "product_cat"}
+POST_TERM_FIELDS = {"categories": "category", "tags": "post_tag"}
+
+TAXONOMY_TERMS = registry.counter(
+    "wpwc_taxonomy_terms_total",
+    "Category/tag references resolved through the taxonomy index",
+    ("taxonomy", "outcome")
+)
+TAXONOMY_REFRESHES = registry.counter(
+    "wpwc_taxonomy_refreshes_total",
+    "Taxonomy index loads from the upstream API",
+    ("taxonomy", "mode")
+)
+
+
+def term_key(value: str) -> str:
+    return html.unescape(value).strip().casefold()
+
+
+def translated(value: Any, language: str, fallback_language: str) -> Optional[str]:
+    if not isinstance(value, dict):
+        return str(value) if value else None
+    for lang in (language, fallback_language, "en"):
+        text = value.get(lang)
+        if isinstance(text, dict):
+            text = text.get("translation")
+        if text:
+            return str(text)
+    return None
+
+
+def term_reference(entry: Any, language: str, fallback_language: str) -> Tuple[Optional[int], Optional[Dict[str, str]]]:
+    if isinstance(entry, bool):
+        return None, None
+    if isinstance(entry, int):
+        return entry, None
+    if isinstance(entry, str):
+        return None, {"name": entry} if entry.strip() else None
+    if not isinstance(entry, dict):
+        return None, None
+    if entry.get("id"):
+        return entry["id"], None
+    name = translated(entry.get("name"), language, fallback_language)
+    slug = entry.get("slug")
+    term = {key: value for key, value in (("name", name), ("slug", slug)) if value}
+    return None, term or None
+
+
+def needs_resolution(data: Dict[str, Any], fields: Dict[str, str]) -> bool:
+    return any(
+        not (isinstance(entry, dict) and entry.get("id"))
+        for field in fields
+        if isinstance(data.get(field), list)
+        for entry in data[field]
+    )
+
+
+def existing_term_id(error: Any) -> Optional[int]:
+    if not isinstance(error, dict):
+        return None
+    if error.get("code") == "term_exists":
+        data = error.get("data") or {}
+        return data.get("resource_id") or data.get("term_id")
+    return existing_term_id(error.get("details"))
+
+
+def index_term(slugs: Dict[str, int], names: Dict[str, List[Dict[str, Any]]], term: Dict[str, Any]) -> None:
+    if term.get("slug"):
+        slugs[term_key(term["slug"])] = term["id"]
+    if term.get("name"):
+        candidates = names.setdefault(term_key(term["name"]), [])
+        if all(candidate["id"] != term["id"] for candidate in candidates):
+            candidates.append({"id": term["id"], "slug": term.get("slug"), "parent": term.get("parent")})
+
+
+class TaxonomyIndex:
+    def __init__(self, store_id: str, taxonomy: str):
+        proxy, self.endpoint, self.batched = TAXONOMIES[taxonomy]
+        self.service = proxy.for_store(store_id)
+        self.store_id = store_id
+        self.taxonomy = taxonomy
+        self.slugs: Dict[str, int] = {}
+        self.names: Dict[str, List[Dict[str, Any]]] = {}
+        self.max_id = 0
+        self.loaded_at: Optional[float] = None
+        self.refreshed_at = 0.0
+        self.lock = asyncio.Lock()
+    
+    def __len__(self) -> int:
+        return len(self.slugs) + len(self.names)
+    
+    def key(self, term: Dict[str, str]) -> str:
+        return term_key(term.get("slug") or term["name"])
+    
+    def candidates(self, term: Dict[str, str]) -> List[Dict[str, Any]]:
+        if term.get("slug"):
+            term_id = self.slugs.get(term_key(term["slug"]))
+            return [{"id": term_id}] if term_id is not None else []
+        key = term_key(term["name"])
+        if key in self.slugs:
+            return [{"id": self.slugs[key]}]
+        return self.names.get(key, [])
+    
+    def get(self, term: Dict[str, str]) -> Optional[int]:
+        candidates = self.candidates(term)
+        return candidates[0]["id"] if len(candidates) == 1 else None
+    
+    def ambiguous(self, term: Dict[str, str]) -> bool:
+        return len(self.candidates(term)) > 1
+    
+    def add(self, term: Dict[str, Any]) -> None:
+        index_term(self.slugs, self.names, term)
+        self.max_id = max(self.max_id, term["id"])
+    
+    def stale(self, ttl: float) -> bool:
+        return self.loaded_at is None or time.monotonic() - self.refreshed_at >= ttl
+    
+    def expired(self, reload_interval: float) -> bool:
+        return self.loaded_at is None or time.monotonic() - self.loaded_at >= reload_interval
+    
+    async def load(self) -> None:
+        slugs: Dict[str, int] = {}
+        names: Dict[str, List[Dict[str, Any]]] = {}
+        max_id = 0
+        async for term in self.service.iter_terms(self.endpoint):
+            index_term(slugs, names, term)
+            max_id = max(max_id, term["id"])
+        self.slugs, self.names, self.max_id = slugs, names, max_id
+        self.loaded_at = self.refreshed_at = time.monotonic()
+        TAXONOMY_REFRESHES.inc(taxonomy=self.taxonomy, mode="full")
+    
+    async def refresh(self) -> None:
+        known = self.max_id
+        async with contextlib.aclosing(self.service.iter_terms(self.endpoint, order="desc")) as terms:
+            async for term in terms:
+                if term["id"] <= known:
+                    break
+                self.add(term)
+        self.refreshed_at = time.monotonic()
+        TAXONOMY_REFRESHES.inc(taxonomy=self.taxonomy, mode="incremental")
+    
+    async def ensure(self, ttl: float, reload_interval: float) -> None:
+        if not self.stale(ttl):
+            return
+        async with self.lock:
+            if self.expired(reload_interval):
+                await self.load()
+            elif self.stale(ttl):
+                await self.refresh()
+    
+    def _created(self, term: Dict[str, str], result: Dict[str, Any], errors: List[Dict[str, Any]]) -> None:
+        term_id = result.get("id") if not result.get("error") else existing_term_id(result["error"])
+        if not term_id:
+            errors.append({**term, "error": result.get("error")})
+            return
+        self.add({**term, "id": term_id})
+        if result.get("name") or result.get("slug"):
+            self.add({"id": term_id, "name": result.get("name"), "slug": result.get("slug")})
+    
+    async def create(self, terms: List[Dict[str, str]], batch_size: int, concurrency: int) -> List[Dict[str, Any]]:
+        errors: List[Dict[str, Any]] = []
+        if self.batched:
+            for start in range(0, len(terms), batch_size):
+                chunk = terms[start:start + batch_size]
+                results = await self.service.batch_create_terms(self.endpoint, chunk)
+                for term, result in zip(chunk, results):
+                    self._created(term, result, errors)
+            return errors
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def create_one(term: Dict[str, str]) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await self.service.create_term(self.endpoint, term)
+                except HTTPException as e:
+                    return {"error": e.detail}
+        
+        results = await asyncio.gather(*(create_one(term) for term in terms))
+        for term, result in zip(terms, results):
+            self._created(term, result, errors)
+        return errors
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "terms": len(self.slugs),
+            "ambiguous_names": sum(1 for candidates in self.names.values() if len(candidates) > 1),
+            "max_id": self.max_id,
+            "age_seconds": round(time.monotonic() - self.loaded_at, 1) if self.loaded_at is not None else None,
+            "refreshed_seconds_ago": round(time.monotonic() - self.refreshed_at, 1) if self.loaded_at is not None else None
+        }
+
+
+class TaxonomyService:
+    def __init__(self):
+        self.ttl = settings.TAXONOMY_INDEX_TTL
+        self.reload_interval = settings.TAXONOMY_FULL_RELOAD_INTERVAL
+        self.create_missing = settings.TAXONOMY_CREATE_MISSING
+        self.batch_size = settings.TAXONOMY_CREATE_BATCH_SIZE
+        self.concurrency = settings.TAXONOMY_CREATE_CONCURRENCY
+        self._indexes: Dict[Tuple[str, str], TaxonomyIndex] = {}
+    
+    def index(self, taxonomy: str, store_id: Optional[str] = None) -> TaxonomyIndex:
+        key = (store_id or current_store_id(), taxonomy)
+        index = self._indexes.get(key)
+        if index is None:
+            index = self._indexes[key] = TaxonomyIndex(*key)
+        return index
+    
+    async def resolve(self, taxonomy: str, terms: List[Dict[str, str]], store_id: Optional[str] = None) -> List[int]:
+        index = self.index(taxonomy, store_id)
+        await index.ensure(self.ttl, self.reload_interval)
+        
+        ambiguous = [{**term, "candidates": index.candidates(term)} for term in terms if index.ambiguous(term)]
+        if ambiguous:
+            TAXONOMY_TERMS.inc(len(ambiguous), taxonomy=taxonomy, outcome="ambiguous")
+            raise HTTPException(
+                status_code=400,
+                detail={
+                    "error": "Ambiguous taxonomy terms",
+                    "details": {"taxonomy": taxonomy, "terms": ambiguous, "hint": "Reference these terms by slug or id"}
+                }
+            )
+        
+        errors: List[Dict[str, Any]] = []
+        missing = {index.key(term): term for term in terms if index.get(term) is None}
+        TAXONOMY_TERMS.inc(len(terms) - len(missing), taxonomy=taxonomy, outcome="hit")
+        if missing:
+            async with index.lock:
+                missing = {key: term for key, term in missing.items() if index.get(term) is None}
+                if missing:
+                    await index.refresh()
+                    before = len(missing)
+                    missing = {key: term for key, term in missing.items() if index.get(term) is None}
+                    TAXONOMY_TERMS.inc(before - len(missing), taxonomy=taxonomy, outcome="refreshed")
+                if missing and self.create_missing:
+                    errors = await index.create(list(missing.values()), self.batch_size, self.concurrency)
+                    TAXONOMY_TERMS.inc(len(missing) - len(errors), taxonomy=taxonomy, outcome="created")
+                    logger.info("Created %d %s terms in store %s", len(missing) - len(errors), taxonomy, index.store_id)
+        
+        unresolved = [term for term in terms if index.get(term) is None]
+        if unresolved:
+            TAXONOMY_TERMS.inc(len(unresolved), taxonomy=taxonomy, outcome="unresolved")
+            raise HTTPException(
+                status_code=400,
+                detail={
+                    "error": "Unresolved taxonomy terms",
+                    "details": {"taxonomy": taxonomy, "terms": unresolved, "errors": errors}
+                }
+            )
+        return [index.get(term) for term in terms]
+    
+    async def resolve_terms(
+        self,
+        data: Dict[str, Any],
+        fields: Dict[str, str],
+        language: str = "en",
+        fallback_language: str = "en"
+    ) -> Dict[str, Any]:
+        if not needs_resolution(data, fields):
+            return data
+        
+        references = {
+            field: [term_reference(entry, language, fallback_language) for entry in data[field]]
+            for field in fields
+            if isinstance(data.get(field), list)
+        }
+        resolved_ids = await asyncio.gather(*(
+            self.resolve(fields[field], [term for _, term in refs if term is not None])
+            for field, refs in references.items()
+        ))
+        
+        resolved = dict(data)
+        for (field, refs), ids in zip(references.items(), resolved_ids):
+            ids = iter(ids)
+            entries = []
+            for entry, (term_id, term) in zip(data[field], refs):
+                if term is not None:
+                    entries.append({"id": next(ids), "name": term.get("name", "")})
+                elif term_id is not None and not isinstance(entry, dict):
+                    entries.append({"id": term_id})
+                else:
+                    entries.append(entry)
+            resolved[field] = entries
+        return resolved
+    
+    def stats(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = {}
+        for (store_id, taxonomy), index in self._indexes.items():
+            stats.setdefault(store_id, {})[taxonomy] = index.stats()
+        return stats
+
+
+taxonomy_service = TaxonomyService()
+
+cache_registry.register("taxonomy.terms", lambda: sum(len(index) for index in taxonomy_service._indexes.values()))
\ No newline at end of file
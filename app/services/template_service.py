@@ -1,28 +1,15 @@
+import json
 import os
 from typing import Dict, Any
-from jinja2 import Environment, FileSystemLoader, Template
+from jinja2 import Environment, FileSystemLoader
+from app.core.lazy import LazyProxy, is_initialized
+from app.core.memory import cache_registry
+from app.core.metrics import timed_transform
+from app.core.templates import register_templates, template_environment
 from app.core.config import settings
 
 
-class TemplateService:
-    def __init__(self):
-        template_dir = os.path.join(os.path.dirname(__file__), "..", "templates")
-        self.env = Environment(
-            loader=FileSystemLoader(template_dir),
-            autoescape=False,
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
-    
-    def render_template(self, template_name: str, context: Dict[str, Any]) -> str:
-        try:
-            template = self.env.get_template(template_name)
-            return template.render(**context)
-        except Exception as e:
-            raise ValueError(f"Template rendering failed: {str(e)}")
-    
-    def transform_to_wc_product(self, client_data: Dict[str, Any]) -> Dict[str, Any]:
-        template_content = """
+WC_PRODUCT_TEMPLATE = """
 {
     "name": "{{ client_data.get('name', client_data.get('title', 'Product')) }}",
     "type": "{{ client_data.get('type', 'simple') }}",
@@ -61,15 +48,8 @@ class TemplateService:
     ]
 }
         """
-        
-        template = Template(template_content)
-        rendered = template.render(client_data=client_data)
-        
-        import json
-        return json.loads(rendered)
-    
-    def transform_to_wc_order(self, client_data: Dict[str, Any]) -> Dict[str, Any]:
-        template_content = """
+
+WC_ORDER_TEMPLATE = """
 {
     "payment_method": "{{ client_data.get('payment_method', 'bacs') }}",
     "payment_method_title": "{{ client_data.get('payment_method_title', 'Bank transfer') }}",
@@ -108,15 +88,8 @@ class TemplateService:
     ]
 }
         """
-        
-        template = Template(template_content)
-        rendered = template.render(client_data=client_data)
-        
-        import json
-        return json.loads(rendered)
-    
-    def transform_to_wp_post(self, client_data: Dict[str, Any]) -> Dict[str, Any]:
-        template_content = """
+
+WP_POST_TEMPLATE = """
 {
     "title": "{{ client_data.get('title', client_data.get('name', 'Post')) }}",
     "content": "{{ client_data.get('content', client_data.get('description', '')) }}",
@@ -140,12 +113,58 @@ class TemplateService:
     }
 }
         """
+
+
+register_templates("templates", {
+    "wc_product.json": WC_PRODUCT_TEMPLATE,
+    "wc_order.json": WC_ORDER_TEMPLATE,
+    "wp_post.json": WP_POST_TEMPLATE
+})
+
+
+class TemplateService:
+    def __init__(self):
+        template_dir = os.path.join(os.path.dirname(__file__), "..", "templates")
+        self.env = Environment(
+            loader=FileSystemLoader(template_dir),
+            autoescape=False,
+            trim_blocks=True,
+            lstrip_blocks=True
+        )
+        self.inline_env = template_environment("templates")
+        self.wc_product_template = self.inline_env.get_template("wc_product.json")
+        self.wc_order_template = self.inline_env.get_template("wc_order.json")
+        self.wp_post_template = self.inline_env.get_template("wp_post.json")
+    
+    def render_template(self, template_name: str, context: Dict[str, Any]) -> str:
+        try:
+            template = self.env.get_template(template_name)
+            return template.render(**context)
+        except Exception as e:
+            raise ValueError(f"Template rendering failed: {str(e)}")
+    
+    @timed_transform
+    def transform_to_wc_product(self, client_data: Dict[str, Any]) -> Dict[str, Any]:
+        rendered = self.wc_product_template.render(client_data=client_data)
         
-        template = Template(template_content)
-        rendered = template.render(client_data=client_data)
+        return json.loads(rendered)
+    
+    @timed_transform
+    def transform_to_wc_order(self, client_data: Dict[str, Any]) -> Dict[str, Any]:
+        rendered = self.wc_order_template.render(client_data=client_data)
         
-        import json
         return json.loads(rendered)
+    
+    @timed_transform
+    def transform_to_wp_post(self, client_data: Dict[str, Any]) -> Dict[str, Any]:
+        rendered = self.wp_post_template.render(client_data=client_data)
+        
+        return json.loads(rendered)
+
 
+template_service = LazyProxy("template_service", TemplateService)
 
-template_service = TemplateService() 
\ No newline at end of file
+cache_registry.register(
+    "templates.jinja_cache",
+    lambda: len(template_service.env.cache or {}) + len(template_service.inline_env.cache or {}) if is_initialized(template_service) else 0
+) 
\ No newline at end of file
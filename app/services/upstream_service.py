@@ -0,0 +1,227 @@
+import asyncio
+import contextlib
+import re
+import time
+import httpx
+from typing import Dict, Any, Optional, Tuple, AsyncIterator
+from fastapi import HTTPException
+
+from app.core.bulkheads import current_priority, upstream_slot
+from app.core.cassette import upstream_transport
+from app.core.config import settings
+from app.core.deadlines import UPSTREAM_CANCELLED, check_deadline, deadline_exceeded
+from app.core.hedging import HEDGEABLE_METHODS, hedger
+from app.core.metrics import UPSTREAM_IN_FLIGHT, UPSTREAM_DURATION, UPSTREAM_TTFB, UPSTREAM_CONNECT
+from app.core.stores import DEFAULT_STORE, StoreConfig, store_config, store_limiter
+from app.core.tracing import tracer, SPAN_KIND_CLIENT, STATUS_ERROR
+
+
+NUMERIC_SEGMENT = re.compile(r"(?<=/)\d+(?=/|$)")
+
+
+def endpoint_label(endpoint: str) -> str:
+    return NUMERIC_SEGMENT.sub("{id}", "/" + endpoint.strip("/"))[1:]
+
+
+class ConnectTrace:
+    PHASES = {
+        "connection.connect_tcp": "tcp",
+        "connection.start_tls": "tls"
+    }
+    
+    def __init__(self, service: str):
+        self.service = service
+        self.started: Dict[str, float] = {}
+    
+    async def __call__(self, event_name: str, info: Dict[str, Any]) -> None:
+        prefix, _, stage = event_name.rpartition(".")
+        phase = self.PHASES.get(prefix)
+        if phase is None:
+            return
+        if stage == "started":
+            self.started[phase] = time.perf_counter()
+        elif stage == "complete" and phase in self.started:
+            UPSTREAM_CONNECT.observe(time.perf_counter() - self.started.pop(phase), service=self.service, phase=phase)
+
+
+class UpstreamService:
+    api_name = "Upstream"
+    api_path = ""
+    service_name = "upstream"
+    
+    base_url: str
+    headers: Dict[str, str]
+    auth: httpx.Auth
+    
+    def __init__(self, store_id: str = DEFAULT_STORE):
+        self.store_id = store_id
+        self.store: StoreConfig = store_config(store_id)
+        self.base_url = self.store.base_url.rstrip('/')
+        self.limiter = store_limiter(store_id)
+        self._pool: Optional[httpx.AsyncClient] = None
+        self._pool_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _url(self, endpoint: str) -> str:
+        return f"{self.base_url}/wp-json/{self.api_path}/{endpoint}"
+    
+    def _build_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            auth=self.auth,
+            limits=httpx.Limits(max_connections=self.store.max_connections),
+            transport=upstream_transport(),
+            event_hooks={
+                "request": [self._on_request],
+                "response": [self._on_response]
+            }
+        )
+    
+    @contextlib.asynccontextmanager
+    async def _client(self) -> AsyncIterator[httpx.AsyncClient]:
+        loop = asyncio.get_running_loop()
+        if self._pool is None or self._pool.is_closed or self._pool_loop is not loop:
+            self._pool = self._build_client()
+            self._pool_loop = loop
+        yield self._pool
+    
+    async def aclose(self) -> None:
+        if self._pool is not None:
+            await self._pool.aclose()
+            self._pool = None
+    
+    async def _on_request(self, request: httpx.Request) -> None:
+        request.extensions["wpwc_started"] = time.perf_counter()
+    
+    async def _on_response(self, response: httpx.Response) -> None:
+        request = response.request
+        started = request.extensions.get("wpwc_started")
+        if started is not None:
+            UPSTREAM_TTFB.observe(
+                time.perf_counter() - started,
+                service=self.service_name,
+                method=request.method,
+                endpoint=request.extensions.get("wpwc_endpoint", "")
+            )
+    
+    async def _send(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        endpoint: str,
+        attempt: int = 0,
+        **kwargs
+    ) -> httpx.Response:
+        label = endpoint_label(endpoint)
+        async with self.limiter.slot(current_priority()), upstream_slot(method):
+            budget = check_deadline("upstream")
+            timeout = kwargs.pop("timeout", client.timeout.read)
+            limited = budget is not None and (timeout is None or budget < timeout)
+            if limited:
+                timeout = budget
+            status = "error"
+            started = time.perf_counter()
+            UPSTREAM_IN_FLIGHT.inc(service=self.service_name)
+            attributes = {
+                "http.method": method,
+                "http.route": label,
+                "peer.service": self.service_name,
+                "http.resend_count": attempt
+            }
+            try:
+                with tracer.span(f"{method} {label}", SPAN_KIND_CLIENT, attributes) as span:
+                    headers = self.headers
+                    if span is not None:
+                        headers = {**headers, "traceparent": span.traceparent}
+                    response = await client.request(
+                        method=method,
+                        url=self._url(endpoint),
+                        headers=headers,
+                        extensions={"trace": ConnectTrace(self.service_name), "wpwc_endpoint": label},
+                        timeout=timeout,
+                        **kwargs
+                    )
+                    status = str(response.status_code)
+                    if span is not None:
+                        span.set_attribute("http.status_code", response.status_code)
+                        if response.status_code >= 400:
+                            span.set_status(STATUS_ERROR, f"HTTP {response.status_code}")
+                    return response
+            except httpx.TimeoutException as e:
+                if limited:
+                    status = "deadline"
+                    raise deadline_exceeded("upstream") from e
+                raise
+            except asyncio.CancelledError:
+                status = "cancelled"
+                UPSTREAM_CANCELLED.inc(service=self.service_name)
+                raise
+            finally:
+                UPSTREAM_IN_FLIGHT.dec(service=self.service_name)
+                UPSTREAM_DURATION.observe(
+                    time.perf_counter() - started,
+                    service=self.service_name,
+                    method=method,
+                    endpoint=label,
+                    status=status
+                )
+    
+    async def _send_idempotent(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        endpoint: str,
+        **kwargs
+    ) -> httpx.Response:
+        if not hedger.enabled or method not in HEDGEABLE_METHODS:
+            return await self._send(client, method, endpoint, **kwargs)
+        return await hedger.run(
+            self.service_name,
+            endpoint_label(endpoint),
+            lambda attempt: self._send(client, method, endpoint, attempt=attempt, **kwargs)
+        )
+    
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        attributes = {"http.method": method, "http.route": endpoint_label(endpoint), "peer.service": self.service_name}
+        with tracer.span(f"{self.service_name}.request", attributes=attributes):
+            async with self._client() as client:
+                try:
+                    response = await self._send_idempotent(
+                        client,
+                        method,
+                        endpoint,
+                        json=data,
+                        params=params,
+                        timeout=settings.UPSTREAM_TIMEOUT_SECONDS
+                    )
+                    response.raise_for_status()
+                    return response.json()
+                except httpx.HTTPStatusError as e:
+                    error_detail = e.response.json() if e.response.content else {"message": str(e)}
+                    raise HTTPException(
+                        status_code=e.response.status_code,
+                        detail={
+                            "error": f"{self.api_name} API error",
+                            "details": error_detail,
+                            "status_code": e.response.status_code
+                        }
+                    )
+                except httpx.RequestError as e:
+                    raise HTTPException(
+                        status_code=500,
+                        detail={
+                            "error": f"{self.api_name} API connection error",
+                            "details": str(e)
+                        }
+                    )
+    
+    async def _fetch_totals(self, endpoint: str) -> Tuple[int, int]:
+        async with self._client() as client:
+            count_response = await self._send_idempotent(client, "HEAD", endpoint, params={"per_page": 1})
+            total = int(count_response.headers.get("X-WP-Total", 0))
+            total_pages = int(count_response.headers.get("X-WP-TotalPages", 0))
+        return total, total_pages
\ No newline at end of file
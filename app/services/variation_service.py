@@ -0,0 +1,161 @@
+import asyncio
+import itertools
+import logging
+import math
+import re
+from typing import Dict, Any, Optional, List, Tuple
+
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.core.metrics import registry
+from app.models.schemas import VariationSpec
+from app.services.woocommerce_service import woocommerce_service
+
+logger = logging.getLogger(__name__)
+
+VARIATIONS_CREATED = registry.counter(
+    "wpwc_variations_total",
+    "Product variations handled by variable product creation",
+    ("outcome",)
+)
+
+
+def invalid_variations(details: str) -> HTTPException:
+    return HTTPException(status_code=400, detail={"error": "Invalid variation spec", "details": details})
+
+
+def variation_attributes(product: Dict[str, Any]) -> List[Tuple[str, List[str]]]:
+    return [
+        (attribute["name"], [str(option) for option in attribute.get("options", [])])
+        for attribute in product.get("attributes", [])
+        if attribute.get("variation") and attribute.get("name") and attribute.get("options")
+    ]
+
+
+def matches(combination: Dict[str, str], matcher: Dict[str, str]) -> bool:
+    return all(combination.get(name) == option for name, option in matcher.items())
+
+
+def sku_part(option: str) -> str:
+    return re.sub(r"[^A-Za-z0-9]+", "-", option).strip("-").upper()
+
+
+def check_matchers(attributes: List[Tuple[str, List[str]]], spec: VariationSpec) -> None:
+    options = dict(attributes)
+    matchers = [*spec.include, *spec.exclude, *(override.attributes for override in spec.overrides)]
+    for matcher in matchers:
+        for name, option in matcher.items():
+            if name not in options:
+                raise invalid_variations(f"Unknown variation attribute '{name}'; known attributes: {', '.join(options)}")
+            if option not in options[name]:
+                raise invalid_variations(f"Unknown option '{option}' for attribute '{name}'")
+
+
+def client_price(data: Dict[str, Any]) -> Optional[str]:
+    for key in ("price", "regular_price"):
+        if data.get(key) not in (None, ""):
+            return str(data[key])
+    return None
+
+
+def build_variations(
+    product: Dict[str, Any],
+    spec: VariationSpec,
+    max_combinations: int,
+    default_price: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    attributes = variation_attributes(product)
+    if not attributes:
+        raise invalid_variations("A variable product needs at least one attribute with variation: true and options")
+    check_matchers(attributes, spec)
+    
+    total = math.prod(len(options) for _, options in attributes)
+    if total > max_combinations:
+        raise invalid_variations(f"{total} attribute combinations exceed the limit of {max_combinations}")
+    
+    names = [name for name, _ in attributes]
+    regular_price = spec.regular_price or default_price
+    variations = []
+    for options in itertools.product(*(options for _, options in attributes)):
+        combination = dict(zip(names, options))
+        if spec.include and not any(matches(combination, matcher) for matcher in spec.include):
+            continue
+        if any(matches(combination, matcher) for matcher in spec.exclude):
+            continue
+        
+        variation: Dict[str, Any] = {"attributes": [{"name": name, "option": option} for name, option in combination.items()]}
+        if regular_price:
+            variation["regular_price"] = regular_price
+        if spec.sku:
+            variation["sku"] = "-".join([spec.sku, *(sku_part(option) for option in options)])
+        if spec.stock_quantity is not None:
+            variation["stock_quantity"] = spec.stock_quantity
+        for override in spec.overrides:
+            if matches(combination, override.attributes):
+                variation.update(override.model_dump(exclude_none=True, exclude={"attributes"}))
+        if "stock_quantity" in variation:
+            variation["manage_stock"] = True
+        variations.append(variation)
+    
+    if not variations:
+        raise invalid_variations("The include/exclude rules leave no attribute combinations")
+    return variations
+
+
+class VariationService:
+    def __init__(self):
+        self.batch_size = settings.VARIATION_BATCH_SIZE
+        self.max_in_flight = settings.VARIATION_MAX_IN_FLIGHT
+        self.max_combinations = settings.VARIATION_MAX_COMBINATIONS
+    
+    def plan(self, product: Dict[str, Any], spec: VariationSpec, default_price: Optional[str] = None) -> List[Dict[str, Any]]:
+        return build_variations(product, spec, self.max_combinations, default_price)
+    
+    async def _create_chunk(
+        self,
+        product_id: int,
+        chunk: List[Dict[str, Any]],
+        semaphore: asyncio.Semaphore
+    ) -> List[Dict[str, Any]]:
+        async with semaphore:
+            try:
+                created = await woocommerce_service.batch_create_variations(product_id, chunk)
+            except HTTPException as e:
+                error = {"status_code": e.status_code, "error": e.detail}
+                return [{"sku": variation.get("sku"), "attributes": variation["attributes"], "error": error} for variation in chunk]
+        
+        missing = [{"error": "Missing from batch response"}] * (len(chunk) - len(created))
+        return [
+            {**result, "sku": result.get("sku") or variation.get("sku"), "attributes": variation["attributes"]}
+            for variation, result in zip(chunk, created + missing)
+        ]
+    
+    async def create_variations(self, product_id: int, variations: List[Dict[str, Any]]) -> Dict[str, Any]:
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+        chunks = [variations[i:i + self.batch_size] for i in range(0, len(variations), self.batch_size)]
+        results = await asyncio.gather(*(self._create_chunk(product_id, chunk, semaphore) for chunk in chunks))
+        
+        variation_ids = []
+        failed = []
+        for result in itertools.chain.from_iterable(results):
+            if result.get("error") or result.get("id") is None:
+                failed.append({"sku": result.get("sku"), "attributes": result["attributes"], "error": result.get("error")})
+            else:
+                variation_ids.append(result["id"])
+        VARIATIONS_CREATED.inc(len(variation_ids), outcome="created")
+        VARIATIONS_CREATED.inc(len(failed), outcome="failed")
+        if failed:
+            logger.warning("%d of %d variations failed for product %s", len(failed), len(variations), product_id)
+        return {"variation_ids": variation_ids, "failed": failed}
+    
+    async def discard_parent(self, product_id: int) -> bool:
+        try:
+            await woocommerce_service.delete_product(product_id)
+        except HTTPException as e:
+            logger.error("Could not delete variable product %s after its variations failed: %s", product_id, e.detail)
+            return False
+        return True
+
+
+variation_service = VariationService()
\ No newline at end of file
@@ -1,64 +1,24 @@
-import httpx
-import base64
-from typing import Dict, Any, Optional, List
-from fastapi import HTTPException
-from app.core.config import settings
+from typing import Dict, Any, Optional, List, AsyncIterator
+from app.core.auth import woocommerce_auth
+from app.core.stores import DEFAULT_STORE, StoreProxy
 from app.models.schemas import PaginationParams
+from app.services.upstream_service import UpstreamService
 
 
-class WooCommerceService:
-    def __init__(self):
-        self.base_url = settings.BASE_URL.rstrip('/')
-        self.consumer_key = settings.WC_CONSUMER_KEY
-        self.consumer_secret = settings.WC_CONSUMER_SECRET
-        
-        credentials = f"{self.consumer_key}:{self.consumer_secret}"
-        encoded_credentials = base64.b64encode(credentials.encode()).decode()
+class WooCommerceService(UpstreamService):
+    api_name = "WooCommerce"
+    api_path = "wc/v3"
+    service_name = "woocommerce"
+    
+    def __init__(self, store_id: str = DEFAULT_STORE):
+        super().__init__(store_id)
+        self.consumer_key = self.store.wc_consumer_key
+        self.consumer_secret = self.store.wc_consumer_secret
+        self.auth = woocommerce_auth(self.store.wc_auth_type, self.consumer_key, self.consumer_secret)
         self.headers = {
-            "Authorization": f"Basic {encoded_credentials}",
             "Content-Type": "application/json"
         }
     
-    async def _make_request(
-        self, 
-        method: str, 
-        endpoint: str, 
-        data: Optional[Dict[str, Any]] = None,
-        params: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
-        url = f"{self.base_url}/wp-json/wc/v3/{endpoint}"
-        
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.request(
-                    method=method,
-                    url=url,
-                    headers=self.headers,
-                    json=data,
-                    params=params,
-                    timeout=30.0
-                )
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                error_detail = e.response.json() if e.response.content else {"message": str(e)}
-                raise HTTPException(
-                    status_code=e.response.status_code,
-                    detail={
-                        "error": "WooCommerce API error",
-                        "details": error_detail,
-                        "status_code": e.response.status_code
-                    }
-                )
-            except httpx.RequestError as e:
-                raise HTTPException(
-                    status_code=500,
-                    detail={
-                        "error": "WooCommerce API connection error",
-                        "details": str(e)
-                    }
-                )
-    
     async def get_products(self, pagination: PaginationParams) -> Dict[str, Any]:
         params = {
             "page": pagination.page,
@@ -67,14 +27,7 @@ class WooCommerceService:
         
         response = await self._make_request("GET", "products", params=params)
         
-        async with httpx.AsyncClient() as client:
-            count_response = await client.head(
-                f"{self.base_url}/wp-json/wc/v3/products",
-                headers=self.headers,
-                params={"per_page": 1}
-            )
-            total_products = int(count_response.headers.get("X-WP-Total", 0))
-            total_pages = int(count_response.headers.get("X-WP-TotalPages", 0))
+        total_products, total_pages = await self._fetch_totals("products")
         
         normalized_products = []
         for product in response:
@@ -167,6 +120,189 @@ class WooCommerceService:
             "date_modified": response.get("date_modified")
         }
     
+    async def delete_product(self, product_id: int, force: bool = True) -> Dict[str, Any]:
+        response = await self._make_request("DELETE", f"products/{product_id}", params={"force": str(force).lower()})
+        
+        return {
+            "id": response.get("id"),
+            "status": response.get("status")
+        }
+    
+    async def batch_update_products(self, updates: List[Dict[str, Any]]) -> Dict[str, Any]:
+        response = await self._make_request("POST", "products/batch", data={"update": updates})
+        
+        return {
+            "update": [
+                {
+                    "id": product.get("id"),
+                    "stock_quantity": product.get("stock_quantity"),
+                    "regular_price": product.get("regular_price"),
+                    "sale_price": product.get("sale_price"),
+                    "error": product.get("error")
+                } for product in response.get("update", [])
+            ]
+        }
+    
+    async def batch_products(
+        self,
+        create: Optional[List[Dict[str, Any]]] = None,
+        update: Optional[List[Dict[str, Any]]] = None,
+        delete: Optional[List[int]] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        data = {key: items for key, items in (("create", create), ("update", update), ("delete", delete)) if items}
+        response = await self._make_request("POST", "products/batch", data=data)
+        
+        return {
+            key: [
+                {
+                    "id": product.get("id"),
+                    "sku": product.get("sku"),
+                    "error": product.get("error")
+                } for product in response.get(key, [])
+            ] for key in ("create", "update", "delete")
+        }
+    
+    async def batch_create_variations(self, product_id: int, variations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        response = await self._make_request("POST", f"products/{product_id}/variations/batch", data={"create": variations})
+        
+        return [
+            {
+                "id": variation.get("id"),
+                "sku": variation.get("sku"),
+                "attributes": variation.get("attributes"),
+                "error": variation.get("error")
+            } for variation in response.get("create", [])
+        ]
+    
+    async def iter_products(
+        self,
+        fields: Optional[List[str]] = None,
+        status: Optional[str] = None,
+        per_page: int = 100
+    ) -> AsyncIterator[Dict[str, Any]]:
+        params: Dict[str, Any] = {
+            "per_page": per_page,
+            "orderby": "id",
+            "order": "asc"
+        }
+        if fields:
+            params["_fields"] = ",".join(fields)
+        if status:
+            params["status"] = status
+        
+        page = 1
+        while True:
+            response = await self._make_request("GET", "products", params={**params, "page": page})
+            for product in response:
+                yield product
+            
+            if len(response) < per_page:
+                break
+            page += 1
+    
+    async def iter_variations(
+        self,
+        product_id: int,
+        fields: Optional[List[str]] = None,
+        per_page: int = 100
+    ) -> AsyncIterator[Dict[str, Any]]:
+        params: Dict[str, Any] = {
+            "per_page": per_page,
+            "orderby": "id",
+            "order": "asc"
+        }
+        if fields:
+            params["_fields"] = ",".join(fields)
+        
+        page = 1
+        while True:
+            response = await self._make_request("GET", f"products/{product_id}/variations", params={**params, "page": page})
+            for variation in response:
+                yield variation
+            
+            if len(response) < per_page:
+                break
+            page += 1
+    
+    async def batch_update_variations(self, product_id: int, updates: List[Dict[str, Any]]) -> Dict[str, Any]:
+        response = await self._make_request("POST", f"products/{product_id}/variations/batch", data={"update": updates})
+        
+        return {
+            "update": [
+                {
+                    "id": variation.get("id"),
+                    "stock_quantity": variation.get("stock_quantity"),
+                    "regular_price": variation.get("regular_price"),
+                    "sale_price": variation.get("sale_price"),
+                    "error": variation.get("error")
+                } for variation in response.get("update", [])
+            ]
+        }
+    
+    async def iter_terms(
+        self,
+        taxonomy: str = "categories",
+        order: str = "asc",
+        per_page: int = 100
+    ) -> AsyncIterator[Dict[str, Any]]:
+        params = {
+            "per_page": per_page,
+            "orderby": "id",
+            "order": order,
+            "_fields": "id,name,slug,parent"
+        }
+        
+        page = 1
+        while True:
+            response = await self._make_request("GET", f"products/{taxonomy}", params={**params, "page": page})
+            for term in response:
+                yield term
+            
+            if len(response) < per_page:
+                break
+            page += 1
+    
+    async def batch_create_terms(self, taxonomy: str, terms: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        response = await self._make_request("POST", f"products/{taxonomy}/batch", data={"create": terms})
+        
+        return [
+            {
+                "id": term.get("id"),
+                "name": term.get("name"),
+                "slug": term.get("slug"),
+                "error": term.get("error")
+            } for term in response.get("create", [])
+        ]
+    
+    def normalize_order(self, order: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "id": order.get("id"),
+            "number": order.get("number"),
+            "status": order.get("status"),
+            "currency": order.get("currency"),
+            "total": order.get("total"),
+            "subtotal": order.get("subtotal"),
+            "total_tax": order.get("total_tax"),
+            "shipping_total": order.get("shipping_total"),
+            "payment_method": order.get("payment_method"),
+            "payment_method_title": order.get("payment_method_title"),
+            "billing": order.get("billing"),
+            "shipping": order.get("shipping"),
+            "line_items": [
+                {
+                    "id": item.get("id"),
+                    "name": item.get("name"),
+                    "product_id": item.get("product_id"),
+                    "quantity": item.get("quantity"),
+                    "price": item.get("price"),
+                    "subtotal": item.get("subtotal"),
+                    "total": item.get("total")
+                } for item in order.get("line_items", [])
+            ],
+            "date_created": order.get("date_created"),
+            "date_modified": order.get("date_modified")
+        }
+    
     async def get_orders(self, pagination: PaginationParams) -> Dict[str, Any]:
         params = {
             "page": pagination.page,
@@ -175,44 +311,9 @@ class WooCommerceService:
         
         response = await self._make_request("GET", "orders", params=params)
         
-        async with httpx.AsyncClient() as client:
-            count_response = await client.head(
-                f"{self.base_url}/wp-json/wc/v3/orders",
-                headers=self.headers,
-                params={"per_page": 1}
-            )
-            total_orders = int(count_response.headers.get("X-WP-Total", 0))
-            total_pages = int(count_response.headers.get("X-WP-TotalPages", 0))
+        total_orders, total_pages = await self._fetch_totals("orders")
         
-        normalized_orders = []
-        for order in response:
-            normalized_orders.append({
-                "id": order.get("id"),
-                "number": order.get("number"),
-                "status": order.get("status"),
-                "currency": order.get("currency"),
-                "total": order.get("total"),
-                "subtotal": order.get("subtotal"),
-                "total_tax": order.get("total_tax"),
-                "shipping_total": order.get("shipping_total"),
-                "payment_method": order.get("payment_method"),
-                "payment_method_title": order.get("payment_method_title"),
-                "billing": order.get("billing"),
-                "shipping": order.get("shipping"),
-                "line_items": [
-                    {
-                        "id": item.get("id"),
-                        "name": item.get("name"),
-                        "product_id": item.get("product_id"),
-                        "quantity": item.get("quantity"),
-                        "price": item.get("price"),
-                        "subtotal": item.get("subtotal"),
-                        "total": item.get("total")
-                    } for item in order.get("line_items", [])
-                ],
-                "date_created": order.get("date_created"),
-                "date_modified": order.get("date_modified")
-            })
+        normalized_orders = [self.normalize_order(order) for order in response]
         
         return {
             "items": normalized_orders,
@@ -228,6 +329,38 @@ class WooCommerceService:
             "pages": total_pages
         }
     
+    async def iter_orders(
+        self,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        status: Optional[List[str]] = None,
+        modified_after: Optional[str] = None,
+        per_page: int = 100
+    ) -> AsyncIterator[Dict[str, Any]]:
+        params: Dict[str, Any] = {
+            "per_page": per_page,
+            "orderby": "id",
+            "order": "asc"
+        }
+        if after:
+            params["after"] = after
+        if before:
+            params["before"] = before
+        if status:
+            params["status"] = ",".join(status)
+        if modified_after:
+            params["modified_after"] = modified_after
+        
+        page = 1
+        while True:
+            response = await self._make_request("GET", "orders", params={**params, "page": page})
+            for order in response:
+                yield self.normalize_order(order)
+            
+            if len(response) < per_page:
+                break
+            page += 1
+    
     async def create_order(self, order_data: Dict[str, Any]) -> Dict[str, Any]:
         response = await self._make_request("POST", "orders", data=order_data)
         
@@ -261,4 +394,4 @@ class WooCommerceService:
         }
 
 
-woocommerce_service = WooCommerceService() 
\ No newline at end of file
+woocommerce_service = StoreProxy("woocommerce_service", WooCommerceService) 
\ No newline at end of file
@@ -1,64 +1,24 @@
-import httpx
-import base64
-from typing import Dict, Any, Optional, List
-from fastapi import HTTPException
-from app.core.config import settings
+from typing import Dict, Any, Optional, List, AsyncIterator
+from app.core.auth import wordpress_auth
+from app.core.stores import DEFAULT_STORE, StoreProxy
 from app.models.schemas import PaginationParams
+from app.services.upstream_service import UpstreamService
 
 
-class WordPressService:
-    def __init__(self):
-        self.base_url = settings.BASE_URL.rstrip('/')
-        self.username = settings.WP_USERNAME
-        self.password = settings.WP_APP_PASSWORD
-        
-        credentials = f"{self.username}:{self.password}"
-        encoded_credentials = base64.b64encode(credentials.encode()).decode()
+class WordPressService(UpstreamService):
+    api_name = "WordPress"
+    api_path = "wp/v2"
+    service_name = "wordpress"
+    
+    def __init__(self, store_id: str = DEFAULT_STORE):
+        super().__init__(store_id)
+        self.username = self.store.wp_username
+        self.password = self.store.wp_app_password
+        self.auth = wordpress_auth(self.store.wp_auth_type, self.base_url, self.username, self.password, f"wordpress:{store_id}")
         self.headers = {
-            "Authorization": f"Basic {encoded_credentials}",
             "Content-Type": "application/json"
         }
     
-    async def _make_request(
-        self, 
-        method: str, 
-        endpoint: str, 
-        data: Optional[Dict[str, Any]] = None,
-        params: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
-        url = f"{self.base_url}/wp-json/wp/v2/{endpoint}"
-        
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.request(
-                    method=method,
-                    url=url,
-                    headers=self.headers,
-                    json=data,
-                    params=params,
-                    timeout=30.0
-                )
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                error_detail = e.response.json() if e.response.content else {"message": str(e)}
-                raise HTTPException(
-                    status_code=e.response.status_code,
-                    detail={
-                        "error": "WordPress API error",
-                        "details": error_detail,
-                        "status_code": e.response.status_code
-                    }
-                )
-            except httpx.RequestError as e:
-                raise HTTPException(
-                    status_code=500,
-                    detail={
-                        "error": "WordPress API connection error",
-                        "details": str(e)
-                    }
-                )
-    
     async def get_posts(self, pagination: PaginationParams) -> Dict[str, Any]:
         params = {
             "page": pagination.page,
@@ -68,14 +28,7 @@ class WordPressService:
         
         response = await self._make_request("GET", "posts", params=params)
         
-        async with httpx.AsyncClient() as client:
-            count_response = await client.head(
-                f"{self.base_url}/wp-json/wp/v2/posts",
-                headers=self.headers,
-                params={"per_page": 1}
-            )
-            total_posts = int(count_response.headers.get("X-WP-Total", 0))
-            total_pages = int(count_response.headers.get("X-WP-TotalPages", 0))
+        total_posts, total_pages = await self._fetch_totals("posts")
         
         normalized_posts = []
         for post in response:
@@ -143,5 +96,37 @@ class WordPressService:
             "featured_media": response.get("featured_media")
         }
 
+    
+    async def iter_terms(
+        self,
+        taxonomy: str = "categories",
+        order: str = "asc",
+        per_page: int = 100
+    ) -> AsyncIterator[Dict[str, Any]]:
+        params = {
+            "per_page": per_page,
+            "orderby": "id",
+            "order": order,
+            "_fields": "id,name,slug,parent"
+        }
+        
+        page = 1
+        while True:
+            response = await self._make_request("GET", taxonomy, params={**params, "page": page})
+            for term in response:
+                yield term
+            
+            if len(response) < per_page:
+                break
+            page += 1
+    
+    async def create_term(self, taxonomy: str, term: Dict[str, Any]) -> Dict[str, Any]:
+        response = await self._make_request("POST", taxonomy, data=term)
+        
+        return {
+            "id": response.get("id"),
+            "name": response.get("name"),
+            "slug": response.get("slug")
+        }
 
-wordpress_service = WordPressService() 
\ No newline at end of file
+wordpress_service = StoreProxy("wordpress_service", WordPressService) 
\ No newline at end of file
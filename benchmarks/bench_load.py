@@ -0,0 +1,258 @@
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+
+I18N_PRODUCT = {
+    "name": {
+        "en": {"translation": "Leather Bag", "notes": "Product name"},
+        "fr": {"translation": "Sac en cuir", "notes": "Nom du produit"}
+    },
+    "description": {
+        "en": {"translation": "Handmade leather bag with brass fittings.", "notes": "Product description"},
+        "fr": {"translation": "Sac en cuir fait main avec ferrures en laiton.", "notes": "Description du produit"}
+    },
+    "price": "129.00",
+    "stock_quantity": 5,
+    "categories": [{"id": 11, "name": "Bags"}]
+}
+ORDER = {
+    "payment_method": "bacs",
+    "customer": {"first_name": "Anna", "last_name": "Muster", "email": "anna@example.com"},
+    "billing": {"city": "Zurich", "country": "CH"},
+    "items": [{"product_id": 1, "quantity": 2, "name": "Leather Bag", "price": "129.00"}]
+}
+POST = {
+    "title": {
+        "en": {"translation": "Autumn collection", "notes": "Post title"},
+        "fr": {"translation": "Collection d'automne", "notes": "Titre"}
+    },
+    "content": {
+        "en": {"translation": "<p>Our new autumn collection is here.</p>", "notes": "Post content"}
+    },
+    "status": "publish"
+}
+
+SCENARIOS: Dict[str, Tuple[str, str, Optional[Dict[str, Any]]]] = {
+    "list_products": ("GET", "/wc/products?page=1&per_page=20", None),
+    "create_product": ("POST", "/api/sync", {"action_id": "create_wc_product", "data": I18N_PRODUCT, "language": "fr"}),
+    "create_order": ("POST", "/api/sync", {"action_id": "create_wc_order", "data": ORDER, "language": "en"}),
+    "create_post": ("POST", "/api/sync", {"action_id": "create_wp_post", "data": POST, "language": "en"})
+}
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(int(round(fraction * (len(sorted_values) - 1))), len(sorted_values) - 1)]
+
+
+def start_process(args: List[str], env: Optional[Dict[str, str]] = None) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, *args],
+        cwd=ROOT,
+        env={**os.environ, **(env or {})},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE
+    )
+
+
+def wait_until_ready(url: str, process: subprocess.Popen, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"{url} exited during startup:\n{process.stderr.read().decode(errors='replace')}")
+        try:
+            httpx.get(url, timeout=1.0)
+            return
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    raise RuntimeError(f"{url} did not become ready within {timeout}s")
+
+
+def stop_process(process: subprocess.Popen) -> None:
+    process.terminate()
+    try:
+        process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+async def run_level(
+    client: httpx.AsyncClient,
+    upstream: httpx.AsyncClient,
+    scenario: str,
+    concurrency: int,
+    requests: int,
+    warmup: int
+) -> Dict[str, Any]:
+    method, path, body = SCENARIOS[scenario]
+
+    async def send() -> Tuple[float, int]:
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, path, json=body)
+            status = response.status_code
+        except httpx.HTTPError:
+            status = 0
+        return time.perf_counter() - started, status
+
+    for _ in range(warmup):
+        await send()
+    await upstream.post("/__reset")
+
+    latencies: List[float] = []
+    statuses: Dict[str, int] = {}
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            latency, status = await send()
+            latencies.append(latency)
+            statuses[str(status)] = statuses.get(str(status), 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - started
+
+    upstream_stats = (await upstream.get("/__stats")).json()
+    latencies.sort()
+    errors = sum(count for status, count in statuses.items() if not status.startswith("2"))
+    return {
+        "scenario": scenario,
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+        "max_ms": round(latencies[-1] * 1000, 2) if latencies else 0.0,
+        "errors": errors,
+        "statuses": statuses,
+        "upstream_requests": upstream_stats["total"],
+        "upstream_requests_per_call": round(upstream_stats["total"] / len(latencies), 2) if latencies else 0.0,
+        "upstream_by_route": upstream_stats["by_route"],
+        "upstream_injected_errors": upstream_stats["injected_errors"]
+    }
+
+
+async def run_all(args: argparse.Namespace, app_url: str, upstream_url: str) -> List[Dict[str, Any]]:
+    results = []
+    max_concurrency = max(args.concurrency)
+    limits = httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency)
+    async with httpx.AsyncClient(base_url=app_url, timeout=60.0, limits=limits) as client, \
+            httpx.AsyncClient(base_url=upstream_url, timeout=10.0) as upstream:
+        for scenario in args.scenarios:
+            for concurrency in args.concurrency:
+                result = await run_level(client, upstream, scenario, concurrency, args.requests, args.warmup)
+                results.append(result)
+                print(
+                    f"{scenario:<16}{concurrency:>6}{result['throughput_rps']:>10}{result['p50_ms']:>10}"
+                    f"{result['p95_ms']:>10}{result['p99_ms']:>10}{result['errors']:>8}"
+                    f"{result['upstream_requests_per_call']:>10}"
+                )
+    return results
+
+
+def parse_list(value: str, cast: Callable = str) -> List[Any]:
+    return [cast(item.strip()) for item in value.split(",") if item.strip()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="End-to-end load benchmark against a local WooCommerce/WordPress stand-in")
+    parser.add_argument("--scenarios", type=parse_list, default=list(SCENARIOS))
+    parser.add_argument("--concurrency", type=lambda value: parse_list(value, int), default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=500, help="Requests per scenario and concurrency level")
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--jitter-ms", type=float, default=5.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--tail-rate", type=float, default=0.0, help="Fraction of upstream requests slowed by --tail-ms")
+    parser.add_argument("--tail-ms", type=float, default=0.0)
+    parser.add_argument("--app-port", type=int, default=8100)
+    parser.add_argument("--upstream-port", type=int, default=8101)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    app_url = f"http://127.0.0.1:{args.app_port}"
+    upstream_url = f"http://127.0.0.1:{args.upstream_port}"
+    commit = git_commit()
+
+    upstream_process = start_process([
+        "benchmarks/fake_upstream.py",
+        "--port", str(args.upstream_port),
+        "--latency-ms", str(args.latency_ms),
+        "--jitter-ms", str(args.jitter_ms),
+        "--error-rate", str(args.error_rate),
+        "--tail-rate", str(args.tail_rate),
+        "--tail-ms", str(args.tail_ms)
+    ])
+    app_process = start_process(
+        ["-m", "uvicorn", "app.main:app", "--port", str(args.app_port), "--log-level", "warning", "--no-access-log"],
+        env={"BASE_URL": upstream_url, "ENABLE_SCHEDULER": "false", "DEBUG": "false"}
+    )
+    try:
+        wait_until_ready(f"{upstream_url}/__stats", upstream_process)
+        wait_until_ready(f"{app_url}/health", app_process)
+
+        print(f"upstream latency {args.latency_ms}±{args.jitter_ms} ms, error rate {args.error_rate}, commit {commit}")
+        print(f"{'scenario':<16}{'conc':>6}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}{'up/call':>10}")
+        results = asyncio.run(run_all(args, app_url, upstream_url))
+    finally:
+        stop_process(app_process)
+        stop_process(upstream_process)
+
+    timestamp = datetime.now(timezone.utc)
+    output = args.output or ROOT / "benchmarks" / "results" / f"load-{timestamp:%Y%m%dT%H%M%S}-{commit or 'nogit'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({
+        "commit": commit,
+        "timestamp": timestamp.isoformat(),
+        "python": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+        "upstream": {
+            "latency_ms": args.latency_ms,
+            "jitter_ms": args.jitter_ms,
+            "error_rate": args.error_rate,
+            "tail_rate": args.tail_rate,
+            "tail_ms": args.tail_ms
+        },
+        "requests_per_level": args.requests,
+        "results": results
+    }, indent=2))
+    print(f"results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import orjson
+
+from app.api.validation import check_product_schema
+from app.core.offload import CpuOffloader
+from app.services.i18n_template_service import i18n_template_service
+
+
+def build_product(index: int, description_kb: int) -> Dict[str, Any]:
+    paragraph = "<p>Handmade leather bag with brass fittings and a cotton lining.</p>"
+    description = paragraph * max(description_kb * 1024 // len(paragraph), 1)
+    return {
+        "name": {
+            "en": {"translation": f"Product {index}", "notes": "Product name", "limit": 120},
+            "fr": {"translation": f"Produit {index}", "notes": "Nom du produit", "limit": 120}
+        },
+        "description": {
+            "en": {"translation": description, "notes": "Product description"},
+            "fr": {"translation": description, "notes": "Description du produit"}
+        },
+        "short_description": {
+            "en": {"translation": "Short description", "notes": "Summary"}
+        },
+        "price": "129.00",
+        "stock_quantity": 5,
+        "categories": [{"id": c, "name": f"Category {c}"} for c in range(10)],
+        "images": [{"url": f"https://example.com/{index}/{m}.jpg", "name": f"img-{m}"} for m in range(10)],
+        "attributes": [
+            {"name": f"Attribute {a}", "visible": True, "variation": False, "options": [f"Option {o}" for o in range(20)]}
+            for a in range(10)
+        ]
+    }
+
+
+async def ticker(samples: List[float], stop: asyncio.Event, interval: float = 0.005) -> None:
+    while not stop.is_set():
+        expected = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        samples.append(max(time.perf_counter() - expected, 0.0))
+
+
+async def run_mode(mode: str, workers: int, payloads: List[Dict[str, Any]], concurrency: int) -> Dict[str, Any]:
+    offloader = CpuOffloader(mode, workers, threshold_bytes=0)
+    await offloader.start()
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def process(payload: Dict[str, Any]) -> None:
+        async with semaphore:
+            await offloader.run(check_product_schema, payload, payload=payload)
+            await offloader.run(i18n_template_service.transform_to_wc_product_i18n, payload, "fr", payload=payload)
+
+    lags: List[float] = []
+    stop = asyncio.Event()
+    lag_task = asyncio.create_task(ticker(lags, stop))
+
+    started = time.perf_counter()
+    await asyncio.gather(*[process(payload) for payload in payloads])
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await lag_task
+    await offloader.stop()
+
+    lags.sort()
+    return {
+        "mode": mode,
+        "workers": workers if mode == "process" else 0,
+        "elapsed_s": round(elapsed, 3),
+        "payloads_per_s": round(len(payloads) / elapsed, 1),
+        "loop_lag_p99_ms": round(lags[int(len(lags) * 0.99) - 1] * 1000, 2) if lags else 0.0,
+        "loop_lag_max_ms": round(lags[-1] * 1000, 2) if lags else 0.0
+    }
+
+
+async def run(args: argparse.Namespace) -> None:
+    payloads = [build_product(i, args.description_kb) for i in range(args.payloads)]
+    payload_bytes = len(orjson.dumps(payloads[0]))
+
+    worker_counts = sorted({1, max(args.workers // 2, 1), args.workers})
+    results = [await run_mode("inline", 0, payloads, args.concurrency)]
+    for workers in worker_counts:
+        results.append(await run_mode("process", workers, payloads, args.concurrency))
+
+    print(f"{args.payloads} products of {payload_bytes} bytes, validate + transform, {os.cpu_count()} CPUs")
+    print(f"{'mode':<10}{'workers':>8}{'elapsed s':>12}{'payloads/s':>12}{'lag p99 ms':>12}{'lag max ms':>12}")
+    for result in results:
+        print(
+            f"{result['mode']:<10}{result['workers']:>8}{result['elapsed_s']:>12}"
+            f"{result['payloads_per_s']:>12}{result['loop_lag_p99_ms']:>12}{result['loop_lag_max_ms']:>12}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare inline and process-pool transformation/validation")
+    parser.add_argument("--payloads", type=int, default=200)
+    parser.add_argument("--description-kb", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--concurrency", type=int, default=32)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import argparse
+import gzip
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.compression import CompressionMiddleware
+from app.core.responses import FastJSONResponse
+from app.models.schemas import PaginatedResponse
+
+
+def build_products_page(count: int) -> Dict[str, Any]:
+    items = []
+    for i in range(count):
+        items.append({
+            "id": 1000 + i,
+            "name": f"Product {i}",
+            "type": "simple",
+            "status": "publish",
+            "price": "29.99",
+            "regular_price": "29.99",
+            "sale_price": "",
+            "description": "<p>" + "Long product description. " * 40 + "</p>",
+            "short_description": "<p>Short description</p>",
+            "categories": [
+                {"id": 15 + c, "name": f"Category {c}", "slug": f"category-{c}"} for c in range(3)
+            ],
+            "images": [
+                {"id": 200 + m, "src": f"https://example.com/img/{i}-{m}.jpg", "name": f"img-{m}", "alt": ""}
+                for m in range(4)
+            ],
+            "attributes": [
+                {"id": 1, "name": "Color", "visible": True, "variation": True, "options": ["Red", "Blue", "Green"]},
+                {"id": 2, "name": "Size", "visible": True, "variation": True, "options": ["S", "M", "L", "XL"]}
+            ],
+            "stock_quantity": 12,
+            "stock_status": "instock",
+            "weight": "1.2",
+            "dimensions": {"length": "10", "width": "20", "height": "5"},
+            "date_created": "2024-01-15T10:30:00",
+            "date_modified": "2024-01-15T10:30:00"
+        })
+    return {
+        "items": items,
+        "pagination": {"page": 1, "per_page": count, "total": 5000, "pages": 5000 // count},
+        "total": 5000,
+        "page": 1,
+        "per_page": count,
+        "pages": 5000 // count
+    }
+
+
+def build_app(page: Dict[str, Any]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/default", response_model=PaginatedResponse)
+    async def default_path():
+        return page
+
+    @app.get("/fast", response_model=PaginatedResponse)
+    async def fast_path():
+        return FastJSONResponse(page)
+
+    compressed = FastAPI()
+    compressed.add_middleware(CompressionMiddleware, minimum_size=1024)
+    compressed.mount("/", app)
+    return compressed
+
+
+def measure(client: TestClient, path: str, iterations: int, headers: Dict[str, str]) -> Dict[str, Any]:
+    for _ in range(20):
+        client.get(path, headers=headers)
+
+    timings: List[float] = []
+    response = None
+    for _ in range(iterations):
+        started = time.perf_counter()
+        response = client.get(path, headers=headers)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    timings.sort()
+    return {
+        "path": path,
+        "accept_encoding": headers.get("Accept-Encoding", "identity"),
+        "mean_ms": round(statistics.fmean(timings), 3),
+        "p50_ms": round(timings[len(timings) // 2], 3),
+        "p95_ms": round(timings[int(len(timings) * 0.95) - 1], 3),
+        "wire_bytes": int(response.headers.get("content-length", len(response.content))),
+        "content_encoding": response.headers.get("content-encoding", "identity")
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare default and fast JSON response paths")
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=300)
+    args = parser.parse_args()
+
+    page = build_products_page(args.items)
+    client = TestClient(build_app(page))
+    identity = {"Accept-Encoding": "identity"}
+
+    results = [
+        measure(client, "/default", args.iterations, identity),
+        measure(client, "/fast", args.iterations, identity),
+        measure(client, "/fast", args.iterations, {"Accept-Encoding": "gzip"}),
+        measure(client, "/fast", args.iterations, {"Accept-Encoding": "br, gzip"})
+    ]
+
+    print(f"{args.items}-item products page, {args.iterations} iterations")
+    print(f"{'path':<10}{'encoding':<12}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'bytes':>10}")
+    for result in results:
+        print(
+            f"{result['path']:<10}{result['content_encoding']:<12}"
+            f"{result['mean_ms']:>10}{result['p50_ms']:>10}{result['p95_ms']:>10}{result['wire_bytes']:>10}"
+        )
+
+    raw = len(FastJSONResponse(page).body)
+    print(f"uncompressed body: {raw} bytes, gzip -6: {len(gzip.compress(FastJSONResponse(page).body, 6))} bytes")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,112 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+
+PROBE = """
+import json, time
+started = time.perf_counter()
+import app.main
+imported = time.perf_counter()
+from fastapi.testclient import TestClient
+client_ready = time.perf_counter()
+with TestClient(app.main.app) as client:
+    booted = time.perf_counter()
+    status = client.get("/health").status_code
+    responded = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "boot_ms": (booted - client_ready) * 1000,
+    "first_request_ms": (responded - booted) * 1000,
+    "status": status
+}))
+"""
+
+
+def run_probe(env: Dict[str, str]) -> Dict[str, Any]:
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-c", PROBE], cwd=ROOT, env=env, capture_output=True, text=True, check=False
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"startup probe failed:\n{completed.stderr}")
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    result["process_ms"] = (time.perf_counter() - started) * 1000
+    return result
+
+
+def import_profile(env: Dict[str, str], top: int) -> List[Tuple[str, float, float]]:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=False
+    )
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = [part.strip() for part in line[len("import time:"):].split("|")]
+        rows.append((name, int(self_us) / 1000, int(cumulative_us) / 1000))
+    rows.sort(key=lambda row: row[1], reverse=True)
+    return rows[:top]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure cold import and boot time of the API and enforce a budget")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--import-budget-ms", type=float, default=1500.0)
+    parser.add_argument("--boot-budget-ms", type=float, default=500.0)
+    parser.add_argument("--top", type=int, default=15, help="Show the slowest modules by self import time (0 to skip)")
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    env = {**os.environ, "PYTHONPATH": str(ROOT), "ENABLE_SCHEDULER": "false"}
+    runs = [run_probe(env) for _ in range(args.repeat)]
+    summary = {
+        key: {
+            "median": round(statistics.median(run[key] for run in runs), 1),
+            "min": round(min(run[key] for run in runs), 1),
+            "max": round(max(run[key] for run in runs), 1)
+        }
+        for key in ("import_ms", "boot_ms", "first_request_ms", "process_ms")
+    }
+
+    print(f"{'phase':<20}{'median ms':>12}{'min ms':>10}{'max ms':>10}")
+    for key, values in summary.items():
+        print(f"{key:<20}{values['median']:>12}{values['min']:>10}{values['max']:>10}")
+
+    if args.top:
+        print(f"\n{'module':<60}{'self ms':>10}{'cumulative ms':>16}")
+        for name, self_ms, cumulative_ms in import_profile(env, args.top):
+            print(f"{name:<60}{self_ms:>10.1f}{cumulative_ms:>16.1f}")
+
+    failures = []
+    if summary["import_ms"]["median"] > args.import_budget_ms:
+        failures.append(f"import {summary['import_ms']['median']} ms > budget {args.import_budget_ms} ms")
+    if summary["boot_ms"]["median"] > args.boot_budget_ms:
+        failures.append(f"boot {summary['boot_ms']['median']} ms > budget {args.boot_budget_ms} ms")
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps({
+            "budget": {"import_ms": args.import_budget_ms, "boot_ms": args.boot_budget_ms},
+            "summary": summary,
+            "runs": runs,
+            "failures": failures
+        }, indent=2))
+        print(f"results written to {args.output}")
+
+    if failures:
+        print("\nstartup budget exceeded: " + "; ".join(failures), file=sys.stderr)
+        sys.exit(1)
+    print("\nstartup within budget")
+
+
+if __name__ == "__main__":
+    main()
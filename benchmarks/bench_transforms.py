@@ -0,0 +1,162 @@
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import replace, asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from catalog import CatalogSpec, generate_product, generate_order, generate_post, flatten
+
+from app.api import unified, validation
+from app.services.i18n_template_service import i18n_template_service
+from app.services.template_service import template_service
+
+CASES: Dict[str, Tuple[Callable[[CatalogSpec], Any], Callable[[Any], Any]]] = {
+    "i18n.wc_product": (
+        lambda spec: generate_product(spec, 1),
+        lambda data: i18n_template_service.transform_to_wc_product_i18n(data, "fr")
+    ),
+    "i18n.wc_order": (
+        lambda spec: generate_order(spec, 1),
+        lambda data: i18n_template_service.transform_to_wc_order_i18n(data, "fr")
+    ),
+    "i18n.wp_post": (
+        lambda spec: generate_post(spec, 1),
+        lambda data: i18n_template_service.transform_to_wp_post_i18n(data, "fr")
+    ),
+    "template.wc_product": (
+        lambda spec: flatten(generate_product(spec, 1)),
+        template_service.transform_to_wc_product
+    ),
+    "template.wc_order": (
+        lambda spec: flatten(generate_order(spec, 1)),
+        template_service.transform_to_wc_order
+    ),
+    "template.wp_post": (
+        lambda spec: flatten(generate_post(spec, 1)),
+        template_service.transform_to_wp_post
+    ),
+    "validation.product": (
+        lambda spec: generate_product(spec, 1),
+        validation.check_product_schema
+    ),
+    "validation.i18n": (
+        lambda spec: generate_product(spec, 1),
+        validation.check_i18n_structure
+    ),
+    "sync.validate_product": (
+        lambda spec: generate_product(spec, 1),
+        unified.validate_product_schema
+    ),
+    "sync.validate_i18n": (
+        lambda spec: generate_product(spec, 1),
+        unified.validate_i18n_structure
+    )
+}
+
+DIMENSIONS = {
+    "languages": [1, 3, 5],
+    "description_chars": [200, 5000, 50000],
+    "list_size": [0, 10, 100],
+    "extra_fields": [0, 10, 50]
+}
+
+
+def calibrate(func: Callable[[], Any], min_time: float) -> int:
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        if time.perf_counter() - started >= min_time:
+            return number
+        number *= 2
+
+
+def measure(call: Callable[[Any], Any], data: Any, repeat: int, min_time: float) -> Dict[str, Any]:
+    func = lambda: call(data)
+    number = calibrate(func, min_time)
+
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        timings.append((time.perf_counter() - started) / number)
+
+    tracemalloc.start()
+    try:
+        func()
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        snapshot_before = tracemalloc.take_snapshot()
+        func()
+        after, peak = tracemalloc.get_traced_memory()
+        snapshot_after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    allocated_blocks = sum(
+        stat.count_diff for stat in snapshot_after.compare_to(snapshot_before, "filename") if stat.count_diff > 0
+    )
+    return {
+        "median_us": round(statistics.median(timings) * 1e6, 2),
+        "min_us": round(min(timings) * 1e6, 2),
+        "peak_kib": round((peak - before) / 1024, 1),
+        "retained_bytes": after - before,
+        "retained_blocks": allocated_blocks,
+        "iterations": number * repeat
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Micro-benchmark transformations and validations on synthetic payloads")
+    parser.add_argument("--cases", default=",".join(CASES), help="Comma-separated case names")
+    parser.add_argument("--dimensions", default=",".join(DIMENSIONS), help="Dimensions to sweep one at a time")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05, help="Minimum seconds per timing round")
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    cases = [case for case in args.cases.split(",") if case]
+    dimensions = [dimension for dimension in args.dimensions.split(",") if dimension]
+    unknown = (set(cases) - set(CASES)) | (set(dimensions) - set(DIMENSIONS))
+    if unknown:
+        parser.error(f"unknown cases or dimensions: {', '.join(sorted(unknown))}")
+
+    baseline = CatalogSpec()
+    results: List[Dict[str, Any]] = []
+    print(f"baseline {asdict(baseline)}")
+    print(f"{'case':<24}{'dimension':<20}{'value':>8}{'bytes':>10}{'median us':>12}{'peak KiB':>10}{'blocks':>8}")
+    for dimension in dimensions:
+        for value in DIMENSIONS[dimension]:
+            spec = replace(baseline, **{dimension: value})
+            for case in cases:
+                build, call = CASES[case]
+                data = build(spec)
+                result = {
+                    "case": case,
+                    "dimension": dimension,
+                    "value": value,
+                    "payload_bytes": len(json.dumps(data)),
+                    **measure(call, data, args.repeat, args.min_time)
+                }
+                results.append(result)
+                print(
+                    f"{case:<24}{dimension:<20}{value:>8}{result['payload_bytes']:>10}"
+                    f"{result['median_us']:>12}{result['peak_kib']:>10}{result['retained_blocks']:>8}"
+                )
+
+    if args.output:
+        args.output.write_text(json.dumps({"baseline": asdict(baseline), "results": results}, indent=2))
+        print(f"results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
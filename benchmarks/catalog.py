@@ -0,0 +1,173 @@
+import argparse
+import json
+import random
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+LANGUAGES = ("en", "fr", "de", "it", "es")
+WORDS = (
+    "leather", "brass", "cotton", "handmade", "durable", "classic", "modern", "travel",
+    "compact", "waterproof", "premium", "organic", "vintage", "lightweight", "elegant",
+    "pocket", "strap", "zipper", "lining", "stitching", "canvas", "wool", "linen", "oak"
+)
+
+
+@dataclass(frozen=True)
+class CatalogSpec:
+    languages: int = 2
+    description_chars: int = 500
+    list_size: int = 3
+    extra_fields: int = 0
+    seed: int = 0
+
+
+def words(rng: random.Random, count: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(count))
+
+
+def html(rng: random.Random, chars: int) -> str:
+    paragraphs = []
+    length = 0
+    while length < chars:
+        paragraph = f"<p>{words(rng, rng.randint(8, 24)).capitalize()}.</p>"
+        paragraphs.append(paragraph)
+        length += len(paragraph)
+    return "".join(paragraphs)[:max(chars, 0)]
+
+
+def i18n_field(rng: random.Random, spec: CatalogSpec, text: str, notes: str, limit: Optional[int] = None) -> Dict[str, Any]:
+    field = {}
+    for language in LANGUAGES[:max(spec.languages, 1)]:
+        entry = {"translation": f"{text} ({language})" if language != "en" else text, "notes": notes}
+        if limit is not None:
+            entry["limit"] = limit
+        field[language] = entry
+    return field
+
+
+def generate_product(spec: CatalogSpec, index: int) -> Dict[str, Any]:
+    rng = random.Random(spec.seed * 1_000_003 + index)
+    product = {
+        "name": i18n_field(rng, spec, f"{words(rng, 3).title()} {index}", "Product name", 120),
+        "description": i18n_field(rng, spec, html(rng, spec.description_chars), "Product description"),
+        "short_description": i18n_field(rng, spec, words(rng, 12).capitalize(), "Short description", 300),
+        "price": f"{rng.uniform(5, 500):.2f}",
+        "type": "simple",
+        "stock_quantity": rng.randint(0, 200),
+        "weight": f"{rng.uniform(0.1, 10):.1f}",
+        "categories": [{"id": 10 + c, "name": words(rng, 2).title()} for c in range(spec.list_size)],
+        "images": [
+            {"url": f"https://shop.example.com/img/{index}-{m}.jpg", "name": f"image-{m}"}
+            for m in range(spec.list_size)
+        ],
+        "attributes": [
+            {
+                "name": words(rng, 1).title(),
+                "visible": True,
+                "variation": False,
+                "options": [words(rng, 1) for _ in range(spec.list_size)]
+            }
+            for _ in range(spec.list_size)
+        ]
+    }
+    for n in range(spec.extra_fields):
+        product[f"custom_field_{n}"] = i18n_field(rng, spec, words(rng, 6), f"Custom field {n}")
+    return product
+
+
+def generate_order(spec: CatalogSpec, index: int) -> Dict[str, Any]:
+    rng = random.Random(spec.seed * 1_000_003 + index)
+    address = {
+        "first_name": words(rng, 1).title(),
+        "last_name": words(rng, 1).title(),
+        "address_1": f"{rng.randint(1, 200)} {words(rng, 2).title()} Street",
+        "city": "Zurich",
+        "postcode": str(rng.randint(1000, 9999)),
+        "country": "CH"
+    }
+    order = {
+        "payment_method": "bacs",
+        "payment_method_title": i18n_field(rng, spec, "Bank transfer", "Payment method title"),
+        "set_paid": False,
+        "billing": {**address, "email": f"customer{index}@example.com", "phone": "+41 44 000 00 00"},
+        "shipping": dict(address),
+        "customer_note": i18n_field(rng, spec, html(rng, spec.description_chars), "Customer note"),
+        "line_items": [
+            {
+                "product_id": rng.randint(1, 1000),
+                "quantity": rng.randint(1, 5),
+                "name": words(rng, 3).title(),
+                "price": f"{rng.uniform(5, 500):.2f}"
+            }
+            for _ in range(max(spec.list_size, 1))
+        ]
+    }
+    for n in range(spec.extra_fields):
+        order[f"custom_field_{n}"] = i18n_field(rng, spec, words(rng, 6), f"Custom field {n}")
+    return order
+
+
+def generate_post(spec: CatalogSpec, index: int) -> Dict[str, Any]:
+    rng = random.Random(spec.seed * 1_000_003 + index)
+    post = {
+        "title": i18n_field(rng, spec, f"{words(rng, 5).capitalize()} {index}", "Post title", 120),
+        "content": i18n_field(rng, spec, html(rng, spec.description_chars), "Post content"),
+        "excerpt": i18n_field(rng, spec, words(rng, 20).capitalize(), "Post excerpt", 300),
+        "status": "publish",
+        "categories": [{"id": 1 + c} for c in range(spec.list_size)],
+        "tags": [{"id": 100 + t} for t in range(spec.list_size)],
+        "featured_media": 0,
+        "meta": {f"meta_{m}": words(rng, 2) for m in range(spec.list_size)}
+    }
+    for n in range(spec.extra_fields):
+        post[f"custom_field_{n}"] = i18n_field(rng, spec, words(rng, 6), f"Custom field {n}")
+    return post
+
+
+def flatten(record: Dict[str, Any], language: str = "en") -> Dict[str, Any]:
+    flat = {}
+    for key, value in record.items():
+        if isinstance(value, dict) and "en" in value and isinstance(value["en"], dict):
+            flat[key] = (value.get(language) or value["en"])["translation"]
+        else:
+            flat[key] = value
+    return flat
+
+
+def generate_catalog(spec: CatalogSpec, count: int) -> Dict[str, Any]:
+    return {
+        "spec": asdict(spec),
+        "products": [generate_product(spec, i) for i in range(count)],
+        "orders": [generate_order(spec, i) for i in range(count)],
+        "posts": [generate_post(spec, i) for i in range(count)]
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic multilingual catalog")
+    parser.add_argument("--count", type=int, default=100)
+    parser.add_argument("--languages", type=int, default=2, choices=range(1, len(LANGUAGES) + 1))
+    parser.add_argument("--description-chars", type=int, default=500)
+    parser.add_argument("--list-size", type=int, default=3)
+    parser.add_argument("--extra-fields", type=int, default=0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    spec = CatalogSpec(
+        languages=args.languages,
+        description_chars=args.description_chars,
+        list_size=args.list_size,
+        extra_fields=args.extra_fields,
+        seed=args.seed
+    )
+    content = json.dumps(generate_catalog(spec, args.count), ensure_ascii=False, indent=2)
+    if args.output:
+        args.output.write_text(content, encoding="utf-8")
+    else:
+        print(content)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,358 @@
+import argparse
+import asyncio
+import collections
+import random
+import re
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+NUMERIC_SEGMENT = re.compile(r"/\d+(?=/|$)")
+RENDERED_FIELDS = ("title", "content", "excerpt")
+TERM_COLLECTIONS = ("wc/v3/products/categories", "wp/v2/categories", "wp/v2/tags")
+
+
+def build_products(count: int) -> List[Dict[str, Any]]:
+    created = datetime(2024, 1, 1)
+    products = []
+    for i in range(1, count + 1):
+        products.append({
+            "id": i,
+            "name": f"Product {i}",
+            "slug": f"product-{i}",
+            "permalink": f"https://shop.example.com/product/product-{i}/",
+            "type": "simple",
+            "status": "publish",
+            "sku": f"SKU-{i:06d}",
+            "price": "29.99",
+            "regular_price": "29.99",
+            "sale_price": "",
+            "description": "<p>" + "Long product description. " * 40 + "</p>",
+            "short_description": "<p>Short description</p>",
+            "categories": [{"id": 10 + c, "name": f"Category {c}", "slug": f"category-{c}"} for c in range(3)],
+            "images": [
+                {"id": 100 + m, "src": f"https://shop.example.com/img/{i}-{m}.jpg", "name": f"img-{m}", "alt": ""}
+                for m in range(4)
+            ],
+            "attributes": [
+                {"id": 1, "name": "Color", "visible": True, "variation": False, "options": ["Red", "Blue", "Green"]},
+                {"id": 2, "name": "Size", "visible": True, "variation": False, "options": ["S", "M", "L", "XL"]}
+            ],
+            "stock_quantity": i % 50,
+            "stock_status": "instock",
+            "weight": "1.2",
+            "dimensions": {"length": "10", "width": "20", "height": "5"},
+            "date_created": (created + timedelta(hours=i)).isoformat(),
+            "date_modified": (created + timedelta(hours=i)).isoformat()
+        })
+    return products
+
+
+def build_variations(product: Dict[str, Any], count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "id": product["id"] * 1000 + j,
+            "parent_id": product["id"],
+            "sku": f"{product['sku']}-V{j}",
+            "price": product["price"],
+            "regular_price": product["regular_price"],
+            "stock_quantity": j,
+            "manage_stock": True,
+            "attributes": [{"id": 2, "name": "Size", "option": option}]
+        }
+        for j, option in enumerate(["S", "M", "L", "XL"][:count], start=1)
+    ]
+
+
+def build_orders(count: int) -> List[Dict[str, Any]]:
+    created = datetime(2024, 1, 1)
+    statuses = ["completed", "processing", "on-hold", "cancelled"]
+    orders = []
+    for i in range(1, count + 1):
+        line_items = [
+            {
+                "id": i * 10 + j,
+                "name": f"Product {j + 1}",
+                "product_id": j + 1,
+                "sku": f"SKU-{j + 1:06d}",
+                "quantity": j + 1,
+                "price": 29.99,
+                "subtotal": f"{29.99 * (j + 1):.2f}",
+                "total": f"{29.99 * (j + 1):.2f}"
+            }
+            for j in range(1 + i % 4)
+        ]
+        orders.append({
+            "id": i,
+            "number": str(i),
+            "status": statuses[i % len(statuses)],
+            "currency": "CHF",
+            "total": f"{sum(float(item['total']) for item in line_items):.2f}",
+            "payment_method": "bacs",
+            "payment_method_title": "Bank transfer",
+            "billing": {"first_name": "Anna", "last_name": "Muster", "city": "Zurich", "country": "CH", "email": f"anna{i}@example.com"},
+            "shipping": {"first_name": "Anna", "last_name": "Muster", "city": "Zurich", "country": "CH"},
+            "line_items": line_items,
+            "date_created": (created + timedelta(hours=i)).isoformat(),
+            "date_modified": (created + timedelta(hours=i)).isoformat()
+        })
+    return orders
+
+
+def build_posts(count: int) -> List[Dict[str, Any]]:
+    created = datetime(2024, 1, 1)
+    return [
+        {
+            "id": i,
+            "date": (created + timedelta(hours=i)).isoformat(),
+            "modified": (created + timedelta(hours=i)).isoformat(),
+            "slug": f"post-{i}",
+            "status": "publish",
+            "link": f"https://shop.example.com/post-{i}/",
+            "title": {"rendered": f"Post {i}"},
+            "content": {"rendered": "<p>" + "Post content. " * 80 + "</p>", "protected": False},
+            "excerpt": {"rendered": "<p>Excerpt</p>", "protected": False},
+            "author": 1,
+            "featured_media": 0,
+            "categories": [1],
+            "tags": [],
+            "meta": {}
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def build_terms(count: int, label: str) -> List[Dict[str, Any]]:
+    return [
+        {"id": i, "name": f"{label} {i}", "slug": f"{label.lower()}-{i}", "count": 0}
+        for i in range(1, count + 1)
+    ]
+
+
+def term_exists(items: List[Dict[str, Any]], body: Dict[str, Any]) -> Dict[str, Any]:
+    for item in items:
+        if item["name"].casefold() == str(body.get("name", "")).casefold():
+            return {
+                "code": "term_exists",
+                "message": "A term with the name provided already exists.",
+                "data": {"status": 400, "term_id": item["id"], "resource_id": item["id"]}
+            }
+    return {}
+
+
+class FakeUpstream:
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        tail_rate: float = 0.0,
+        tail_ms: float = 0.0,
+        products: int = 500,
+        orders: int = 500,
+        posts: int = 200,
+        terms: int = 50,
+        variable_products: int = 0,
+        seed: int = 42
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.tail_rate = tail_rate
+        self.tail_ms = tail_ms
+        self.random = random.Random(seed)
+        self.collections = {
+            "wc/v3/products": build_products(products),
+            "wc/v3/orders": build_orders(orders),
+            "wp/v2/posts": build_posts(posts),
+            "wc/v3/products/categories": build_terms(terms, "Category"),
+            "wp/v2/categories": build_terms(terms, "Category"),
+            "wp/v2/tags": build_terms(terms, "Tag")
+        }
+        for product in self.collections["wc/v3/products"][:variable_products]:
+            product["type"] = "variable"
+            self.collections[f"wc/v3/products/{product['id']}/variations"] = build_variations(product, 4)
+        self.requests: Dict[str, int] = collections.Counter()
+        self.injected_errors = 0
+        self.next_id = 100000
+
+    def new_id(self) -> int:
+        self.next_id += 1
+        return self.next_id
+
+    async def delay(self) -> None:
+        latency = self.latency_ms + self.random.uniform(-self.jitter_ms, self.jitter_ms)
+        if self.tail_rate > 0 and self.random.random() < self.tail_rate:
+            latency += self.tail_ms
+        if latency > 0:
+            await asyncio.sleep(latency / 1000)
+
+    def record(self, request: Request) -> bool:
+        route = NUMERIC_SEGMENT.sub("/{id}", request.url.path)
+        self.requests[f"{request.method} {route}"] += 1
+        if self.error_rate > 0 and self.random.random() < self.error_rate:
+            self.injected_errors += 1
+            return True
+        return False
+
+    async def handle(self, request: Request) -> JSONResponse:
+        failed = self.record(request)
+        await self.delay()
+        if failed:
+            return JSONResponse(
+                {"code": "internal_server_error", "message": "Injected failure", "data": {"status": 500}},
+                status_code=500
+            )
+
+        resource = f"{request.path_params['namespace']}/{request.path_params['resource']}"
+        items = self.collections.get(resource)
+        if items is None:
+            return JSONResponse(
+                {"code": "rest_no_route", "message": "No route was found", "data": {"status": 404}},
+                status_code=404
+            )
+
+        item_id = request.path_params.get("item_id")
+        if request.method in ("GET", "HEAD") and item_id is None:
+            return self.list(request, items)
+        if request.method in ("GET", "HEAD"):
+            for item in items:
+                if item["id"] == item_id:
+                    return JSONResponse(item)
+            return JSONResponse(
+                {"code": "rest_invalid_id", "message": "Invalid ID", "data": {"status": 404}},
+                status_code=404
+            )
+        if request.method == "POST" and item_id is None and resource in TERM_COLLECTIONS:
+            body = await request.json()
+            error = term_exists(items, body)
+            if error:
+                return JSONResponse(error, status_code=400)
+            return JSONResponse(self.add_term(items, body), status_code=201)
+        if request.method == "POST" and item_id is None:
+            body = await request.json()
+            if resource == "wp/v2/posts":
+                body = {
+                    key: {"raw": value, "rendered": value} if key in RENDERED_FIELDS and isinstance(value, str) else value
+                    for key, value in body.items()
+                }
+            return JSONResponse({**self.template(items), **body, "id": self.new_id()}, status_code=201)
+        return JSONResponse(
+            {"code": "rest_no_route", "message": "Method not supported", "data": {"status": 405}},
+            status_code=405
+        )
+
+    async def handle_batch(self, request: Request) -> JSONResponse:
+        failed = self.record(request)
+        await self.delay()
+        if failed:
+            return JSONResponse(
+                {"code": "internal_server_error", "message": "Injected failure", "data": {"status": 500}},
+                status_code=500
+            )
+
+        body = await request.json()
+        resource = f"{request.path_params['namespace']}/{request.path_params['resource']}"
+        if resource in TERM_COLLECTIONS:
+            return JSONResponse({"create": [self.create_term(self.collections[resource], item) for item in body.get("create", [])]})
+        return JSONResponse({
+            "create": [{**item, "id": self.new_id()} for item in body.get("create", [])],
+            "update": [dict(item) for item in body.get("update", [])],
+            "delete": [{"id": item_id} for item_id in body.get("delete", [])]
+        })
+
+    def create_term(self, items: List[Dict[str, Any]], body: Dict[str, Any]) -> Dict[str, Any]:
+        error = term_exists(items, body)
+        return {"id": 0, "error": error} if error else self.add_term(items, body)
+
+    def add_term(self, items: List[Dict[str, Any]], body: Dict[str, Any]) -> Dict[str, Any]:
+        name = str(body.get("name", ""))
+        term = {"id": self.new_id(), "name": name, "slug": body.get("slug") or re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-"), "count": 0}
+        items.append(term)
+        return term
+
+    def template(self, items: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return dict(items[0]) if items else {}
+
+    def list(self, request: Request, items: List[Dict[str, Any]]) -> JSONResponse:
+        page = max(int(request.query_params.get("page", 1)), 1)
+        per_page = min(max(int(request.query_params.get("per_page", 10)), 1), 100)
+        status = request.query_params.get("status")
+        if status and status != "any":
+            allowed = set(status.split(","))
+            items = [item for item in items if item.get("status") in allowed]
+
+        if request.query_params.get("order") == "desc":
+            items = items[::-1]
+
+        total = len(items)
+        headers = {
+            "X-WP-Total": str(total),
+            "X-WP-TotalPages": str(-(-total // per_page))
+        }
+        return JSONResponse(items[(page - 1) * per_page:page * per_page], headers=headers)
+
+    async def stats(self, request: Request) -> JSONResponse:
+        return JSONResponse({
+            "total": sum(self.requests.values()),
+            "by_route": dict(self.requests),
+            "injected_errors": self.injected_errors
+        })
+
+    async def reset(self, request: Request) -> JSONResponse:
+        self.requests.clear()
+        self.injected_errors = 0
+        return JSONResponse({"reset": True})
+
+    def app(self) -> Starlette:
+        methods = ["GET", "HEAD", "POST", "PUT", "DELETE"]
+        return Starlette(routes=[
+            Route("/__stats", self.stats, methods=["GET"]),
+            Route("/__reset", self.reset, methods=["POST"]),
+            Route("/wp-json/{namespace:path}/{resource}/batch", self.handle_batch, methods=["POST"]),
+            Route("/wp-json/{namespace:path}/{resource}/{item_id:int}", self.handle, methods=methods),
+            Route("/wp-json/{namespace:path}/{resource}", self.handle, methods=methods)
+        ])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local stand-in for the WooCommerce/WordPress REST API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--jitter-ms", type=float, default=5.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--tail-rate", type=float, default=0.0, help="Fraction of requests delayed by --tail-ms")
+    parser.add_argument("--tail-ms", type=float, default=0.0)
+    parser.add_argument("--products", type=int, default=500)
+    parser.add_argument("--orders", type=int, default=500)
+    parser.add_argument("--posts", type=int, default=200)
+    parser.add_argument("--terms", type=int, default=50, help="Product categories, post categories and tags each")
+    parser.add_argument("--variable-products", type=int, default=0, help="Leading products served as variable with 4 variations")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    import uvicorn
+
+    upstream = FakeUpstream(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        tail_rate=args.tail_rate,
+        tail_ms=args.tail_ms,
+        products=args.products,
+        orders=args.orders,
+        posts=args.posts,
+        terms=args.terms,
+        variable_products=args.variable_products,
+        seed=args.seed
+    )
+    uvicorn.run(upstream.app(), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
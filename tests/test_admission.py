@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.admission import AdmissionController
+from app.core.deadlines import deadline_scope
+
+
+def controller(max_in_flight: int = 1, max_queue: int = 10, max_queue_wait: float = 5.0, latency_target=None) -> AdmissionController:
+    return AdmissionController(True, max_in_flight, max_queue, max_queue_wait, latency_target)
+
+
+async def test_cheap_actions_are_admitted_before_expensive_ones(settle):
+    admission = controller()
+    order: list = []
+
+    async def run(action_id: str, tag: str) -> None:
+        async with admission.admit(action_id):
+            order.append(tag)
+
+    async with admission.admit("create_wc_product"):
+        tasks = []
+        for action_id, tag in (
+            ("create_wc_product", "e1"),
+            ("update_stock", "c1"),
+            ("sync_product", "e2"),
+            ("validate_product", "c2")
+        ):
+            tasks.append(asyncio.create_task(run(action_id, tag)))
+            await settle()
+        assert admission.stats()["queued"] == {"cheap": 2, "expensive": 2}
+    await asyncio.gather(*tasks)
+
+    assert order == ["c1", "c2", "e1", "e2"]
+    assert admission.in_flight == {"cheap": 0, "expensive": 0}
+
+
+async def test_full_queue_sheds_with_retry_after(settle):
+    admission = controller(max_queue=1)
+    async with admission.admit("sync_product"):
+        waiter = asyncio.create_task(admission.admit("sync_product").__aenter__())
+        await settle()
+        with pytest.raises(HTTPException) as raised:
+            async with admission.admit("sync_product"):
+                pass
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+
+    assert raised.value.status_code == 503
+    assert int(raised.value.headers["Retry-After"]) >= 1
+    assert admission.in_flight == {"cheap": 0, "expensive": 0}
+
+
+async def test_expensive_actions_are_shed_when_the_latency_target_would_be_missed():
+    admission = controller(latency_target=0.5)
+    admission.service_time["expensive"] = 1.0
+    async with admission.admit("sync_product"):
+        with pytest.raises(HTTPException) as raised:
+            async with admission.admit("sync_product"):
+                pass
+
+    assert raised.value.status_code == 503
+    assert raised.value.detail["details"].startswith("Expected queue wait")
+
+
+async def test_queue_wait_limit_returns_503_and_deadline_returns_504():
+    admission = controller(max_queue_wait=0.05)
+    async with admission.admit("sync_product"):
+        with pytest.raises(HTTPException) as queue_timeout:
+            async with admission.admit("sync_product"):
+                pass
+        with deadline_scope(0.01):
+            with pytest.raises(HTTPException) as deadline:
+                async with admission.admit("sync_product"):
+                    pass
+
+    assert queue_timeout.value.status_code == 503
+    assert deadline.value.status_code == 504
+    assert admission.stats()["queued"] == {"cheap": 0, "expensive": 0}
+    assert admission.in_flight == {"cheap": 0, "expensive": 0}
+
+
+async def test_granted_waiter_cancelled_before_resuming_releases_its_slot(settle):
+    admission = controller()
+
+    async def run() -> None:
+        async with admission.admit("sync_product"):
+            pass
+
+    holder = admission.admit("sync_product")
+    await holder.__aenter__()
+    waiter = asyncio.create_task(run())
+    await settle()
+
+    await holder.__aexit__(None, None, None)
+    assert admission.in_flight["expensive"] == 1
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+
+    assert admission.in_flight["expensive"] == 0
+    async with admission.admit("sync_product"):
+        assert admission.in_flight["expensive"] == 1
+    assert admission.in_flight == {"cheap": 0, "expensive": 0}
+
+
+async def test_disabled_controller_admits_everything():
+    admission = AdmissionController(False, 1, 0, 0.01, None)
+    async with admission.admit("sync_product"):
+        async with admission.admit("sync_product"):
+            assert admission.stats()["in_flight"] == {"cheap": 0, "expensive": 0}
@@ -0,0 +1,66 @@
+import pytest
+
+import app.services.analytics_service as analytics
+from app.services.analytics_service import SalesAnalyticsService
+
+ORDERS = {
+    "default": [
+        {"id": 1, "status": "completed", "currency": "EUR", "date_created": "2024-01-01T10:00:00",
+         "line_items": [{"product_id": 10, "quantity": 2, "total": "20.00"}]},
+        {"id": 2, "status": "completed", "currency": "USD", "date_created": "2024-01-02T10:00:00",
+         "line_items": [{"product_id": 10, "quantity": 1, "total": "15.00"}]}
+    ],
+    "eu": [
+        {"id": 1, "status": "processing", "currency": "EUR", "date_created": "2024-01-03T10:00:00",
+         "line_items": [{"product_id": 20, "quantity": 3, "total": "30.00"}]}
+    ]
+}
+
+
+class StoreOrders:
+    def __init__(self, store_id: str):
+        self.store_id = store_id
+
+    async def iter_orders(self, modified_after=None):
+        for order in ORDERS[self.store_id]:
+            yield order
+
+
+class Stores:
+    def for_store(self, store_id: str) -> StoreOrders:
+        return StoreOrders(store_id)
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(analytics, "woocommerce_service", Stores())
+    return SalesAnalyticsService()
+
+
+async def test_each_store_is_aggregated_from_its_own_orders(service):
+    default = await service.aggregate(["currency"])
+    eu = await service.dataset("eu").aggregate(["status"])
+
+    assert default["store_id"] == "default"
+    assert default["totals"]["orders"] == 2
+    assert eu["store_id"] == "eu"
+    assert eu["groups"] == [{
+        "status": "processing",
+        "revenue": 30.0,
+        "units": 3.0,
+        "line_items": 1,
+        "orders": 1,
+        "avg_order_revenue": 30.0,
+        "avg_line_revenue": 30.0
+    }]
+    assert set(service.datasets) == {"default", "eu"}
+
+
+async def test_totals_are_split_by_currency(service):
+    mixed = await service.aggregate(["period"])
+    single = await service.aggregate(["period"], before="2024-01-02")
+
+    assert mixed["totals"]["revenue"] is None
+    assert mixed["totals"]["revenue_by_currency"] == {"EUR": 20.0, "USD": 15.0}
+    assert single["totals"]["revenue"] == 20.0
+    assert single["totals"]["revenue_by_currency"] == {"EUR": 20.0}
@@ -0,0 +1,27 @@
+from typing import List
+
+import pytest
+
+from app.services.bulk_import_service import iter_lines
+
+
+async def lines(chunks: List[bytes], max_line_bytes: int) -> List[str]:
+    async def body():
+        for chunk in chunks:
+            yield chunk
+
+    return [line async for line in iter_lines(body(), max_line_bytes)]
+
+
+async def test_lines_are_split_across_chunks_without_bom_or_carriage_returns():
+    assert await lines([b"\xef\xbb\xbfsku,name\r\nA-1,Sh", b"irt\nA-2,Hat"], 64) == ["sku,name", "A-1,Shirt", "A-2,Hat"]
+
+
+@pytest.mark.parametrize("chunks", [
+    [b"short\n" + b"x" * 50 + b"\nend\n"],
+    [b"ok\n" + b"x" * 50],
+    [b"ok\n" + b"x" * 6, b"x" * 6 + b"\n"]
+])
+async def test_overlong_lines_are_rejected_wherever_the_newlines_fall(chunks):
+    with pytest.raises(ValueError, match="exceeds 10 bytes"):
+        await lines(chunks, 10)
@@ -0,0 +1,125 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.bulkheads import Bulkhead
+from app.core.deadlines import deadline_scope
+
+
+async def hold(bulkhead: Bulkhead, priority: str, granted: list, release: asyncio.Event) -> None:
+    async with bulkhead.slot(priority):
+        granted.append(priority)
+        await release.wait()
+
+
+async def test_interactive_waiters_are_granted_before_background(settle):
+    bulkhead = Bulkhead("test", 1, 1.0)
+    order: list = []
+
+    async def run(priority: str, tag: str) -> None:
+        async with bulkhead.slot(priority):
+            order.append(tag)
+            await asyncio.sleep(0)
+
+    async with bulkhead.slot("background"):
+        tasks = []
+        for priority, tag in (("background", "b1"), ("interactive", "i1"), ("background", "b2"), ("interactive", "i2")):
+            tasks.append(asyncio.create_task(run(priority, tag)))
+            await settle()
+        assert bulkhead.stats()["queued"] == {"interactive": 2, "background": 2}
+    await asyncio.gather(*tasks)
+
+    assert order == ["i1", "i2", "b1", "b2"]
+
+
+async def test_waiters_of_the_same_priority_are_granted_in_arrival_order(settle):
+    bulkhead = Bulkhead("test", 1, 1.0)
+    order: list = []
+
+    async def run(tag: str) -> None:
+        async with bulkhead.slot("interactive"):
+            order.append(tag)
+
+    async with bulkhead.slot("interactive"):
+        tasks = [asyncio.create_task(run(str(index))) for index in range(5)]
+        await settle()
+    await asyncio.gather(*tasks)
+
+    assert order == ["0", "1", "2", "3", "4"]
+
+
+async def test_background_calls_are_capped_and_leave_room_for_interactive(settle):
+    bulkhead = Bulkhead("test", 4, 0.5)
+    release = asyncio.Event()
+    granted: list = []
+    background = [asyncio.create_task(hold(bulkhead, "background", granted, release)) for _ in range(3)]
+    await settle()
+    assert bulkhead.in_use == {"interactive": 0, "background": 2}
+    assert bulkhead.stats()["queued"]["background"] == 1
+
+    interactive = [asyncio.create_task(hold(bulkhead, "interactive", granted, release)) for _ in range(2)]
+    await settle()
+    assert bulkhead.in_use == {"interactive": 2, "background": 2}
+
+    release.set()
+    await asyncio.gather(*background, *interactive)
+    assert bulkhead.in_use == {"interactive": 0, "background": 0}
+    assert bulkhead.stats()["queued"] == {"interactive": 0, "background": 0}
+
+
+async def test_cancelled_queued_waiter_does_not_take_a_slot(settle):
+    bulkhead = Bulkhead("test", 1, 1.0)
+    order: list = []
+
+    async def run(tag: str) -> None:
+        async with bulkhead.slot("interactive"):
+            order.append(tag)
+
+    async with bulkhead.slot("interactive"):
+        cancelled = asyncio.create_task(run("cancelled"))
+        survivor = asyncio.create_task(run("survivor"))
+        await settle()
+        cancelled.cancel()
+        await settle()
+    await survivor
+
+    assert cancelled.cancelled()
+    assert order == ["survivor"]
+    assert bulkhead.in_use["interactive"] == 0
+
+
+async def test_granted_waiter_cancelled_before_resuming_releases_its_slot(settle):
+    bulkhead = Bulkhead("test", 1, 1.0)
+
+    async def run() -> None:
+        async with bulkhead.slot("interactive"):
+            pass
+
+    holder = bulkhead.slot("interactive")
+    await holder.__aenter__()
+    waiter = asyncio.create_task(run())
+    await settle()
+
+    await holder.__aexit__(None, None, None)
+    assert bulkhead.in_use["interactive"] == 1
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+
+    assert bulkhead.in_use["interactive"] == 0
+    async with bulkhead.slot("interactive"):
+        assert bulkhead.in_use["interactive"] == 1
+    assert bulkhead.in_use["interactive"] == 0
+
+
+async def test_waiter_gives_up_when_the_deadline_passes():
+    bulkhead = Bulkhead("test", 1, 1.0)
+    async with bulkhead.slot("interactive"):
+        with deadline_scope(0.05):
+            with pytest.raises(HTTPException) as raised:
+                async with bulkhead.slot("interactive"):
+                    pass
+
+    assert raised.value.status_code == 504
+    assert bulkhead.in_use["interactive"] == 0
+    assert bulkhead.stats()["queued"]["interactive"] == 0
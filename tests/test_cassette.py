@@ -0,0 +1,69 @@
+import base64
+import gzip
+import json
+
+import httpx
+
+import app.core.auth as auth
+from app.core.auth import JwtAuth
+from app.core.cassette import Cassette, RecordingTransport, ReplayTransport
+
+TOKEN_URL = "https://shop.test/wp-json/jwt-auth/v1/token"
+POSTS_URL = "https://shop.test/wp-json/wp/v2/posts"
+PAYLOAD = base64.urlsafe_b64encode(json.dumps({"exp": 4102444800}).encode()).decode().rstrip("=")
+TOKEN = f"eyJhbGciOiJIUzI1NiJ9.{PAYLOAD}.c2lnbmF0dXJl"
+
+
+class StreamingUpstream(httpx.AsyncBaseTransport):
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        status, headers, content = 200, {"Content-Type": "application/json"}, b'[{"id": 1}]'
+        if request.url == TOKEN_URL:
+            body = json.dumps({"token": TOKEN, "user_email": "editor@shop.test"}).encode()
+            headers, content = {**headers, "Content-Encoding": "gzip"}, gzip.compress(body)
+        elif request.headers.get("Authorization") != f"Bearer {TOKEN}":
+            status, content = 401, b'{"code": "rest_forbidden"}'
+        return httpx.Response(status, headers=headers, stream=httpx.ByteStream(content))
+
+
+def jwt_auth() -> JwtAuth:
+    return JwtAuth("wordpress", TOKEN_URL, "editor", "hunter2-secret", 60.0, 3600.0)
+
+
+async def test_recorded_jwt_session_keeps_the_token_and_credentials_out_of_the_cassette(tmp_path, monkeypatch):
+    cassette = Cassette(str(tmp_path / "upstream.ndjson.gz"))
+    recorder = RecordingTransport(cassette)
+    recorder.transport = StreamingUpstream()
+    monkeypatch.setattr(auth, "upstream_transport", lambda: recorder)
+
+    async with httpx.AsyncClient(transport=recorder, auth=jwt_auth()) as client:
+        response = await client.get(POSTS_URL)
+    assert response.json() == [{"id": 1}]
+
+    with gzip.open(cassette.path, "rt", encoding="utf-8") as f:
+        recorded = f.read()
+    entries = [json.loads(line) for line in recorded.splitlines()]
+    token_entry = next(entry for entry in entries if entry["url"] == TOKEN_URL)
+    decoded = [base64.b64decode(entry["body_b64"]).decode() for entry in entries]
+
+    assert TOKEN not in recorded and all(TOKEN not in body for body in decoded)
+    assert PAYLOAD not in recorded and all(PAYLOAD not in body for body in decoded)
+    assert token_entry["body_sha1"] is None
+    assert json.loads(base64.b64decode(token_entry["body_b64"])) == {"token": "REDACTED", "user_email": "editor@shop.test"}
+    assert all(key.lower() != "content-encoding" for key, _ in token_entry["headers"])
+
+
+async def test_redacted_jwt_session_replays_without_network(tmp_path, monkeypatch):
+    cassette = Cassette(str(tmp_path / "upstream.ndjson.gz"))
+    recorder = RecordingTransport(cassette)
+    recorder.transport = StreamingUpstream()
+    monkeypatch.setattr(auth, "upstream_transport", lambda: recorder)
+    async with httpx.AsyncClient(transport=recorder, auth=jwt_auth()) as client:
+        await client.get(POSTS_URL)
+
+    replay = ReplayTransport(Cassette(cassette.path), 0)
+    monkeypatch.setattr(auth, "upstream_transport", lambda: replay)
+    async with httpx.AsyncClient(transport=replay, auth=jwt_auth()) as client:
+        response = await client.get(POSTS_URL)
+
+    assert response.status_code == 200
+    assert response.json() == [{"id": 1}]
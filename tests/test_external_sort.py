@@ -0,0 +1,73 @@
+import random
+from typing import Any, Dict, List
+
+from app.core.external_sort import ExternalSorter
+from app.core.jobs import Job
+from app.services.replication_service import merge_join, unique_skus
+
+
+async def sorted_items(items: List[Dict[str, Any]], run_size: int = 3) -> List[Dict[str, Any]]:
+    with ExternalSorter(lambda item: item["sku"], run_size=run_size, directory=None) as sorter:
+        for item in items:
+            await sorter.add(item)
+        return [item async for item in sorter.sorted()]
+
+
+async def stream(items: List[Dict[str, Any]]):
+    for item in items:
+        yield item
+
+
+async def joined_skus(source, target) -> list:
+    return [
+        (source_item and source_item["sku"], target_item and target_item["sku"])
+        async for source_item, target_item in merge_join(source, target)
+    ]
+
+
+async def test_external_sorter_merges_spilled_runs_with_the_buffer():
+    items = [{"sku": f"SKU-{index:03d}", "id": index} for index in range(25)]
+
+    with ExternalSorter(lambda item: item["sku"], run_size=4, directory=None) as sorter:
+        for item in random.Random(7).sample(items, len(items)):
+            await sorter.add(item)
+        assert sorter.runs == 6
+        assert [item async for item in sorter.sorted()] == items
+    assert sorter.runs == 0
+
+
+async def test_external_sorter_without_spilling_and_empty_input():
+    assert await sorted_items([{"sku": "B"}, {"sku": "A"}], run_size=10) == [{"sku": "A"}, {"sku": "B"}]
+    assert await sorted_items([]) == []
+
+
+async def test_merge_join_pairs_matching_skus_and_reports_one_sided_items():
+    source = [{"sku": "A"}, {"sku": "C"}, {"sku": "D"}]
+    target = [{"sku": "B"}, {"sku": "C"}, {"sku": "E"}]
+
+    assert await joined_skus(stream(source), stream(target)) == [
+        ("A", None), (None, "B"), ("C", "C"), ("D", None), (None, "E")
+    ]
+
+
+async def test_merge_join_with_an_empty_side():
+    items = [{"sku": "A"}, {"sku": "B"}]
+
+    assert [pair async for pair in merge_join(stream(items), stream([]))] == [(item, None) for item in items]
+    assert [pair async for pair in merge_join(stream([]), stream(items))] == [(None, item) for item in items]
+    assert [pair async for pair in merge_join(stream([]), stream([]))] == []
+
+
+async def test_external_sort_feeds_merge_join_and_duplicates_are_dropped():
+    source = [{"sku": sku, "id": index} for index, sku in enumerate(["D", "A", "C", "A", "B"])]
+    target = [{"sku": sku, "id": index} for index, sku in enumerate(["C", "E", "A"])]
+    job = Job("replication")
+
+    pairs = await joined_skus(
+        unique_skus(stream(await sorted_items(source, run_size=2)), job, "source"),
+        unique_skus(stream(await sorted_items(target, run_size=2)), job, "target")
+    )
+
+    assert pairs == [("A", "A"), ("B", None), ("C", "C"), ("D", None), (None, "E")]
+    assert job.progress["source_duplicate_skus"] == 1
+    assert job.errors == [{"store": "source", "sku": "A", "id": 3, "stage": "duplicate_sku"}]
@@ -0,0 +1,56 @@
+import asyncio
+
+import httpx
+
+from app.core.hedging import Hedger
+
+KEY = ("woocommerce", "products")
+
+
+def hedger() -> Hedger:
+    hedger = Hedger(True, 0.5, 0.01, 1.0, 1, 1.0, 5.0, 10)
+    hedger.tracker.record(KEY, 0.01)
+    return hedger
+
+
+def attempts(*plan):
+    async def attempt(index: int) -> httpx.Response:
+        delay, status = plan[index]
+        await asyncio.sleep(delay)
+        return httpx.Response(status)
+    return attempt
+
+
+async def test_retryable_hedge_response_does_not_beat_a_healthy_primary():
+    hedging = hedger()
+
+    response = await hedging.run(*KEY, attempts((0.1, 200), (0.0, 503)))
+
+    assert response.status_code == 200
+    assert len(hedging.tracker) == 2
+
+
+async def test_rate_limited_primary_loses_to_the_hedge():
+    hedging = hedger()
+
+    response = await hedging.run(*KEY, attempts((0.05, 429), (0.1, 200)))
+
+    assert response.status_code == 200
+
+
+async def test_retryable_response_is_returned_when_no_attempt_succeeds():
+    hedging = hedger()
+
+    response = await hedging.run(*KEY, attempts((0.05, 502), (0.0, 503)))
+
+    assert response.status_code == 503
+    assert len(hedging.tracker) == 1
+
+
+async def test_only_successful_responses_feed_the_latency_tracker():
+    hedging = Hedger(True, 0.5, 0.01, 1.0, 1, 1.0, 5.0, 10)
+
+    await hedging.run(*KEY, attempts((0.0, 500)))
+    assert len(hedging.tracker) == 0
+    await hedging.run(*KEY, attempts((0.0, 200)))
+    assert len(hedging.tracker) == 1
@@ -0,0 +1,79 @@
+import pytest
+from fastapi import HTTPException
+
+import app.services.stock_buffer_service as stock_buffer_service
+from app.models.schemas import StockUpdate
+from app.services.stock_buffer_service import StockUpdateBuffer
+
+
+class Upstream:
+    def __init__(self):
+        self.down = True
+        self.batches = []
+
+    def for_store(self, store_id: str) -> "Upstream":
+        return self
+
+    async def batch_update_products(self, updates):
+        if self.down:
+            raise HTTPException(status_code=502, detail={"error": "Bad gateway"})
+        self.batches.append(updates)
+        return {"update": [{"id": update["id"]} for update in updates]}
+
+
+def updates(*product_ids: int, quantity: int = 1):
+    return [StockUpdate(product_id=product_id, stock_quantity=quantity) for product_id in product_ids]
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    upstream = Upstream()
+    monkeypatch.setattr(stock_buffer_service, "woocommerce_service", upstream)
+    return upstream
+
+
+@pytest.fixture
+def buffer():
+    buffer = StockUpdateBuffer()
+    buffer.max_pending = 3
+    return buffer
+
+
+def test_new_products_beyond_the_limit_are_rejected_but_pending_ones_still_coalesce(buffer):
+    buffer.put_many(updates(1, 2, 3))
+
+    with pytest.raises(HTTPException) as rejected:
+        buffer.put_many(updates(3, 4))
+    result = buffer.put_many(updates(1, 2, quantity=5))
+
+    assert rejected.value.status_code == 503
+    assert rejected.value.headers["Retry-After"] == "5"
+    assert result == {"accepted": 2, "coalesced": 2, "pending": 3}
+    assert buffer.stats()["rejected_items"] == 2
+
+
+async def test_failed_flush_only_requeues_while_there_is_room(buffer, upstream):
+    buffer.put_many(updates(1, 2, 3))
+    buffer.batch_size = 1
+
+    async def refill(updates_):
+        buffer.put_many(updates(4, 5))
+        raise HTTPException(status_code=502, detail={"error": "Bad gateway"})
+    upstream.batch_update_products = refill
+
+    result = await buffer.flush()
+
+    assert result == {"flushed": 0, "failed": 0, "requeued": 1, "dropped": 2}
+    assert buffer.pending == 3
+    assert buffer.stats()["dropped_items"] == 2
+
+
+async def test_requeued_updates_keep_newer_values(buffer, upstream):
+    buffer.put_many(updates(1, 2, quantity=1))
+
+    assert (await buffer.flush())["requeued"] == 2
+    buffer.put_many(updates(1, quantity=9))
+    upstream.down = False
+    await buffer.flush()
+
+    assert upstream.batches == [[{"id": 1, "stock_quantity": 9}, {"id": 2, "stock_quantity": 1}]]
@@ -0,0 +1,46 @@
+from app.models.schemas import VariationSpec
+from app.services.i18n_template_service import i18n_template_service
+from app.services.variation_service import build_variations, client_price
+
+ATTRIBUTES = [
+    {"name": "Color", "variation": True, "options": ["Red", "Blue"]},
+    {"name": "Size", "variation": True, "options": ["S", "M"]}
+]
+
+
+def templated_product(data: dict) -> dict:
+    return i18n_template_service.transform_to_wc_product_i18n(data, "en")
+
+
+def test_variations_without_any_price_stay_unpriced():
+    data = {"name": "T-Shirt", "type": "variable", "attributes": ATTRIBUTES}
+    product = templated_product(data)
+    assert product["regular_price"] == "0"
+
+    variations = build_variations(product, VariationSpec(sku="TEE"), 100, client_price(data))
+
+    assert len(variations) == 4
+    assert all("regular_price" not in variation for variation in variations)
+
+
+def test_variations_use_the_client_price_then_spec_and_override_prices():
+    data = {"name": "T-Shirt", "type": "variable", "price": 20, "attributes": ATTRIBUTES}
+    product = templated_product(data)
+
+    assert {variation["regular_price"] for variation in build_variations(product, VariationSpec(), 100, client_price(data))} == {"20"}
+
+    spec = VariationSpec(
+        regular_price="22.00",
+        overrides=[{"attributes": {"Size": "M"}, "regular_price": "24.00"}]
+    )
+    prices = {
+        tuple(attribute["option"] for attribute in variation["attributes"]): variation["regular_price"]
+        for variation in build_variations(product, spec, 100, client_price(data))
+    }
+    assert prices == {("Red", "S"): "22.00", ("Red", "M"): "24.00", ("Blue", "S"): "22.00", ("Blue", "M"): "24.00"}
+
+
+def test_client_price_ignores_empty_values():
+    assert client_price({"price": "", "regular_price": "9.50"}) == "9.50"
+    assert client_price({"price": None}) is None
+    assert client_price({}) is None